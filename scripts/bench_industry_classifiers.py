@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Compare industry classifier tiers on a corpus of markdown briefs.
+
+Reports per-tier latency (mean/p50/p95), coverage (share of briefs given an
+industry) and agreement with the keyword tier and, when configured, the LLM
+tier. The LLM tier is called directly, without the cache or latency budget.
+A corpus directory may carry a ``labels.json`` of ``{file name: industry}``
+(``""`` for briefs with no clear industry); accuracy against it is then
+reported too. The default corpus is ``scripts/industry_briefs``.
+
+    python scripts/bench_industry_classifiers.py [--corpus DIR_OR_FILE ...]
+        [--llm none|anthropic|http] [--url URL] [--limit N]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from skill_autopilot.brief_analysis import analyze_brief  # noqa: E402
+from skill_autopilot.industry_classifier import build_industry_classifier  # noqa: E402
+from skill_autopilot.industry_model import OfflineIndustryClassifier  # noqa: E402
+from skill_autopilot.pods import INDUSTRY_KERNEL_MAP, _detect_industry_keywords  # noqa: E402
+
+
+def _corpus(paths: List[str], limit: int) -> Tuple[List[str], List[str | None]]:
+    """Brief texts and their expected industry (``None`` when unlabelled)."""
+    files: List[Path] = []
+    labelled: Dict[Path, str] = {}
+    for raw in paths:
+        path = Path(raw).expanduser()
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.md")))
+            labels_file = path / "labels.json"
+            if labels_file.is_file():
+                for name, industry in json.loads(labels_file.read_text(encoding="utf-8")).items():
+                    labelled[(path / name).resolve()] = industry
+        else:
+            files.append(path)
+    texts: List[str] = []
+    expected: List[str | None] = []
+    for file in files:
+        text = file.read_text(encoding="utf-8", errors="ignore").strip() if file.is_file() else ""
+        if text:
+            texts.append(text)
+            expected.append(labelled.get(file.resolve()))
+    if limit:
+        return texts[:limit], expected[:limit]
+    return texts, expected
+
+
+def _run(classify: Callable[[str], str], texts: List[str]) -> tuple[List[str], List[float]]:
+    labels: List[str] = []
+    latencies: List[float] = []
+    for text in texts:
+        start = time.perf_counter()
+        labels.append(classify(text))
+        latencies.append((time.perf_counter() - start) * 1000.0)
+    return labels, latencies
+
+
+def _agreement(left: List[str], right: List[str | None]) -> float:
+    pairs = [(a, b) for a, b in zip(left, right) if b is not None]
+    return sum(1 for a, b in pairs if a == b) / (len(pairs) or 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", nargs="*", default=[str(ROOT / "scripts" / "industry_briefs")])
+    parser.add_argument("--llm", choices=["none", "anthropic", "http"], default="none")
+    parser.add_argument("--url", default="")
+    parser.add_argument("--limit", type=int, default=0)
+    args = parser.parse_args()
+
+    texts, expected = _corpus(args.corpus, args.limit)
+    has_labels = any(label is not None for label in expected)
+    if not texts:
+        raise SystemExit("No briefs found in corpus")
+    industries = list(INDUSTRY_KERNEL_MAP)
+    offline = OfflineIndustryClassifier()
+
+    # Keyword and offline tiers are timed on fresh text, without the shared analysis cache.
+    tiers: Dict[str, Callable[[str], str]] = {
+        "keyword": lambda text: _detect_industry_keywords(analyze_brief.__wrapped__(text)),
+        "offline": lambda text: offline.model.predict(analyze_brief.__wrapped__(text)),
+        # What detect_industry returns with industry_classifier = "offline": keywords decide on abstain.
+        "off+kw": lambda text: offline.model.predict(analyze_brief.__wrapped__(text))
+        or _detect_industry_keywords(analyze_brief.__wrapped__(text)),
+    }
+    llm = build_industry_classifier(args.llm, url=args.url, timeout=30.0) if args.llm != "none" else None
+    if args.llm != "none" and llm is None:
+        raise SystemExit(f"LLM tier '{args.llm}' is not available (missing key, package or --url)")
+    if llm is not None:
+        tiers["llm"] = lambda text: llm.classify(text, industries)
+
+    results = {name: _run(classify, texts) for name, classify in tiers.items()}
+    print(f"{len(texts)} briefs")
+    header = f"{'tier':<8} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'coverage':>9} {'=keyword':>9}"
+    if llm is not None:
+        header += f" {'=llm':>9}"
+    if has_labels:
+        header += f" {'=label':>9}"
+    print(header)
+    for name, (labels, latencies) in results.items():
+        ordered = sorted(latencies)
+        row = (
+            f"{name:<8} {statistics.fmean(latencies):>9.3f} {ordered[len(ordered) // 2]:>9.3f} "
+            f"{ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]:>9.3f} "
+            f"{sum(1 for label in labels if label) / len(labels):>9.1%} "
+            f"{_agreement(labels, results['keyword'][0]):>9.1%}"
+        )
+        if llm is not None:
+            row += f" {_agreement(labels, results['llm'][0]):>9.1%}"
+        if has_labels:
+            row += f" {_agreement(labels, expected):>9.1%}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
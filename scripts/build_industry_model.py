@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Regenerate skill_autopilot/data/industry_model.json from the pod signal tables."""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from skill_autopilot.industry_model import MODEL_PATH, train_industry_model  # noqa: E402
+
+
+def main() -> None:
+    payload = train_industry_model()
+    MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
+    MODEL_PATH.write_text(json.dumps(payload, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    print(f"Wrote {MODEL_PATH} ({len(payload['weights'])} features x {len(payload['industries'])} industries)")
+
+
+if __name__ == "__main__":
+    main()
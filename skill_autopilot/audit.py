@@ -0,0 +1,256 @@
+"""Write-behind pipeline for audit events.
+
+``Database.add_audit_event`` hands rows to an ``AuditWriter`` instead of
+inserting them on the caller's path. Rows wait in a bounded queue and a single
+background thread inserts them with ``executemany`` once ``batch_size`` rows are
+queued or the oldest has waited ``flush_interval_seconds``.
+
+When the queue is full the caller blocks for up to ``enqueue_timeout_seconds``
+(backpressure) and the event is then dropped; both are counted in ``metrics()``.
+``flush()`` waits until everything queued so far is written. Readers of
+``audit_events`` and interpreter exit flush first.
+
+``compact_audit_events`` applies an ``AuditRetentionPolicy``: rows older than
+their type's retention are appended to gzip NDJSON segments under the archive
+directory, added to the ``audit_rollups`` daily counts and deleted, one batch at
+a time. A segment is written before its batch is deleted, so a crash between
+the two can repeat rows across segments but never loses them.
+"""
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import json
+import os
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Condition, Thread
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, List, Sequence, Tuple
+
+from .utils import utc_now
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .db import Database
+
+# (project_id, route_id, event_type, payload_json, created_at)
+AuditRow = Tuple[str | None, str | None, str, str, str]
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+DEFAULT_ENQUEUE_TIMEOUT_SECONDS = 0.05
+DEFAULT_RETENTION_DAYS = 90
+DEFAULT_COMPACTION_BATCH_SIZE = 5000
+
+_writers: "weakref.WeakSet[AuditWriter]" = weakref.WeakSet()
+
+
+class AuditWriter:
+    def __init__(
+        self,
+        write_rows: Callable[[Sequence[AuditRow]], None],
+        max_queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        enqueue_timeout_seconds: float = DEFAULT_ENQUEUE_TIMEOUT_SECONDS,
+    ):
+        self._write_rows = write_rows
+        self.max_queue_size = max(1, max_queue_size)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_seconds = max(0.0, flush_interval_seconds)
+        self.enqueue_timeout_seconds = max(0.0, enqueue_timeout_seconds)
+        self._queue: Deque[AuditRow] = deque()
+        self._cond = Condition()
+        self._thread: Thread | None = None
+        self._stopped = False
+        self._flush_requested = False
+        self._oldest_at = 0.0
+        self._enqueued = 0
+        self._done = 0
+        self._stats: Dict[str, int] = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "failed": 0,
+            "backpressure_waits": 0,
+            "batches": 0,
+            "max_queue_depth": 0,
+        }
+        _writers.add(self)
+
+    def submit(self, rows: Iterable[AuditRow]) -> int:
+        """Queue ``rows``; returns how many were accepted (the rest were dropped)."""
+        accepted = 0
+        with self._cond:
+            for row in rows:
+                if self._stopped:
+                    # Late events after close() are written inline rather than lost.
+                    self._cond.release()
+                    try:
+                        self._write_rows([row])
+                    finally:
+                        self._cond.acquire()
+                    accepted += 1
+                    continue
+                if len(self._queue) >= self.max_queue_size and not self._wait_for_room():
+                    self._stats["dropped"] += 1
+                    continue
+                if not self._queue:
+                    self._oldest_at = time.monotonic()
+                self._queue.append(row)
+                self._enqueued += 1
+                self._stats["enqueued"] += 1
+                self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], len(self._queue))
+                accepted += 1
+            if self._queue:
+                self._ensure_thread()
+                if len(self._queue) >= self.batch_size:
+                    self._cond.notify_all()
+        return accepted
+
+    def _wait_for_room(self) -> bool:
+        # Caller holds _cond. Wakes the writer and waits briefly for it to drain a batch.
+        self._stats["backpressure_waits"] += 1
+        self._flush_requested = True
+        self._cond.notify_all()
+        deadline = time.monotonic() + self.enqueue_timeout_seconds
+        while len(self._queue) >= self.max_queue_size and not self._stopped:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._cond.wait(remaining)
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every row queued before this call is written; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            target = self._enqueued
+            if self._done >= target:
+                return True
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._done < target:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Flush, then stop the writer thread; later rows are written inline."""
+        self.flush(timeout=timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def metrics(self) -> Dict[str, int]:
+        with self._cond:
+            return dict(self._stats, queue_depth=len(self._queue))
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        with self._cond:
+            while True:
+                if not self._queue:
+                    self._flush_requested = False
+                    if self._stopped:
+                        return
+                    self._cond.wait()
+                    continue
+                if len(self._queue) < self.batch_size and not self._flush_requested and not self._stopped:
+                    remaining = self._oldest_at + self.flush_interval_seconds - time.monotonic()
+                    if remaining > 0:
+                        self._cond.wait(remaining)
+                        continue
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                self._oldest_at = time.monotonic()
+                self._cond.release()
+                try:
+                    self._write_rows(batch)
+                    failed = False
+                except Exception:
+                    failed = True
+                finally:
+                    self._cond.acquire()
+                self._stats["failed" if failed else "written"] += len(batch)
+                self._stats["batches"] += 1
+                self._done += len(batch)
+                self._cond.notify_all()
+
+
+@atexit.register
+def _flush_writers_at_exit() -> None:
+    for writer in list(_writers):
+        writer.close(timeout=2.0)
+
+
+@dataclass(frozen=True)
+class AuditRetentionPolicy:
+    """Days to keep audit rows; ``overrides`` keys are event types or ``prefix*`` patterns.
+
+    Zero days keeps rows forever.
+    """
+
+    default_days: int = DEFAULT_RETENTION_DAYS
+    overrides: Dict[str, int] = field(default_factory=dict)
+
+    def cutoffs(self, now: datetime) -> Tuple[str, Dict[str, str]]:
+        def cutoff(days: int) -> str:
+            return (now - timedelta(days=days)).isoformat() if days > 0 else ""
+
+        return cutoff(self.default_days), {pattern: cutoff(days) for pattern, days in self.overrides.items()}
+
+
+def compact_audit_events(
+    db: "Database",
+    policy: AuditRetentionPolicy,
+    archive_dir: str,
+    now: datetime | None = None,
+    batch_size: int = DEFAULT_COMPACTION_BATCH_SIZE,
+) -> Dict[str, Any]:
+    """Archive, roll up and delete expired audit rows; returns counts and segment paths."""
+    db.flush_audit()
+    default_cutoff, cutoffs = policy.cutoffs(now or utc_now())
+    archive = Path(archive_dir).expanduser()
+    archived = 0
+    segments: List[str] = []
+    after_event_id = 0
+    while True:
+        rows = db.list_expired_audit_events(default_cutoff, cutoffs, after_event_id=after_event_id, limit=batch_size)
+        if not rows:
+            break
+        segments.append(_write_segment(archive, rows))
+        db.rollup_audit_events(rows)
+        archived += len(rows)
+        after_event_id = int(rows[-1]["event_id"])
+        if len(rows) < batch_size:
+            break
+    if archived:
+        db.checkpoint()
+    return {"archived": archived, "segments": segments, "default_cutoff": default_cutoff}
+
+
+def _write_segment(archive: Path, rows: Sequence[Dict[str, Any]]) -> str:
+    archive.mkdir(parents=True, exist_ok=True)
+    path = archive / f"audit-{int(rows[0]['event_id']):012d}-{int(rows[-1]['event_id']):012d}.ndjson.gz"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8") as handle:
+        for row in rows:
+            record = dict(row)
+            record["payload"] = json.loads(record.pop("payload_json"))
+            handle.write(json.dumps(record, sort_keys=True) + "\n")
+    os.replace(tmp, path)
+    return str(path)
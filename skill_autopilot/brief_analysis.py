@@ -0,0 +1,107 @@
+"""One-pass analysis of a brief, shared by every consumer of its text.
+
+``parse_brief`` and everything downstream of it (industry detection, pod and
+kernel selection, routing, material-change checks) used to lowercase, split
+and regex-scan ``raw_text`` independently. ``analyze_brief`` does that work
+once and caches the result per text, so consumers read the lowercase text,
+line index, section spans and token sets from the same object.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Dict, FrozenSet, Tuple, Union
+
+_SECTION_HEADINGS: Dict[str, Tuple[str, ...]] = {
+    "goals": ("goals?", "objectives?", "outcomes?"),
+    "constraints": ("constraints?", "limits?", "boundaries?"),
+    "deliverables": ("deliverables?", "outputs?", "artifacts?"),
+}
+
+# One alternation per section, tried in the same order as the section table.
+_SECTION_RE = re.compile(
+    r"^#+\s*(?:"
+    + "|".join(f"(?P<{name}>{'|'.join(words)})" for name, words in _SECTION_HEADINGS.items())
+    + ")",
+    flags=re.IGNORECASE,
+)
+
+_WORD_RE = re.compile(r"[a-zA-Z0-9_]+")
+
+
+def route_tokens(text: str) -> FrozenSet[str]:
+    """Tokens the router matches skills on: split on whitespace, ``_``, ``-`` and ``.``."""
+    return frozenset(
+        token.lower() for token in text.replace("_", " ").replace("-", " ").replace(".", " ").split() if token
+    )
+
+
+@dataclass(frozen=True)
+class BriefAnalysis:
+    text: str
+    lowered: str
+    lines: Tuple[str, ...]
+    stripped_lines: Tuple[str, ...]
+    # Non-empty stripped lines under each recognised heading, in file order.
+    sections: Dict[str, Tuple[str, ...]]
+
+    @cached_property
+    def lowered_lines(self) -> Tuple[str, ...]:
+        return tuple(line.lower() for line in self.stripped_lines)
+
+    @cached_property
+    def route_tokens(self) -> FrozenSet[str]:
+        return route_tokens(self.text)
+
+    @cached_property
+    def signal_hits(self) -> FrozenSet[str]:
+        """Every industry/pod/kernel/project-type/risk term present in the text."""
+        from .signals import signal_hits
+
+        return signal_hits(self.lowered)
+
+    @cached_property
+    def word_list(self) -> Tuple[str, ...]:
+        """``[a-z0-9_]+`` words of the lowercase text, in order."""
+        return tuple(_WORD_RE.findall(self.lowered))
+
+    @cached_property
+    def words(self) -> Counter:
+        """Multiset of ``[a-z0-9_]+`` words in the lowercase text."""
+        return Counter(self.word_list)
+
+    @cached_property
+    def word_set(self) -> FrozenSet[str]:
+        return frozenset(self.words)
+
+
+@lru_cache(maxsize=128)
+def analyze_brief(text: str) -> BriefAnalysis:
+    lines = tuple(text.splitlines())
+    stripped_lines = tuple(line.strip() for line in lines)
+    sections: Dict[str, list] = {name: [] for name in _SECTION_HEADINGS}
+    current: str | None = None
+    for stripped in stripped_lines:
+        match = _SECTION_RE.match(stripped)
+        if match:
+            current = match.lastgroup
+            continue
+        if current and stripped:
+            sections[current].append(stripped)
+    return BriefAnalysis(
+        text=text,
+        lowered=text.lower(),
+        lines=lines,
+        stripped_lines=stripped_lines,
+        sections={name: tuple(items) for name, items in sections.items()},
+    )
+
+
+def as_analysis(value: Union[str, BriefAnalysis]) -> BriefAnalysis:
+    """Accept either raw brief text or an existing analysis."""
+    if isinstance(value, BriefAnalysis):
+        return value
+    return analyze_brief(value)
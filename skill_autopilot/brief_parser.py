@@ -5,17 +5,11 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 from urllib.parse import unquote, urlparse
 
+from .brief_analysis import BriefAnalysis, analyze_brief
 from .models import BriefIntent
 from .utils import canonical_json, sha256_hex
 
 
-_SECTION_PATTERNS = {
-    "goals": [r"^#+\s*goals?", r"^#+\s*objectives?", r"^#+\s*outcomes?"],
-    "constraints": [r"^#+\s*constraints?", r"^#+\s*limits?", r"^#+\s*boundaries?"],
-    "deliverables": [r"^#+\s*deliverables?", r"^#+\s*outputs?", r"^#+\s*artifacts?"],
-}
-
-
 class BriefValidationError(ValueError):
     pass
 
@@ -62,7 +56,7 @@ def _extract_candidates(lines: List[str], max_items: int = 8) -> List[str]:
     return items
 
 
-def _extract_semantic_candidates(text: str, section: str, max_items: int = 8) -> List[str]:
+def _extract_semantic_candidates(analysis: BriefAnalysis, section: str, max_items: int = 8) -> List[str]:
     patterns = {
         "constraints": [
             r"\bmust\b",
@@ -98,8 +92,7 @@ def _extract_semantic_candidates(text: str, section: str, max_items: int = 8) ->
 
     out: List[str] = []
     seen: set[str] = set()
-    for raw in text.splitlines():
-        line = raw.strip()
+    for line, lowered in zip(analysis.stripped_lines, analysis.lowered_lines):
         if not line or line.startswith("#"):
             continue
         if re.match(r"^\d+\.\s+\[.+\]\(.+\)\s*$", line):
@@ -108,7 +101,6 @@ def _extract_semantic_candidates(text: str, section: str, max_items: int = 8) ->
             continue
         if len(line) < 12:
             continue
-        lowered = line.lower()
         if any(re.search(pattern, lowered) for pattern in clues):
             normalized = re.sub(r"\s+", " ", line).strip(" -\t")
             if normalized and normalized not in seen:
@@ -119,81 +111,63 @@ def _extract_semantic_candidates(text: str, section: str, max_items: int = 8) ->
     return out
 
 
-def _collect_sections(text: str) -> Dict[str, List[str]]:
-    lines = text.splitlines()
-    sections = {"goals": [], "constraints": [], "deliverables": []}
-    current: str | None = None
+def _collect_sections(analysis: BriefAnalysis) -> Dict[str, List[str]]:
+    return {name: _extract_candidates(list(lines)) for name, lines in analysis.sections.items()}
 
-    for line in lines:
-        stripped = line.strip()
-        matched_section = None
-        for name, patterns in _SECTION_PATTERNS.items():
-            if any(re.search(pattern, stripped, flags=re.IGNORECASE) for pattern in patterns):
-                matched_section = name
-                break
-        if matched_section:
-            current = matched_section
-            continue
 
-        if current and stripped:
-            sections[current].append(stripped)
+_RISK_LOW_TERMS = ["prototype", "demo", "internal only"]
+_RISK_HIGH_TERMS = ["regulated", "safety", "compliance", "financial controls", "medical"]
+_EVIDENCE_STRICT_TERMS = ["audit", "traceability", "evidence", "change control", "approval"]
+
+_TYPE_SIGNALS: List[tuple[str, list[str]]] = [
+    ("new_build", ["greenfield", "new product", "new service", "build from scratch", "new platform"]),
+    ("migration", ["migration", "migrate", "replatform", "lift and shift"]),
+    ("integration", ["integration", "integrate", "connector", "api integration"]),
+    ("refactor", ["refactor", "modernize", "re-architect", "tech debt"]),
+    ("automation", ["automate", "automation", "workflow", "orchestrat"]),
+    ("analysis", ["analysis", "research", "assessment", "evaluation", "audit"]),
+]
 
-    return {k: _extract_candidates(v) for k, v in sections.items()}
+_POD_HINT_SIGNALS: List[tuple[str, list[str]]] = [
+    ("commercial", ["go-to-market", "pricing strategy", "sales enablement"]),
+    ("finance_governance", ["budget", "financial governance", "cost control", "sox compliance"]),
+    ("legal_risk", ["legal review", "regulatory", "compliance requirement", "gdpr", "hipaa"]),
+    ("people_talent", ["hiring plan", "onboarding", "team composition", "skill gap"]),
+    ("ops_supply", ["procurement", "supply chain", "vendor management"]),
+    ("data_insight", ["data pipeline", "bi report", "analytics dashboard"]),
+]
 
 
-def _infer_risk(text: str) -> str:
-    low_terms = ["prototype", "demo", "internal only"]
-    high_terms = ["regulated", "safety", "compliance", "financial controls", "medical"]
-    lowered = text.lower()
+def _infer_risk(analysis: BriefAnalysis) -> str:
+    hits = analysis.signal_hits
 
-    if any(term in lowered for term in high_terms):
+    if any(term in hits for term in _RISK_HIGH_TERMS):
         return "high"
-    if any(term in lowered for term in low_terms):
+    if any(term in hits for term in _RISK_LOW_TERMS):
         return "low"
     return "medium"
 
 
-def _infer_evidence(text: str) -> str:
-    strict_terms = ["audit", "traceability", "evidence", "change control", "approval"]
-    lowered = text.lower()
-    if sum(term in lowered for term in strict_terms) >= 2:
+def _infer_evidence(analysis: BriefAnalysis) -> str:
+    hits = analysis.signal_hits
+    if sum(term in hits for term in _EVIDENCE_STRICT_TERMS) >= 2:
         return "strict"
     return "standard"
 
 
-def _infer_project_type(text: str) -> str:
+def _infer_project_type(analysis: BriefAnalysis) -> str:
     """Detect the shape of work from the brief text."""
-    lowered = text.lower()
-    _TYPE_SIGNALS: List[tuple[str, list[str]]] = [
-        ("new_build", ["greenfield", "new product", "new service", "build from scratch", "new platform"]),
-        ("migration", ["migration", "migrate", "replatform", "lift and shift"]),
-        ("integration", ["integration", "integrate", "connector", "api integration"]),
-        ("refactor", ["refactor", "modernize", "re-architect", "tech debt"]),
-        ("automation", ["automate", "automation", "workflow", "orchestrat"]),
-        ("analysis", ["analysis", "research", "assessment", "evaluation", "audit"]),
-    ]
+    hits = analysis.signal_hits
     for ptype, signals in _TYPE_SIGNALS:
-        if any(sig in lowered for sig in signals):
+        if any(sig in hits for sig in signals):
             return ptype
     return "general"
 
 
-def _extract_pod_hints(text: str) -> List[str]:
+def _extract_pod_hints(analysis: BriefAnalysis) -> List[str]:
     """Extract explicit pod/capability-area hints from the brief."""
-    lowered = text.lower()
-    hints: List[str] = []
-    _POD_HINT_SIGNALS: List[tuple[str, list[str]]] = [
-        ("commercial", ["go-to-market", "pricing strategy", "sales enablement"]),
-        ("finance_governance", ["budget", "financial governance", "cost control", "sox compliance"]),
-        ("legal_risk", ["legal review", "regulatory", "compliance requirement", "gdpr", "hipaa"]),
-        ("people_talent", ["hiring plan", "onboarding", "team composition", "skill gap"]),
-        ("ops_supply", ["procurement", "supply chain", "vendor management"]),
-        ("data_insight", ["data pipeline", "bi report", "analytics dashboard"]),
-    ]
-    for pod_id, signals in _POD_HINT_SIGNALS:
-        if any(sig in lowered for sig in signals):
-            hints.append(pod_id)
-    return hints
+    hits = analysis.signal_hits
+    return [pod_id for pod_id, signals in _POD_HINT_SIGNALS if any(sig in hits for sig in signals)]
 
 
 def parse_brief(brief_path: str) -> Tuple[BriefIntent, str]:
@@ -217,28 +191,29 @@ def parse_brief(brief_path: str) -> Tuple[BriefIntent, str]:
     if not text:
         raise BriefValidationError("project_brief.md is empty")
 
-    sections = _collect_sections(text)
+    analysis = analyze_brief(text)
+    sections = _collect_sections(analysis)
     if not sections["goals"]:
         # fallback to first meaningful lines in file as implied goals
-        sections["goals"] = _extract_candidates(text.splitlines(), max_items=5)
+        sections["goals"] = _extract_candidates(list(analysis.lines), max_items=5)
     if not sections["constraints"]:
-        sections["constraints"] = _extract_semantic_candidates(text, section="constraints", max_items=5)
+        sections["constraints"] = _extract_semantic_candidates(analysis, section="constraints", max_items=5)
     if not sections["deliverables"]:
-        sections["deliverables"] = _extract_semantic_candidates(text, section="deliverables", max_items=5)
+        sections["deliverables"] = _extract_semantic_candidates(analysis, section="deliverables", max_items=5)
 
     from .pods import detect_industry
 
-    industry = detect_industry(text)
-    project_type = _infer_project_type(text)
-    pod_hints = _extract_pod_hints(text)
+    industry = detect_industry(analysis)
+    project_type = _infer_project_type(analysis)
+    pod_hints = _extract_pod_hints(analysis)
 
     try:
         intent = BriefIntent(
             goals=sections["goals"],
             constraints=sections["constraints"],
             deliverables=sections["deliverables"],
-            risk_tier=_infer_risk(text),
-            evidence_level=_infer_evidence(text),
+            risk_tier=_infer_risk(analysis),
+            evidence_level=_infer_evidence(analysis),
             industry=industry,
             project_type=project_type,
             pod_hints=pod_hints,
@@ -481,8 +456,8 @@ def is_material_change(previous_intent: BriefIntent, new_intent: BriefIntent) ->
     if previous_intent.evidence_level != new_intent.evidence_level:
         return True
 
-    old_tokens = set(re.findall(r"[a-zA-Z0-9_]+", previous_intent.raw_text.lower()))
-    new_tokens = set(re.findall(r"[a-zA-Z0-9_]+", new_intent.raw_text.lower()))
+    old_tokens = analyze_brief(previous_intent.raw_text).word_set
+    new_tokens = analyze_brief(new_intent.raw_text).word_set
     if not old_tokens and not new_tokens:
         return False
 
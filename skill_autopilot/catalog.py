@@ -1,12 +1,98 @@
 from __future__ import annotations
 
+import json
+import multiprocessing
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Mapping, Tuple
 
 from .config import CatalogSource
 from .models import SkillMetadata
-from .utils import canonical_json, sha256_hex
+from .utils import canonical_json, sha256_hex, stat_fingerprint
+
+
+CATALOG_INDEX_VERSION = 1
+
+
+def _interned(values: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(str(value)) for value in values)
+
+
+class SkillRecord:
+    """Compact in-memory skill used inside the catalog and router.
+
+    Same attribute names as ``SkillMetadata`` but slotted, with tuples instead
+    of lists and interned tag/host/source strings, which are shared by most of
+    the catalog. Convert with ``to_metadata()`` only where a pydantic model
+    leaves the process.
+    """
+
+    __slots__ = (
+        "skill_id",
+        "name",
+        "description",
+        "tags",
+        "hosts",
+        "dependencies",
+        "conflicts",
+        "source_repo",
+        "pinned_ref",
+    )
+
+    def __init__(
+        self,
+        skill_id: str,
+        name: str,
+        description: str,
+        tags: Iterable[str] = (),
+        hosts: Iterable[str] = ("claude_desktop",),
+        dependencies: Iterable[str] = (),
+        conflicts: Iterable[str] = (),
+        source_repo: str = "",
+        pinned_ref: str = "",
+    ):
+        self.skill_id = skill_id
+        self.name = name
+        self.description = description
+        self.tags = _interned(tags)
+        self.hosts = _interned(hosts)
+        self.dependencies = _interned(dependencies)
+        self.conflicts = _interned(conflicts)
+        self.source_repo = sys.intern(source_repo)
+        self.pinned_ref = sys.intern(pinned_ref)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, object]) -> "SkillRecord":
+        return cls(**data)  # type: ignore[arg-type]
+
+    @classmethod
+    def from_metadata(cls, skill: SkillMetadata) -> "SkillRecord":
+        return cls(**skill.model_dump())
+
+    def as_dict(self) -> Dict[str, object]:
+        """Same shape as ``SkillMetadata.model_dump()``; feeds the snapshot hash."""
+        return {
+            "skill_id": self.skill_id,
+            "name": self.name,
+            "description": self.description,
+            "tags": list(self.tags),
+            "hosts": list(self.hosts),
+            "dependencies": list(self.dependencies),
+            "conflicts": list(self.conflicts),
+            "source_repo": self.source_repo,
+            "pinned_ref": self.pinned_ref,
+        }
+
+    def to_metadata(self) -> SkillMetadata:
+        # Fields were validated when the record was parsed; skip re-validation.
+        return SkillMetadata.model_construct(**self.as_dict())
+
+    def __repr__(self) -> str:
+        return f"SkillRecord(skill_id={self.skill_id!r}, source_repo={self.source_repo!r})"
 
 
 BUILTIN_SKILLS: List[SkillMetadata] = [
@@ -46,6 +132,12 @@ BUILTIN_SKILLS: List[SkillMetadata] = [
 ]
 
 
+_BUILTIN_RECORDS: List[SkillRecord] = [SkillRecord.from_metadata(skill) for skill in BUILTIN_SKILLS]
+# Stored in the catalog index: builtins feed the snapshot hash, so an index
+# written by a build with different builtins must not be reused.
+_BUILTIN_DIGEST = sha256_hex(canonical_json([record.as_dict() for record in _BUILTIN_RECORDS]))
+
+
 def _split_csv(value: str) -> List[str]:
     return [item.strip() for item in value.split(",") if item.strip()]
 
@@ -138,7 +230,7 @@ def _to_list(value: object) -> List[str]:
     return []
 
 
-def _skill_from_file(skill_path: Path, source: CatalogSource) -> SkillMetadata | None:
+def _skill_from_file(skill_path: Path, source: CatalogSource) -> SkillRecord | None:
     try:
         text = skill_path.read_text(encoding="utf-8")
     except OSError:
@@ -162,56 +254,250 @@ def _skill_from_file(skill_path: Path, source: CatalogSource) -> SkillMetadata |
     hosts = [h for h in hosts if h in valid_hosts] or ["claude_desktop"]
     tags = tags or [word.lower() for word in re.findall(r"[a-zA-Z0-9_]+", name)[:4]]
 
-    try:
-        return SkillMetadata(
-            skill_id=skill_id,
-            name=name,
-            description=description,
-            tags=sorted(set(tags)),
-            hosts=sorted(set(hosts)),
-            dependencies=sorted(set(dependencies)),
-            conflicts=sorted(set(conflicts)),
-            source_repo=source.name,
-            pinned_ref=source.pinned_ref,
-        )
-    except Exception:
-        return None
-
-
-def load_catalog(sources: Iterable[CatalogSource]) -> Tuple[List[SkillMetadata], str]:
+    return SkillRecord(
+        skill_id=skill_id,
+        name=name,
+        description=description,
+        tags=sorted(set(tags)),
+        hosts=sorted(set(hosts)),
+        dependencies=sorted(set(dependencies)),
+        conflicts=sorted(set(conflicts)),
+        source_repo=source.name,
+        pinned_ref=source.pinned_ref,
+    )
+
+
+class CatalogIndex:
+    """Persistent parse cache for ``load_catalog``.
+
+    Each SKILL.md is recorded with its ``(mtime_ns, size, inode)`` fingerprint,
+    the source that owned it and the parsed metadata, so a reload only re-reads
+    files whose fingerprint changed. The last snapshot hash is kept alongside and
+    reused when no entry was added, changed or removed. An index written with a
+    different ``CATALOG_INDEX_VERSION`` or different builtin skills is ignored.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path).expanduser()
+        self.entries: Dict[str, Dict[str, object]] = {}
+        self.sources: List[List[str]] = []
+        self.snapshot_hash: str | None = None
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != CATALOG_INDEX_VERSION
+            or payload.get("builtins") != _BUILTIN_DIGEST
+        ):
+            return
+        entries = payload.get("entries")
+        if isinstance(entries, dict):
+            self.entries = entries
+        sources = payload.get("sources")
+        if isinstance(sources, list):
+            self.sources = sources
+        snapshot_hash = payload.get("snapshot_hash")
+        self.snapshot_hash = snapshot_hash if isinstance(snapshot_hash, str) else None
+
+    def save(self) -> None:
+        payload = {
+            "version": CATALOG_INDEX_VERSION,
+            "builtins": _BUILTIN_DIGEST,
+            "sources": self.sources,
+            "snapshot_hash": self.snapshot_hash,
+            "entries": self.entries,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # The index is only a cache; a failed write just means a slower next load.
+            return
+
+
+def load_catalog(
+    sources: Iterable[CatalogSource],
+    index_path: str | None = None,
+    max_workers: int = 1,
+    executor: str = "thread",
+) -> Tuple[List[SkillMetadata], str]:
+    records, snapshot_hash = load_catalog_records(
+        sources, index_path=index_path, max_workers=max_workers, executor=executor
+    )
+    return [record.to_metadata() for record in records], snapshot_hash
+
+
+def load_catalog_records(
+    sources: Iterable[CatalogSource],
+    index_path: str | None = None,
+    max_workers: int = 1,
+    executor: str = "thread",
+) -> Tuple[List[SkillRecord], str]:
+    """``load_catalog`` without the pydantic conversion, for in-process consumers."""
     resolved_sources = []
     for source in sources:
         root = Path(source.path).expanduser().resolve()
         resolved_sources.append((source, root))
 
-    loaded: Dict[str, SkillMetadata] = {skill.skill_id: skill for skill in BUILTIN_SKILLS}
+    index = CatalogIndex(index_path) if index_path else None
+    entries: Dict[str, Dict[str, object]] = {}
 
+    # Discovery pass: walk every source in order and decide which files need a
+    # parse. Parsing is then done in bulk (optionally in parallel) and results
+    # are applied in discovery order, so duplicate IDs resolve exactly as a
+    # serial load would.
+    work: List[_CatalogWork] = []
+    trie = _SourceTrie(root for _, root in resolved_sources)
     for source, root in resolved_sources:
         if not root.exists() or not root.is_dir():
             continue
-        for skill_file in root.rglob("SKILL.md"):
-            # If this file is inside another configured source root, only load
-            # it via that more specific source to avoid duplicate IDs.
-            skill_file_resolved = skill_file.resolve()
-            if any(
-                other_root != root
-                and _path_is_relative_to(other_root, root)
-                and _path_is_relative_to(skill_file_resolved, other_root)
-                for _, other_root in resolved_sources
-            ):
-                continue
-            skill = _skill_from_file(skill_file, source)
-            if skill:
-                loaded[skill.skill_id] = skill
+        source_key = [source.name, source.path, source.pinned_ref]
+        for skill_file in _iter_skill_files(root, trie.nested_roots(root), trie):
+            item = _CatalogWork(skill_file=skill_file, source=source)
+            if index is not None:
+                item.fingerprint = stat_fingerprint(str(skill_file))
+                cached = index.entries.get(str(skill_file))
+                if (
+                    cached is not None
+                    and item.fingerprint is not None
+                    and cached.get("fingerprint") == list(item.fingerprint)
+                    and cached.get("source") == source_key
+                ):
+                    data = cached.get("skill")
+                    item.skill = SkillRecord.from_dict(data) if isinstance(data, dict) else None
+                    item.cached = True
+            work.append(item)
+
+    pending = [item for item in work if not item.cached]
+    for item, skill in zip(pending, _parse_skill_files(pending, max_workers=max_workers, executor=executor)):
+        item.skill = skill
+
+    loaded: Dict[str, SkillRecord] = {skill.skill_id: skill for skill in _BUILTIN_RECORDS}
+    for item in work:
+        if index is not None:
+            entries[str(item.skill_file)] = {
+                "fingerprint": list(item.fingerprint) if item.fingerprint is not None else None,
+                "source": [item.source.name, item.source.path, item.source.pinned_ref],
+                "skill": item.skill.as_dict() if item.skill else None,
+            }
+        if item.skill:
+            loaded[item.skill.skill_id] = item.skill
 
     skills = sorted(loaded.values(), key=lambda skill: skill.skill_id)
-    snapshot_hash = sha256_hex(canonical_json([skill.model_dump() for skill in skills]))
+
+    if index is None:
+        return skills, _snapshot_hash(skills)
+
+    sources_key = [[source.name, source.path, source.pinned_ref, str(root)] for source, root in resolved_sources]
+    changed = bool(pending) or set(entries) != set(index.entries) or sources_key != index.sources
+    if not changed and index.snapshot_hash:
+        return skills, index.snapshot_hash
+
+    snapshot_hash = _snapshot_hash(skills)
+    index.entries = entries
+    index.sources = sources_key
+    index.snapshot_hash = snapshot_hash
+    index.save()
     return skills, snapshot_hash
 
 
-def _path_is_relative_to(path: Path, base: Path) -> bool:
-    try:
-        path.relative_to(base)
-        return True
-    except ValueError:
-        return False
+@dataclass
+class _CatalogWork:
+    skill_file: Path
+    source: CatalogSource
+    fingerprint: Tuple[int, int, int] | None = None
+    skill: SkillRecord | None = None
+    cached: bool = False
+
+
+# Below this many files a pool costs more than it saves.
+_PARALLEL_PARSE_MIN_FILES = 32
+
+
+def _parse_skill_files(
+    work: List[_CatalogWork], max_workers: int = 1, executor: str = "thread"
+) -> List[SkillRecord | None]:
+    """Parse SKILL.md files, fanning out over a bounded pool for large batches.
+
+    ``executor="thread"`` suits I/O-bound sources such as network-mounted home
+    directories; ``"process"`` also parallelises the regex parsing. Results are
+    returned in input order either way.
+    """
+    paths = [item.skill_file for item in work]
+    sources = [item.source for item in work]
+    if max_workers <= 1 or len(work) < _PARALLEL_PARSE_MIN_FILES:
+        return [_skill_from_file(path, source) for path, source in zip(paths, sources)]
+
+    workers = min(max_workers, len(work))
+    if executor == "process":
+        chunksize = max(1, len(work) // (workers * 4))
+        # Spawn rather than fork: the engine runs watchdog threads, and forking a
+        # threaded process can deadlock the children.
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            return list(pool.map(_skill_from_file, paths, sources, chunksize=chunksize))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sa-catalog") as pool:
+        return list(pool.map(_skill_from_file, paths, sources))
+
+
+def _snapshot_hash(skills: List[SkillRecord]) -> str:
+    return sha256_hex(canonical_json([skill.as_dict() for skill in skills]))
+
+
+class _SourceTrie:
+    """Path-component trie over the resolved source roots.
+
+    Answers "which configured roots contain this path" in O(path depth) instead
+    of calling ``Path.relative_to`` against every root.
+    """
+
+    _END = None
+
+    def __init__(self, roots: Iterable[Path]):
+        self._nodes: Dict[object, object] = {}
+        self._roots: List[Path] = []
+        for root in roots:
+            node = self._nodes
+            for part in root.parts:
+                node = node.setdefault(part, {})  # type: ignore[assignment]
+            if self._END not in node:
+                node[self._END] = root
+                self._roots.append(root)
+
+    def roots_on_path(self, path: Path) -> List[Path]:
+        """Return every configured root that is ``path`` or one of its ancestors, shallowest first."""
+        found: List[Path] = []
+        node = self._nodes
+        for part in path.parts:
+            node = node.get(part)  # type: ignore[assignment]
+            if node is None:
+                break
+            root = node.get(self._END)
+            if root is not None:
+                found.append(root)
+        return found
+
+    def nested_roots(self, root: Path) -> set[str]:
+        """Roots strictly below ``root``; their files belong to the more specific source."""
+        return {str(other) for other in self._roots if other != root and root in self.roots_on_path(other)}
+
+
+def _iter_skill_files(root: Path, nested: set[str], trie: _SourceTrie) -> Iterable[Path]:
+    """Yield SKILL.md files under ``root``, never descending into nested source roots."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        if nested:
+            dirnames[:] = [name for name in dirnames if os.path.join(dirpath, name) not in nested]
+        if "SKILL.md" not in filenames:
+            continue
+        skill_file = Path(dirpath) / "SKILL.md"
+        # A symlinked SKILL.md may point into a nested root; that root owns it.
+        if nested and skill_file.is_symlink():
+            if any(str(owner) in nested for owner in trie.roots_on_path(skill_file.resolve())):
+                continue
+        yield skill_file
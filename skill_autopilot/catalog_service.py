@@ -0,0 +1,246 @@
+"""Long-lived catalog snapshot owned by the engine.
+
+``load_catalog`` walks and hashes every configured source. The catalog almost
+never changes between project starts, so the service keeps the last snapshot in
+memory, watches the source roots with watchdog, and swaps in a rebuilt snapshot
+when a SKILL.md changes. Readers get the current snapshot after one ``stat`` per
+source root: a root that appeared, disappeared or was replaced (``rm -rf`` and
+re-clone) since the watches were armed cannot be covered by them, so the
+watches are re-armed and the catalog reloaded.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import stat
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from threading import Lock, Timer
+from types import MappingProxyType
+from typing import Callable, Iterable, List, Mapping, Tuple
+
+from .catalog import SkillRecord, load_catalog_records
+from .config import CatalogSource
+from .router import RoutingIndex
+from .skill_graph import SkillGraph
+
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+except Exception:  # pragma: no cover
+    FileSystemEvent = object  # type: ignore
+    FileSystemEventHandler = object  # type: ignore
+    Observer = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Immutable view of one catalog load."""
+
+    skills: Tuple[SkillRecord, ...]
+    skills_by_id: Mapping[str, SkillRecord]
+    snapshot_hash: str
+    skill_graph: SkillGraph
+
+    @cached_property
+    def routing_index(self) -> RoutingIndex:
+        """Token index for ``route_skills``, built on first use and reused."""
+        return RoutingIndex(self.skills)
+
+
+def build_snapshot(skills: Iterable[SkillRecord], snapshot_hash: str) -> CatalogSnapshot:
+    ordered = tuple(skills)
+    return CatalogSnapshot(
+        skills=ordered,
+        skills_by_id=MappingProxyType({skill.skill_id: skill for skill in ordered}),
+        snapshot_hash=snapshot_hash,
+        skill_graph=SkillGraph(ordered),
+    )
+
+
+class _CatalogEventHandler(FileSystemEventHandler):
+    def __init__(self, on_change: Callable[[], None], roots: Iterable[Path] = (), on_root_removed=None):
+        super().__init__()
+        self.on_change = on_change
+        self.roots = frozenset(str(root) for root in roots)
+        self.on_root_removed = on_root_removed
+
+    def on_any_event(self, event: FileSystemEvent) -> None:  # type: ignore[override]
+        event_type = getattr(event, "event_type", "")
+        if event_type in {"opened", "closed_no_write"}:
+            return
+        if event_type in {"deleted", "moved"} and str(getattr(event, "src_path", "")) in self.roots:
+            # The watch died with the root; a recreated root needs a new one.
+            if self.on_root_removed is not None:
+                self.on_root_removed()
+            self.on_change()
+            return
+        if getattr(event, "is_directory", False):
+            # Directory create/delete/move can add or drop whole skills; a plain
+            # "modified" only means some child changed and is reported separately.
+            if event_type != "modified":
+                self.on_change()
+            return
+        paths = [getattr(event, "src_path", ""), getattr(event, "dest_path", "")]
+        if any(Path(str(p)).name == "SKILL.md" for p in paths if p):
+            self.on_change()
+
+
+class CatalogService:
+    """Holds the current catalog snapshot and rebuilds it on filesystem changes.
+
+    Without watchdog (or when the observer cannot start) every ``snapshot()``
+    call reloads through the incremental index, which keeps the old behaviour of
+    always reflecting the current files.
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[CatalogSource],
+        index_path: str | None = None,
+        debounce_seconds: float = 0.5,
+        parse_workers: int = 1,
+        parse_executor: str = "thread",
+    ):
+        self.sources: List[CatalogSource] = list(sources)
+        self.index_path = index_path
+        self.parse_workers = parse_workers
+        self.parse_executor = parse_executor
+        self.debounce_seconds = debounce_seconds
+        self._snapshot: CatalogSnapshot | None = None
+        self._rebuild_lock = Lock()
+        self._state_lock = Lock()
+        self._observer = None
+        self._watching = False
+        self._watch_failed = False
+        self._rearm = False
+        self._root_state: Tuple[Tuple[int, int] | None, ...] = ()
+        self._timer: Timer | None = None
+
+    def supports_watch(self) -> bool:
+        return Observer is not None
+
+    @property
+    def watching(self) -> bool:
+        return self._watching
+
+    def snapshot(self) -> CatalogSnapshot:
+        current = self._snapshot
+        if current is not None and self._watching:
+            if not self._rearm and self._root_states() == self._root_state:
+                return current
+            self._stop_observer()
+        self._ensure_watching()
+        if self._watching and self._snapshot is not None:
+            return self._snapshot
+        return self.refresh()
+
+    def refresh(self) -> CatalogSnapshot:
+        """Reload the catalog now and atomically swap in the new snapshot."""
+        with self._rebuild_lock:
+            skills, snapshot_hash = load_catalog_records(
+                self.sources,
+                index_path=self.index_path,
+                max_workers=self.parse_workers,
+                executor=self.parse_executor,
+            )
+            current = self._snapshot
+            if current is None or current.snapshot_hash != snapshot_hash:
+                current = build_snapshot(skills, snapshot_hash)
+                self._snapshot = current
+            return current
+
+    def stop(self) -> None:
+        self._stop_observer()
+
+    def _stop_observer(self) -> None:
+        with self._state_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            observer = self._observer
+            self._observer = None
+            self._watching = False
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=2)
+
+    def _root_states(self) -> Tuple[Tuple[int, int] | None, ...]:
+        """``(st_dev, st_ino)`` of each source root, None when it is not a directory."""
+        states: List[Tuple[int, int] | None] = []
+        for source in self.sources:
+            try:
+                st = os.stat(Path(source.path).expanduser())
+            except OSError:
+                states.append(None)
+                continue
+            states.append((st.st_dev, st.st_ino) if stat.S_ISDIR(st.st_mode) else None)
+        return tuple(states)
+
+    def _ensure_watching(self) -> None:
+        if self._watching or self._watch_failed or not self.supports_watch():
+            return
+        with self._state_lock:
+            if self._watching or self._observer is not None:
+                return
+            # Record root identities before scheduling, so a change in between is caught next call.
+            self._root_state = self._root_states()
+            self._rearm = False
+            roots = _watch_roots(self.sources)
+            observer = Observer()
+            handler = _CatalogEventHandler(self._on_change, roots, self._on_root_removed)
+            try:
+                for root in roots:
+                    observer.schedule(handler, str(root), recursive=True)
+                observer.daemon = True
+                observer.start()
+            except (OSError, RuntimeError) as exc:
+                self._watch_failed = True
+                logger.warning("catalog watch unavailable, reloading on every snapshot: %s", exc)
+                return
+            self._observer = observer
+        # Watch first, then load, so no change can slip in between the two.
+        self.refresh()
+        self._watching = True
+
+    def _on_root_removed(self) -> None:
+        self._rearm = True
+
+    def _on_change(self) -> None:
+        with self._state_lock:
+            if self._observer is None:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = Timer(self.debounce_seconds, self._rebuild_from_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _rebuild_from_timer(self) -> None:
+        with self._state_lock:
+            self._timer = None
+        try:
+            self.refresh()
+        except Exception:  # noqa: BLE001
+            # Keep serving the previous snapshot; the next event retries.
+            logger.exception("catalog rebuild failed; keeping previous snapshot")
+
+
+def _watch_roots(sources: Iterable[CatalogSource]) -> List[Path]:
+    roots = sorted(
+        {Path(source.path).expanduser().resolve() for source in sources},
+        key=lambda item: len(item.parts),
+    )
+    out: List[Path] = []
+    for root in roots:
+        if not root.is_dir():
+            continue
+        # A recursive watch on a parent already covers nested roots.
+        if any(root == parent or parent in root.parents for parent in out):
+            continue
+        out.append(root)
+    return out
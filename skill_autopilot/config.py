@@ -30,6 +30,7 @@ class AppConfig:
     service_host: str = "127.0.0.1"
     service_port: int = 8787
     db_path: str = str(DEFAULT_DB_PATH)
+    db_max_connections: int = 8
     lease_ttl_hours: int = 24
     max_active_skills: int = 12
     min_relevance_score: float = 0.22
@@ -51,6 +52,21 @@ class AppConfig:
     remote_worker_endpoints: List[str] = field(default_factory=list)
     admin_mode: bool = False
     default_industry: str = ""
+    catalog_parse_workers: int = 8
+    catalog_parse_executor: str = "thread"
+    routing_backend: str = "python"
+    watcher_backend: str = "auto"
+    watcher_poll_interval_seconds: float = 2.0
+    watcher_poll_batch_size: int = 256
+    industry_classifier: str = "anthropic"
+    industry_classifier_url: str = ""
+    industry_classifier_model: str = "claude-haiku-4-20250414"
+    industry_classifier_budget_seconds: float = 2.0
+    audit_queue_size: int = 10000
+    audit_batch_size: int = 256
+    audit_flush_interval_seconds: float = 0.5
+    audit_retention_days: int = 90
+    audit_retention_overrides: Dict[str, int] = field(default_factory=dict)
     allowlisted_catalogs: List[CatalogSource] = field(default_factory=list)
 
 
@@ -68,6 +84,7 @@ def ensure_default_config(config_path: Path = DEFAULT_CONFIG_PATH) -> Path:
         '',
         '[policy]',
         f'db_path = "{DEFAULT_DB_PATH}"',
+        'db_max_connections = 8',
         'lease_ttl_hours = 24',
         'max_active_skills = 12',
         'min_relevance_score = 0.22',
@@ -82,6 +99,21 @@ def ensure_default_config(config_path: Path = DEFAULT_CONFIG_PATH) -> Path:
         'remote_worker_endpoints = ""',
         'default_industry = ""',
         'admin_mode = false',
+        'catalog_parse_workers = 8',
+        'catalog_parse_executor = "thread"',
+        'routing_backend = "python"',
+        'watcher_backend = "auto"',
+        'watcher_poll_interval_seconds = 2.0',
+        'watcher_poll_batch_size = 256',
+        'industry_classifier = "anthropic"',
+        'industry_classifier_url = ""',
+        'industry_classifier_model = "claude-haiku-4-20250414"',
+        'industry_classifier_budget_seconds = 2.0',
+        'audit_queue_size = 10000',
+        'audit_batch_size = 256',
+        'audit_flush_interval_seconds = 0.5',
+        'audit_retention_days = 90',
+        'audit_retention_overrides = ""',
         '',
     ]
 
@@ -125,6 +157,7 @@ def load_config(config_path: Path | None = None) -> AppConfig:
         service_host=service.get("host", "127.0.0.1"),
         service_port=int(service.get("port", 8787)),
         db_path=policy.get("db_path", str(DEFAULT_DB_PATH)),
+        db_max_connections=int(policy.get("db_max_connections", 8)),
         lease_ttl_hours=int(policy.get("lease_ttl_hours", 24)),
         max_active_skills=int(policy.get("max_active_skills", 12)),
         min_relevance_score=float(policy.get("min_relevance_score", 0.22)),
@@ -138,6 +171,21 @@ def load_config(config_path: Path | None = None) -> AppConfig:
         role_host_map=_parse_role_host_map(policy.get("role_host_map", "orchestrator:claude_desktop,research:claude_desktop,quality:codex_desktop,delivery:codex_desktop")),
         remote_worker_endpoints=_split_csv_str(policy.get("remote_worker_endpoints", "")),
         admin_mode=bool(policy.get("admin_mode", False)),
+        catalog_parse_workers=int(policy.get("catalog_parse_workers", 8)),
+        catalog_parse_executor=str(policy.get("catalog_parse_executor", "thread")),
+        routing_backend=str(policy.get("routing_backend", "python")),
+        watcher_backend=str(policy.get("watcher_backend", "auto")),
+        watcher_poll_interval_seconds=float(policy.get("watcher_poll_interval_seconds", 2.0)),
+        watcher_poll_batch_size=int(policy.get("watcher_poll_batch_size", 256)),
+        industry_classifier=str(policy.get("industry_classifier", "anthropic")),
+        industry_classifier_url=str(policy.get("industry_classifier_url", "")),
+        industry_classifier_model=str(policy.get("industry_classifier_model", "claude-haiku-4-20250414")),
+        industry_classifier_budget_seconds=float(policy.get("industry_classifier_budget_seconds", 2.0)),
+        audit_queue_size=int(policy.get("audit_queue_size", 10000)),
+        audit_batch_size=int(policy.get("audit_batch_size", 256)),
+        audit_flush_interval_seconds=float(policy.get("audit_flush_interval_seconds", 0.5)),
+        audit_retention_days=int(policy.get("audit_retention_days", 90)),
+        audit_retention_overrides=_parse_retention_overrides(policy.get("audit_retention_overrides", "")),
         allowlisted_catalogs=catalogs,
     )
 
@@ -227,6 +275,20 @@ def _parse_role_host_map(value: object) -> Dict[str, str]:
     return mapping
 
 
+def _parse_retention_overrides(value: object) -> Dict[str, int]:
+    """``"watcher.*:14,task.completed:365"`` -> ``{"watcher.*": 14, "task.completed": 365}``."""
+    overrides: Dict[str, int] = {}
+    for item in _split_csv_str(value):
+        if ":" not in item:
+            continue
+        pattern, days = item.rsplit(":", 1)
+        try:
+            overrides[pattern.strip()] = int(days.strip())
+        except ValueError:
+            continue
+    return overrides
+
+
 def _default_catalog_sources() -> List[CatalogSource]:
     sources: List[CatalogSource] = []
     seen: set[str] = set()
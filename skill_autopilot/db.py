@@ -2,24 +2,250 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from .audit import AuditRow, AuditWriter
 from .utils import utc_now
 
+DEFAULT_MAX_CONNECTIONS = 8
+# Comfortably above the number of distinct statements issued by this module.
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+DEFAULT_CONNECTION_MAX_AGE_SECONDS = 600.0
+
+
+# Per-run counters kept in step with task_runs (see _write_task_run).
+_RUN_COUNTER_COLUMNS: Dict[str, str] = {
+    "task_run_count": "INTEGER NOT NULL DEFAULT 0",
+    "completed_count": "INTEGER NOT NULL DEFAULT 0",
+    "skipped_count": "INTEGER NOT NULL DEFAULT 0",
+    "failed_count": "INTEGER NOT NULL DEFAULT 0",
+    "done_count": "INTEGER NOT NULL DEFAULT 0",
+}
+
+
+# Secondary indexes for the per-project and per-run lookups below; the task_runs
+# expression must match the ORDER BY in get_last_task_for_project exactly.
+_SECONDARY_INDEXES: Dict[str, str] = {
+    "idx_routes_project_created": "routes(project_id, created_at)",
+    "idx_plans_project_created": "plans(project_id, created_at)",
+    "idx_project_runs_project_started": "project_runs(project_id, started_at)",
+    "idx_task_runs_run_order": "task_runs(run_id, order_index)",
+    "idx_task_runs_project_recent": "task_runs(project_id, COALESCE(ended_at, started_at))",
+    "idx_leases_project_status": "leases(project_id, status)",
+    "idx_leases_status_expires": "leases(status, expires_at)",
+    "idx_audit_events_project_event": "audit_events(project_id, event_id)",
+}
+
+
+class _PooledConnection:
+    __slots__ = ("conn", "thread", "generation", "opened_at", "depth", "suspect", "closed", "deferred_audit")
+
+    def __init__(self, conn: sqlite3.Connection, generation: int):
+        self.conn = conn
+        self.thread = threading.current_thread()
+        self.generation = generation
+        self.opened_at = time.monotonic()
+        self.depth = 0
+        self.suspect = False
+        self.closed = False
+        # Audit rows added inside this connection's transaction; queued only once it commits.
+        self.deferred_audit: List[AuditRow] = []
+
 
 class Database:
-    def __init__(self, db_path: str):
+    """SQLite access over long-lived, per-thread connections.
+
+    Each thread keeps one connection (opened lazily, PRAGMAs applied once, with
+    a statement cache sized for this module's queries) for as long as it is
+    healthy and younger than ``max_connection_age_seconds``. At most
+    ``max_connections`` are pooled; a thread beyond the cap gets a connection
+    for the duration of one call. ``_connect`` commits on success and rolls
+    back on error, and nested uses on one thread share the outer transaction.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+        max_connection_age_seconds: float = DEFAULT_CONNECTION_MAX_AGE_SECONDS,
+    ):
         self.db_path = str(Path(db_path).expanduser())
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_connections = max(1, max_connections)
+        self.statement_cache_size = max(0, statement_cache_size)
+        self.max_connection_age_seconds = max_connection_age_seconds
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+        self._pooled: List[_PooledConnection] = []
+        self._generation = 0
+        self.audit_writer: AuditWriter | None = None
         self._init_schema()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path, timeout=30)
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=30,
+            cached_statements=self.statement_cache_size,
+            check_same_thread=False,
+        )
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA busy_timeout=30000;")
         return conn
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        active: _PooledConnection | None = getattr(self._local, "active", None)
+        if active is not None:
+            active.depth += 1
+            try:
+                yield active.conn
+            finally:
+                active.depth -= 1
+            return
+
+        slot = self._checkout()
+        conn = slot.conn
+        self._local.active = slot
+        try:
+            yield conn
+            if conn.in_transaction:
+                conn.commit()
+        except BaseException as exc:
+            slot.deferred_audit.clear()
+            if isinstance(exc, sqlite3.Error) and not isinstance(exc, sqlite3.IntegrityError):
+                slot.suspect = True
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                slot.suspect = True
+            raise
+        finally:
+            self._local.active = None
+            self._checkin(slot)
+        if slot.deferred_audit and self.audit_writer is not None:
+            rows, slot.deferred_audit = slot.deferred_audit, []
+            self.audit_writer.submit(rows)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run every call made in the block on this thread as one write transaction.
+
+        The block commits once on exit and rolls back entirely on error. Nested
+        blocks join the outermost one. The write lock is taken on entry, so keep
+        slow non-database work outside the block.
+        """
+        with self._connect() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            yield
+
+    def _checkout(self) -> _PooledConnection:
+        slot: _PooledConnection | None = getattr(self._local, "slot", None)
+        if slot is not None and not self._claim(slot):
+            self._discard(slot)
+            slot = None
+        if slot is not None:
+            return slot
+        with self._pool_lock:
+            if len(self._pooled) >= self.max_connections:
+                self._prune_dead_threads()
+            pooled = len(self._pooled) < self.max_connections
+            slot = _PooledConnection(self._open_connection(), self._generation)
+            slot.depth = 1
+            if pooled:
+                self._pooled.append(slot)
+        if pooled:
+            self._local.slot = slot
+        return slot
+
+    def _claim(self, slot: _PooledConnection) -> bool:
+        """Mark this thread's pooled connection in use if it is still healthy and current."""
+        with self._pool_lock:
+            if slot.closed or slot.generation != self._generation:
+                return False
+            slot.depth = 1
+        healthy = time.monotonic() - slot.opened_at <= self.max_connection_age_seconds
+        if healthy and slot.suspect:
+            try:
+                slot.conn.execute("SELECT 1").fetchone()
+                slot.suspect = False
+            except sqlite3.Error:
+                healthy = False
+        if not healthy:
+            slot.depth = 0
+        return healthy
+
+    def _checkin(self, slot: _PooledConnection) -> None:
+        if getattr(self._local, "slot", None) is not slot:
+            # Over the cap: this connection was only for one call.
+            slot.depth = 0
+            slot.conn.close()
+            return
+        with self._pool_lock:
+            slot.depth = 0
+            stale = slot.generation != self._generation
+        if stale:
+            self._discard(slot)
+
+    def _discard(self, slot: _PooledConnection) -> None:
+        with self._pool_lock:
+            if slot in self._pooled:
+                self._pooled.remove(slot)
+            closed, slot.closed = slot.closed, True
+        if getattr(self._local, "slot", None) is slot:
+            self._local.slot = None
+        if not closed:
+            try:
+                slot.conn.close()
+            except sqlite3.Error:
+                pass
+
+    def _prune_dead_threads(self) -> None:
+        # Caller holds _pool_lock.
+        for slot in [item for item in self._pooled if not item.thread.is_alive()]:
+            self._pooled.remove(slot)
+            slot.closed = True
+            try:
+                slot.conn.close()
+            except sqlite3.Error:
+                pass
+
+    def pool_size(self) -> int:
+        with self._pool_lock:
+            return len(self._pooled)
+
+    def enable_audit_writer(self, **options: Any) -> AuditWriter:
+        """Route ``add_audit_event`` through a write-behind ``AuditWriter`` (see ``audit``)."""
+        if self.audit_writer is None:
+            self.audit_writer = AuditWriter(self._insert_audit_rows, **options)
+        return self.audit_writer
+
+    def flush_audit(self) -> None:
+        # Not from inside a transaction: the writer would wait on this thread's write lock.
+        if self.audit_writer is not None and getattr(self._local, "active", None) is None:
+            self.audit_writer.flush()
+
+    def close(self) -> None:
+        """Close every pooled connection; connections in use close when their call returns."""
+        if self.audit_writer is not None:
+            self.audit_writer.close()
+        with self._pool_lock:
+            self._generation += 1
+            idle = [slot for slot in self._pooled if not slot.depth]
+            self._pooled = [slot for slot in self._pooled if slot.depth]
+            for slot in idle:
+                slot.closed = True
+        for slot in idle:
+            try:
+                slot.conn.close()
+            except sqlite3.Error:
+                pass
+
     def _init_schema(self) -> None:
         with self._connect() as conn:
             conn.executescript(
@@ -88,6 +314,11 @@ class Database:
                     summary_json TEXT NOT NULL,
                     started_at TEXT NOT NULL,
                     ended_at TEXT,
+                    task_run_count INTEGER NOT NULL DEFAULT 0,
+                    completed_count INTEGER NOT NULL DEFAULT 0,
+                    skipped_count INTEGER NOT NULL DEFAULT 0,
+                    failed_count INTEGER NOT NULL DEFAULT 0,
+                    done_count INTEGER NOT NULL DEFAULT 0,
                     FOREIGN KEY(project_id) REFERENCES projects(project_id)
                 );
 
@@ -109,6 +340,18 @@ class Database:
                     FOREIGN KEY(run_id) REFERENCES project_runs(run_id)
                 );
 
+                CREATE TABLE IF NOT EXISTS run_task_state (
+                    run_id TEXT NOT NULL,
+                    task_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    done INTEGER NOT NULL,
+                    first_order_index INTEGER NOT NULL,
+                    last_order_index INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY(run_id, task_id),
+                    FOREIGN KEY(run_id) REFERENCES project_runs(run_id)
+                );
+
                 CREATE TABLE IF NOT EXISTS gate_approvals (
                     project_id TEXT NOT NULL,
                     gate_id TEXT NOT NULL,
@@ -118,8 +361,141 @@ class Database:
                     PRIMARY KEY(project_id, gate_id),
                     FOREIGN KEY(project_id) REFERENCES projects(project_id)
                 );
+
+                CREATE TABLE IF NOT EXISTS intent_fingerprints (
+                    project_id TEXT PRIMARY KEY,
+                    risk_tier TEXT NOT NULL,
+                    evidence_level TEXT NOT NULL,
+                    text_digest TEXT NOT NULL,
+                    word_count INTEGER NOT NULL,
+                    sketch BLOB NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    FOREIGN KEY(project_id) REFERENCES projects(project_id)
+                );
+
+                CREATE TABLE IF NOT EXISTS brief_stats (
+                    project_id TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    FOREIGN KEY(project_id) REFERENCES projects(project_id)
+                );
+
+                CREATE TABLE IF NOT EXISTS route_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    snapshot_hash TEXT NOT NULL,
+                    route_json TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                );
                 """
             )
+            self._migrate(conn)
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Apply pending ``_MIGRATIONS`` in order, one transaction per step.
+
+        Databases created before ``schema_version`` existed start at version 0;
+        every step is safe to run against tables that already have its change.
+        """
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TEXT NOT NULL
+            )
+            """
+        )
+        for version, name, step in _MIGRATIONS:
+            if version <= self._schema_version(conn):
+                continue
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Another process may have migrated while we waited for the lock.
+                if version > self._schema_version(conn):
+                    step(self, conn)
+                    conn.execute(
+                        "INSERT INTO schema_version(version, name, applied_at) VALUES (?, ?, ?)",
+                        (version, name, utc_now().isoformat()),
+                    )
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    @staticmethod
+    def _schema_version(conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT COALESCE(MAX(version), 0) AS version FROM schema_version").fetchone()
+        return int(row["version"])
+
+    def get_schema_version(self) -> int:
+        with self._connect() as conn:
+            return self._schema_version(conn)
+
+    def _migrate_run_counters(self, conn: sqlite3.Connection) -> None:
+        if self._add_missing_columns(conn, "project_runs", _RUN_COUNTER_COLUMNS):
+            self._backfill_run_task_state(conn)
+
+    def _migrate_secondary_indexes(self, conn: sqlite3.Connection) -> None:
+        for name, ddl in _SECONDARY_INDEXES.items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {ddl}")
+
+    def _migrate_audit_rollups(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS audit_rollups (
+                day TEXT NOT NULL,
+                project_id TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                event_count INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY(day, project_id, event_type)
+            )
+            """
+        )
+
+    def _add_missing_columns(self, conn: sqlite3.Connection, table: str, columns: Dict[str, str]) -> bool:
+        existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+        added = False
+        for name, ddl in columns.items():
+            if name not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
+                added = True
+        return added
+
+    def _backfill_run_task_state(self, conn: sqlite3.Connection) -> None:
+        """Rebuild per-run task state and counters from task_runs (pre-counter databases)."""
+        now = utc_now().isoformat()
+        conn.execute("DELETE FROM run_task_state")
+        conn.execute(
+            """
+            INSERT INTO run_task_state(run_id, task_id, status, done, first_order_index, last_order_index, updated_at)
+            SELECT t.run_id, t.task_id,
+                   (SELECT l.status FROM task_runs l
+                    WHERE l.run_id=t.run_id AND l.task_id=t.task_id
+                    ORDER BY l.order_index DESC LIMIT 1),
+                   MAX(t.status IN ('completed', 'skipped')),
+                   MIN(t.order_index), MAX(t.order_index), ?
+            FROM task_runs t
+            GROUP BY t.run_id, t.task_id
+            """,
+            (now,),
+        )
+        conn.execute(
+            """
+            UPDATE project_runs SET
+              task_run_count=(SELECT COUNT(*) FROM task_runs t WHERE t.run_id=project_runs.run_id),
+              completed_count=(SELECT COUNT(*) FROM task_runs t
+                               WHERE t.run_id=project_runs.run_id AND t.status='completed'),
+              skipped_count=(SELECT COUNT(*) FROM task_runs t
+                             WHERE t.run_id=project_runs.run_id AND t.status='skipped'),
+              failed_count=(SELECT COUNT(*) FROM task_runs t
+                            WHERE t.run_id=project_runs.run_id AND t.status='failed'),
+              done_count=(SELECT COUNT(*) FROM run_task_state s
+                          WHERE s.run_id=project_runs.run_id AND s.done=1)
+            """
+        )
 
     def upsert_project(self, project_id: str, workspace_path: str, brief_path: str, state: str) -> None:
         now = utc_now().isoformat()
@@ -210,6 +586,100 @@ class Database:
             ).fetchone()
             return dict(row) if row else None
 
+    def upsert_intent_fingerprint(
+        self,
+        project_id: str,
+        risk_tier: str,
+        evidence_level: str,
+        text_digest: str,
+        word_count: int,
+        sketch: bytes,
+    ) -> None:
+        now = utc_now().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO intent_fingerprints(project_id, risk_tier, evidence_level, text_digest,
+                                                word_count, sketch, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(project_id) DO UPDATE SET
+                  risk_tier=excluded.risk_tier,
+                  evidence_level=excluded.evidence_level,
+                  text_digest=excluded.text_digest,
+                  word_count=excluded.word_count,
+                  sketch=excluded.sketch,
+                  updated_at=excluded.updated_at
+                """,
+                (project_id, risk_tier, evidence_level, text_digest, word_count, sqlite3.Binary(sketch), now),
+            )
+
+    def get_intent_fingerprint(self, project_id: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM intent_fingerprints WHERE project_id=?",
+                (project_id,),
+            ).fetchone()
+            return dict(row) if row else None
+
+    def delete_intent_fingerprint(self, project_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM intent_fingerprints WHERE project_id=?", (project_id,))
+
+    def upsert_brief_stat(self, project_id: str, mtime_ns: int, size: int, inode: int) -> None:
+        now = utc_now().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO brief_stats(project_id, mtime_ns, size, inode, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(project_id) DO UPDATE SET
+                  mtime_ns=excluded.mtime_ns,
+                  size=excluded.size,
+                  inode=excluded.inode,
+                  updated_at=excluded.updated_at
+                """,
+                (project_id, mtime_ns, size, inode, now),
+            )
+
+    def get_brief_stat(self, project_id: str) -> Optional[Tuple[int, int, int]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT mtime_ns, size, inode FROM brief_stats WHERE project_id=?",
+                (project_id,),
+            ).fetchone()
+            return (int(row["mtime_ns"]), int(row["size"]), int(row["inode"])) if row else None
+
+    def delete_brief_stat(self, project_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM brief_stats WHERE project_id=?", (project_id,))
+
+    def get_cached_route(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT route_json FROM route_cache WHERE cache_key=?",
+                (cache_key,),
+            ).fetchone()
+            return json.loads(row["route_json"]) if row else None
+
+    def put_cached_route(self, cache_key: str, snapshot_hash: str, route_json: Dict[str, Any]) -> None:
+        now = utc_now().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO route_cache(cache_key, snapshot_hash, route_json, created_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                  route_json=excluded.route_json,
+                  created_at=excluded.created_at
+                """,
+                (cache_key, snapshot_hash, json.dumps(route_json, sort_keys=True), now),
+            )
+
+    def prune_route_cache(self, keep_snapshot_hash: str) -> int:
+        with self._connect() as conn:
+            cur = conn.execute("DELETE FROM route_cache WHERE snapshot_hash<>?", (keep_snapshot_hash,))
+            return int(cur.rowcount)
+
     def insert_plan(self, plan_id: str, project_id: str, route_id: str, plan_json: Dict[str, Any]) -> None:
         now = utc_now().isoformat()
         with self._connect() as conn:
@@ -230,6 +700,14 @@ class Database:
             payload["plan_json"] = json.loads(payload["plan_json"])
             return payload
 
+    def get_latest_plan_id(self, project_id: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT plan_id FROM plans WHERE project_id=? ORDER BY created_at DESC LIMIT 1",
+                (project_id,),
+            ).fetchone()
+            return str(row["plan_id"]) if row else None
+
     def get_plan(self, plan_id: str) -> Optional[Dict[str, Any]]:
         with self._connect() as conn:
             row = conn.execute(
@@ -305,14 +783,24 @@ class Database:
         project_id: str | None = None,
         route_id: str | None = None,
     ) -> None:
-        now = utc_now().isoformat()
+        row: AuditRow = (project_id, route_id, event_type, json.dumps(payload, sort_keys=True), utc_now().isoformat())
+        if self.audit_writer is None:
+            self._insert_audit_rows([row])
+            return
+        active: _PooledConnection | None = getattr(self._local, "active", None)
+        if active is not None:
+            active.deferred_audit.append(row)
+            return
+        self.audit_writer.submit([row])
+
+    def _insert_audit_rows(self, rows: Sequence[AuditRow]) -> None:
         with self._connect() as conn:
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT INTO audit_events(project_id, route_id, event_type, payload_json, created_at)
                 VALUES (?, ?, ?, ?, ?)
                 """,
-                (project_id, route_id, event_type, json.dumps(payload, sort_keys=True), now),
+                rows,
             )
 
     def get_expired_active_leases(self, now_iso: str) -> List[Dict[str, Any]]:
@@ -399,32 +887,190 @@ class Database:
         order_index: int,
         error_text: str | None = None,
     ) -> None:
-        now = utc_now().isoformat()
         with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO task_runs(
-                  task_run_id, run_id, project_id, phase, task_id, title, agent_role,
-                  status, output_json, error_text, order_index, started_at, ended_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    task_run_id,
+            self._write_task_run(
+                conn, task_run_id, run_id, project_id, phase, task_id, title, agent_role, status, output,
+                order_index, error_text,
+            )
+
+    def record_task_run(
+        self,
+        task_run_id: str,
+        run_id: str,
+        project_id: str,
+        phase: str,
+        task_id: str,
+        title: str,
+        agent_role: str,
+        status: str,
+        output: Dict[str, Any],
+        error_text: str | None = None,
+    ) -> Dict[str, int]:
+        """Append a task run at the next order index; returns the run's updated counters."""
+        counters = self.record_task_runs(
+            run_id,
+            project_id,
+            [
+                {
+                    "task_run_id": task_run_id,
+                    "phase": phase,
+                    "task_id": task_id,
+                    "title": title,
+                    "agent_role": agent_role,
+                    "status": status,
+                    "output": output,
+                    "error_text": error_text,
+                }
+            ],
+        )
+        order_indexes = counters.pop("order_indexes")
+        return counters | {"order_index": order_indexes[0]}
+
+    def record_task_runs(self, run_id: str, project_id: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Append several task runs, in order, in one transaction.
+
+        Each item has the ``record_task_run`` fields (``error_text`` optional).
+        Returns the run's updated counters plus the ``order_indexes`` assigned.
+        """
+        with self._connect() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT task_run_count FROM project_runs WHERE run_id=?", (run_id,)).fetchone()
+            next_index = (int(row["task_run_count"]) if row else 0) + 1
+            order_indexes: List[int] = []
+            for item in items:
+                self._write_task_run(
+                    conn,
+                    item["task_run_id"],
                     run_id,
                     project_id,
-                    phase,
-                    task_id,
-                    title,
-                    agent_role,
-                    status,
-                    json.dumps(output, sort_keys=True),
-                    error_text,
-                    order_index,
-                    now,
-                    now,
-                ),
+                    item["phase"],
+                    item["task_id"],
+                    item["title"],
+                    item["agent_role"],
+                    item["status"],
+                    item["output"],
+                    next_index,
+                    item.get("error_text"),
+                )
+                order_indexes.append(next_index)
+                next_index += 1
+            return self._run_counters(conn, run_id) | {"order_indexes": order_indexes}
+
+    def _write_task_run(
+        self,
+        conn: sqlite3.Connection,
+        task_run_id: str,
+        run_id: str,
+        project_id: str,
+        phase: str,
+        task_id: str,
+        title: str,
+        agent_role: str,
+        status: str,
+        output: Dict[str, Any],
+        order_index: int,
+        error_text: str | None,
+    ) -> None:
+        """Insert the task_runs row and update run_task_state and the run counters with it."""
+        now = utc_now().isoformat()
+        conn.execute(
+            """
+            INSERT INTO task_runs(
+              task_run_id, run_id, project_id, phase, task_id, title, agent_role,
+              status, output_json, error_text, order_index, started_at, ended_at
             )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                task_run_id,
+                run_id,
+                project_id,
+                phase,
+                task_id,
+                title,
+                agent_role,
+                status,
+                json.dumps(output, sort_keys=True),
+                error_text,
+                order_index,
+                now,
+                now,
+            ),
+        )
+        done = 1 if status in ("completed", "skipped") else 0
+        previous = conn.execute(
+            "SELECT done FROM run_task_state WHERE run_id=? AND task_id=?",
+            (run_id, task_id),
+        ).fetchone()
+        conn.execute(
+            """
+            INSERT INTO run_task_state(run_id, task_id, status, done, first_order_index, last_order_index, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(run_id, task_id) DO UPDATE SET
+              status=excluded.status,
+              done=MAX(run_task_state.done, excluded.done),
+              first_order_index=MIN(run_task_state.first_order_index, excluded.first_order_index),
+              last_order_index=MAX(run_task_state.last_order_index, excluded.last_order_index),
+              updated_at=excluded.updated_at
+            """,
+            (run_id, task_id, status, done, order_index, order_index, now),
+        )
+        newly_done = 1 if done and not (previous and previous["done"]) else 0
+        conn.execute(
+            """
+            UPDATE project_runs SET
+              task_run_count=MAX(task_run_count + 1, ?),
+              completed_count=completed_count + ?,
+              skipped_count=skipped_count + ?,
+              failed_count=failed_count + ?,
+              done_count=done_count + ?
+            WHERE run_id=?
+            """,
+            (
+                order_index,
+                1 if status == "completed" else 0,
+                1 if status == "skipped" else 0,
+                1 if status == "failed" else 0,
+                newly_done,
+                run_id,
+            ),
+        )
+
+    def _run_counters(self, conn: sqlite3.Connection, run_id: str) -> Dict[str, int]:
+        row = conn.execute(
+            """
+            SELECT task_run_count, completed_count, skipped_count, failed_count, done_count
+            FROM project_runs WHERE run_id=?
+            """,
+            (run_id,),
+        ).fetchone()
+        return {key: int(row[key]) for key in row.keys()} if row else {key: 0 for key in _RUN_COUNTER_COLUMNS}
+
+    def get_run_counters(self, run_id: str) -> Dict[str, int]:
+        with self._connect() as conn:
+            return self._run_counters(conn, run_id)
+
+    def get_run_task_states(self, run_id: str) -> Dict[str, Dict[str, Any]]:
+        """Current status per task of a run, keyed by task_id."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT task_id, status, done, first_order_index, last_order_index
+                FROM run_task_state WHERE run_id=?
+                """,
+                (run_id,),
+            ).fetchall()
+            return {str(row["task_id"]): dict(row) for row in rows}
+
+    def get_run_done_task_ids(self, run_id: str) -> set[str]:
+        """Task ids with at least one completed or skipped run."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT task_id FROM run_task_state WHERE run_id=? AND done=1",
+                (run_id,),
+            ).fetchall()
+            return {str(row["task_id"]) for row in rows}
 
     def list_task_runs(self, run_id: str, limit: int | None = None) -> List[Dict[str, Any]]:
         with self._connect() as conn:
@@ -525,7 +1171,81 @@ class Database:
             ).fetchall()
             return {str(row["host"]): int(row["c"]) for row in rows}
 
+    def list_expired_audit_events(
+        self,
+        default_cutoff: str,
+        cutoffs: Dict[str, str] | None = None,
+        after_event_id: int = 0,
+        limit: int = 5000,
+    ) -> List[Dict[str, Any]]:
+        """Audit rows created before their type's cutoff, oldest first.
+
+        ``cutoffs`` maps an event type, or a ``prefix*`` pattern, to an ISO
+        timestamp; exact types win over patterns, longer patterns over shorter.
+        Everything else uses ``default_cutoff``; an empty cutoff keeps rows forever.
+        """
+        cases: List[str] = []
+        params: List[Any] = []
+        ordered = sorted((cutoffs or {}).items(), key=lambda item: (item[0].endswith("*"), -len(item[0])))
+        for pattern, cutoff in ordered:
+            if pattern.endswith("*"):
+                cases.append("WHEN event_type LIKE ? ESCAPE '\\' THEN ?")
+                params.extend([_like_prefix(pattern[:-1]), cutoff])
+            else:
+                cases.append("WHEN event_type=? THEN ?")
+                params.extend([pattern, cutoff])
+        cutoff_sql = f"CASE {' '.join(cases)} ELSE ? END" if cases else "?"
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT event_id, project_id, route_id, event_type, payload_json, created_at
+                FROM audit_events
+                WHERE event_id > ? AND created_at < {cutoff_sql}
+                ORDER BY event_id ASC
+                LIMIT ?
+                """,
+                (after_event_id, *params, default_cutoff, limit),
+            ).fetchall()
+            return [dict(row) for row in rows]
+
+    def rollup_audit_events(self, rows: List[Dict[str, Any]]) -> None:
+        """Add ``rows`` to the daily rollup counts and delete them, in one transaction."""
+        counts: Dict[Tuple[str, str, str], int] = {}
+        for row in rows:
+            key = (str(row["created_at"])[:10], row["project_id"] or "", str(row["event_type"]))
+            counts[key] = counts.get(key, 0) + 1
+        now = utc_now().isoformat()
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO audit_rollups(day, project_id, event_type, event_count, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(day, project_id, event_type) DO UPDATE SET
+                  event_count=audit_rollups.event_count + excluded.event_count,
+                  updated_at=excluded.updated_at
+                """,
+                [(day, project_id, event_type, count, now) for (day, project_id, event_type), count in counts.items()],
+            )
+            conn.executemany("DELETE FROM audit_events WHERE event_id=?", [(row["event_id"],) for row in rows])
+
+    def list_audit_rollups(self, project_id: str | None = None, limit: int = 100) -> List[Dict[str, Any]]:
+        sql = "SELECT day, project_id, event_type, event_count FROM audit_rollups"
+        params: tuple[Any, ...] = ()
+        if project_id is not None:
+            sql += " WHERE project_id=?"
+            params = (project_id,)
+        sql += " ORDER BY day DESC, event_type ASC LIMIT ?"
+        with self._connect() as conn:
+            rows = conn.execute(sql, (*params, limit)).fetchall()
+            return [dict(row) for row in rows]
+
+    def checkpoint(self) -> None:
+        """Fold the WAL back into the main file so freed pages can be reused."""
+        with self._connect() as conn:
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
     def list_recent_audit_events(self, project_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        self.flush_audit()
         with self._connect() as conn:
             rows = conn.execute(
                 """
@@ -543,3 +1263,17 @@ class Database:
                 payload["payload_json"] = json.loads(payload["payload_json"])
                 out.append(payload)
             return out
+
+
+def _like_prefix(prefix: str) -> str:
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
+
+
+# Ordered schema steps; append new ones, never renumber. The tables in
+# _init_schema are the baseline every step runs against.
+_MIGRATIONS: Tuple[Tuple[int, str, Callable[[Database, sqlite3.Connection], None]], ...] = (
+    (1, "project_runs counters and run_task_state backfill", Database._migrate_run_counters),
+    (2, "secondary indexes", Database._migrate_secondary_indexes),
+    (3, "audit_rollups", Database._migrate_audit_rollups),
+)
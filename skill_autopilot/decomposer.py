@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Dict, List, Sequence
 from uuid import uuid4
 
+from .brief_analysis import analyze_brief
 from .models import BriefIntent, PodAssignment, SkillReason, TaskInstruction, TaskState
 from .pods import (
     CORE_POD,
@@ -31,14 +32,15 @@ def decompose_project(
 
     Returns the action plan dict stored in the database.
     """
+    analysis = analyze_brief(intent.raw_text)
     pods = select_pods(
-        intent_text=intent.raw_text,
+        intent_text=analysis,
         industry=intent.industry,
         pod_hints=intent.pod_hints,
     )
     kernels = select_kernels(
         industry=intent.industry,
-        intent_text=intent.raw_text,
+        intent_text=analysis,
     )
 
     # Build pod assignments for the plan metadata.
@@ -70,6 +70,23 @@ def _check_config(config_path: Path) -> List[CheckResult]:
     return results
 
 
+def _check_catalog_graph(config_path: Path) -> CheckResult:
+    try:
+        from .catalog import load_catalog_records
+        from .skill_graph import SkillGraph
+
+        cfg = load_config(config_path)
+        skills, _ = load_catalog_records(cfg.allowlisted_catalogs)
+        graph = SkillGraph(skills)
+    except Exception as exc:
+        return CheckResult("catalog_graph", False, False, f"{type(exc).__name__}: {exc}")
+    ok = not graph.cycles and not graph.missing_dependencies
+    detail = f"skills={len(graph.skill_ids)}, cycles={len(graph.cycles)}, missing_dependencies={len(graph.missing_dependencies)}"
+    if not ok:
+        detail += " " + json.dumps(graph.diagnostics(), sort_keys=True)
+    return CheckResult("catalog_graph", ok, False, detail)
+
+
 def _check_state_dirs(config_path: Path) -> List[CheckResult]:
     results: List[CheckResult] = []
     try:
@@ -113,6 +130,7 @@ def run_doctor(config_path: Path) -> List[CheckResult]:
     results: List[CheckResult] = []
     results.append(_check_python())
     results.extend(_check_config(config_path))
+    results.append(_check_catalog_graph(config_path))
     results.extend(_check_state_dirs(config_path))
     results.append(_check_mcp_health())
     results.append(_check_cli("claude", critical=False))
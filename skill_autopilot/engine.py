@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Lock
@@ -7,112 +8,138 @@ from typing import Dict, List, Optional
 from uuid import uuid4
 
 from .adapters import MockDesktopAdapter
-from .brief_parser import BriefValidationError, is_material_change, parse_brief
-from .catalog import load_catalog
+from .audit import AuditRetentionPolicy, compact_audit_events
+from .brief_parser import BriefValidationError, _resolve_brief_path, parse_brief
+from .catalog_service import CatalogService, CatalogSnapshot
 from .config import AppConfig
 from .db import Database
 from .decomposer import decompose_project
 from .executor import TaskStateMachine
+from .industry_classifier import build_industry_classifier, configure_industry_classifier
+from .intent_fingerprint import IntentFingerprint, fingerprint_intent, is_material_fingerprint_change
 from .lease_manager import LeaseManager
 from .models import (
     ApproveGateRequest,
     ApproveGateResponse,
+    BriefIntent,
     EndProjectRequest,
     EndProjectResponse,
     GetProjectStatusResponse,
     HealthResponse,
     HistoryEntry,
     ProjectState,
+    RouteResult,
     RoutingPolicy,
     StartProjectRequest,
     StartProjectResponse,
     TaskStatusResponse,
 )
+from .route_cache import RouteCache, route_cache_key
 from .router import route_skills
-from .utils import utc_now
+from .utils import sha256_hex, stat_fingerprint, utc_now
 from .watcher import BriefWatcherRegistry
 
+AUDIT_COMPACTION_INTERVAL_SECONDS = 3600.0
+
 
 class SkillAutopilotEngine:
     def __init__(self, config: AppConfig):
         self.config = config
-        self.db = Database(config.db_path)
+        self.db = Database(config.db_path, max_connections=config.db_max_connections)
+        if config.audit_queue_size > 0:
+            self.db.enable_audit_writer(
+                max_queue_size=config.audit_queue_size,
+                batch_size=config.audit_batch_size,
+                flush_interval_seconds=config.audit_flush_interval_seconds,
+            )
         state_dir = str(Path(config.db_path).expanduser().parent)
         self.adapters = self._build_adapters(state_dir=state_dir)
+        self.catalog = CatalogService(
+            config.allowlisted_catalogs,
+            index_path=str(Path(state_dir) / "catalog_index.json"),
+            parse_workers=config.catalog_parse_workers,
+            parse_executor=config.catalog_parse_executor,
+        )
+        configure_industry_classifier(
+            build_industry_classifier(
+                config.industry_classifier,
+                url=config.industry_classifier_url,
+                model=config.industry_classifier_model,
+                timeout=config.industry_classifier_budget_seconds,
+            ),
+            cache_path=str(Path(state_dir) / "industry_cache.json"),
+            budget_seconds=config.industry_classifier_budget_seconds,
+        )
         self.lease_manager = LeaseManager(db=self.db, adapters=self.adapters, ttl_hours=config.lease_ttl_hours)
         self.task_machine = TaskStateMachine(self.db)
-        self.watcher = BriefWatcherRegistry()
-        self._intent_cache: Dict[str, object] = {}
+        self.watcher = BriefWatcherRegistry(
+            backend=config.watcher_backend,
+            poll_interval_seconds=config.watcher_poll_interval_seconds,
+            poll_batch_size=config.watcher_poll_batch_size,
+        )
         self._lock = Lock()
         self._last_snapshot_hash: Optional[str] = None
+        self.audit_retention = AuditRetentionPolicy(config.audit_retention_days, dict(config.audit_retention_overrides))
+        self.audit_archive_dir = str(Path(state_dir) / "audit_archive")
+        self._audit_lock = Lock()
+        self._last_audit_compaction: float | None = None
+        self.route_cache = RouteCache(self.db)
 
     def start_project(self, request: StartProjectRequest) -> StartProjectResponse:
         with self._lock:
             project_id = str(uuid4())
+            brief_stat = _brief_stat(request.brief_path)
             intent, brief_hash = parse_brief(request.brief_path)
-            skills, snapshot_hash = load_catalog(self.config.allowlisted_catalogs)
-            self._last_snapshot_hash = snapshot_hash
-
-            policy = RoutingPolicy(
-                max_active_skills=self.config.max_active_skills,
-                lease_ttl_hours=self.config.lease_ttl_hours,
-                min_relevance_score=self.config.min_relevance_score,
-                max_utility_skills=self.config.max_utility_skills,
-                max_skills_per_cluster=self.config.max_skills_per_cluster,
-                utility_penalty=self.config.utility_penalty,
-                preferred_sources=self.config.preferred_sources,
-                preferred_source_bonus=self.config.preferred_source_bonus,
-            )
-            route = route_skills(
-                intent=intent,
-                catalog=skills,
-                host_targets=request.host_targets,
-                policy=policy,
-                snapshot_hash=snapshot_hash,
-            )
+            catalog = self.catalog.snapshot()
+            self._last_snapshot_hash = catalog.snapshot_hash
+
+            route = self._route(intent, request.host_targets, catalog)
 
             plan_payload = decompose_project(intent, route.selected_skills)
             plan_id = str(uuid4())
-
-            self.db.upsert_project(
-                project_id=project_id,
-                workspace_path=request.workspace_path,
-                brief_path=request.brief_path,
-                state=ProjectState.ACTIVE.value,
-            )
-            self.db.insert_route(
-                route_id=route.route_id,
-                project_id=project_id,
-                brief_hash=brief_hash,
-                plan_hash=route.plan_hash,
-                snapshot_hash=route.snapshot_hash,
-                selected_skills=[item.model_dump() for item in route.selected_skills],
-                rejected_skills=[item.model_dump() for item in route.rejected_skills],
-            )
-            self.db.insert_plan(plan_id=plan_id, project_id=project_id, route_id=route.route_id, plan_json=plan_payload)
-            self.lease_manager.activate_project_skills(
+            lease_change = self.lease_manager.prepare_activation(
                 project_id=project_id,
                 hosts=request.host_targets,
                 selected_skills=route.selected_skills,
             )
 
-            self._intent_cache[project_id] = intent
-            self.db.add_audit_event(
-                event_type="project.start",
-                project_id=project_id,
-                route_id=route.route_id,
-                payload={
-                    "workspace_path": request.workspace_path,
-                    "brief_path": request.brief_path,
-                    "host_targets": request.host_targets,
-                    "selected_skill_count": len(route.selected_skills),
-                    "rejected_skill_count": len(route.rejected_skills),
-                    "industry": intent.industry,
-                    "project_type": intent.project_type,
-                    "pod_count": len(plan_payload.get("pods", [])),
-                    "kernel_count": len(plan_payload.get("kernels", [])),
-                },
-            )
+            with self.db.transaction():
+                self.db.upsert_project(
+                    project_id=project_id,
+                    workspace_path=request.workspace_path,
+                    brief_path=request.brief_path,
+                    state=ProjectState.ACTIVE.value,
+                )
+                self.db.insert_route(
+                    route_id=route.route_id,
+                    project_id=project_id,
+                    brief_hash=brief_hash,
+                    plan_hash=route.plan_hash,
+                    snapshot_hash=route.snapshot_hash,
+                    selected_skills=[item.model_dump() for item in route.selected_skills],
+                    rejected_skills=[item.model_dump() for item in route.rejected_skills],
+                )
+                self.db.insert_plan(plan_id=plan_id, project_id=project_id, route_id=route.route_id, plan_json=plan_payload)
+                self.lease_manager.record(lease_change)
+
+                self._store_fingerprint(project_id, fingerprint_intent(intent))
+                self._store_brief_stat(project_id, brief_stat)
+                self.db.add_audit_event(
+                    event_type="project.start",
+                    project_id=project_id,
+                    route_id=route.route_id,
+                    payload={
+                        "workspace_path": request.workspace_path,
+                        "brief_path": request.brief_path,
+                        "host_targets": request.host_targets,
+                        "selected_skill_count": len(route.selected_skills),
+                        "rejected_skill_count": len(route.rejected_skills),
+                        "industry": intent.industry,
+                        "project_type": intent.project_type,
+                        "pod_count": len(plan_payload.get("pods", [])),
+                        "kernel_count": len(plan_payload.get("kernels", [])),
+                    },
+                )
 
             self._attach_watcher(project_id, request)
 
@@ -141,15 +168,21 @@ class SkillAutopilotEngine:
                 host_targets=self._active_hosts(project_id),
             )
 
+            brief_stat = _brief_stat(request.brief_path)
             new_intent, brief_hash = parse_brief(request.brief_path)
-            old_intent = self._intent_cache.get(project_id)
-            material = True if old_intent is None else is_material_change(old_intent, new_intent)
-            if not force and old_intent is not None and not material:
-                self.db.add_audit_event(
-                    event_type="project.reroute.skipped",
-                    project_id=project_id,
-                    payload={"reason": "non_material_change"},
-                )
+            new_fingerprint = fingerprint_intent(new_intent)
+            old_fingerprint = self._load_fingerprint(project_id)
+            material = (
+                True if old_fingerprint is None else is_material_fingerprint_change(old_fingerprint, new_fingerprint)
+            )
+            if not force and old_fingerprint is not None and not material:
+                with self.db.transaction():
+                    self._store_brief_stat(project_id, brief_stat)
+                    self.db.add_audit_event(
+                        event_type="project.reroute.skipped",
+                        project_id=project_id,
+                        payload={"reason": "non_material_change"},
+                    )
                 route = self.db.get_latest_route(project_id)
                 plan = self.db.get_latest_plan(project_id)
                 return {
@@ -160,57 +193,43 @@ class SkillAutopilotEngine:
                     "latest_plan_id": plan["plan_id"] if plan else None,
                 }
 
-            skills, snapshot_hash = load_catalog(self.config.allowlisted_catalogs)
-            self._last_snapshot_hash = snapshot_hash
-            route = route_skills(
-                intent=new_intent,
-                catalog=skills,
-                host_targets=request.host_targets,
-                policy=RoutingPolicy(
-                    max_active_skills=self.config.max_active_skills,
-                    lease_ttl_hours=self.config.lease_ttl_hours,
-                    min_relevance_score=self.config.min_relevance_score,
-                    max_utility_skills=self.config.max_utility_skills,
-                    max_skills_per_cluster=self.config.max_skills_per_cluster,
-                    utility_penalty=self.config.utility_penalty,
-                    preferred_sources=self.config.preferred_sources,
-                    preferred_source_bonus=self.config.preferred_source_bonus,
-                ),
-                snapshot_hash=snapshot_hash,
-            )
+            catalog = self.catalog.snapshot()
+            self._last_snapshot_hash = catalog.snapshot_hash
+            route = self._route(new_intent, request.host_targets, catalog)
 
             plan_payload = decompose_project(new_intent, route.selected_skills)
             plan_id = str(uuid4())
-
-            self.db.insert_route(
-                route_id=route.route_id,
-                project_id=project_id,
-                brief_hash=brief_hash,
-                plan_hash=route.plan_hash,
-                snapshot_hash=route.snapshot_hash,
-                selected_skills=[item.model_dump() for item in route.selected_skills],
-                rejected_skills=[item.model_dump() for item in route.rejected_skills],
-            )
-            self.db.insert_plan(plan_id=plan_id, project_id=project_id, route_id=route.route_id, plan_json=plan_payload)
-
             # Replace leases to reflect rerouted skill set.
-            self.lease_manager.activate_project_skills(
+            lease_change = self.lease_manager.prepare_activation(
                 project_id=project_id,
                 hosts=request.host_targets,
                 selected_skills=route.selected_skills,
             )
 
-            self._intent_cache[project_id] = new_intent
-            self.db.add_audit_event(
-                event_type="project.reroute.applied",
-                project_id=project_id,
-                route_id=route.route_id,
-                payload={
-                    "plan_id": plan_id,
-                    "selected_skill_count": len(route.selected_skills),
-                    "reason": "forced" if force else ("material_change" if material else "initial_cache_miss"),
-                },
-            )
+            with self.db.transaction():
+                self.db.insert_route(
+                    route_id=route.route_id,
+                    project_id=project_id,
+                    brief_hash=brief_hash,
+                    plan_hash=route.plan_hash,
+                    snapshot_hash=route.snapshot_hash,
+                    selected_skills=[item.model_dump() for item in route.selected_skills],
+                    rejected_skills=[item.model_dump() for item in route.rejected_skills],
+                )
+                self.db.insert_plan(plan_id=plan_id, project_id=project_id, route_id=route.route_id, plan_json=plan_payload)
+                self.lease_manager.record(lease_change)
+                self._store_fingerprint(project_id, new_fingerprint)
+                self._store_brief_stat(project_id, brief_stat)
+                self.db.add_audit_event(
+                    event_type="project.reroute.applied",
+                    project_id=project_id,
+                    route_id=route.route_id,
+                    payload={
+                        "plan_id": plan_id,
+                        "selected_skill_count": len(route.selected_skills),
+                        "reason": "forced" if force else ("material_change" if material else "initial_cache_miss"),
+                    },
+                )
             return {
                 "project_id": project_id,
                 "rerouted": True,
@@ -225,14 +244,18 @@ class SkillAutopilotEngine:
 
     def end_project(self, request: EndProjectRequest) -> EndProjectResponse:
         with self._lock:
-            self.db.set_project_state(request.project_id, ProjectState.CLOSING.value)
-            response = self.lease_manager.deactivate_project(project_id=request.project_id, reason=request.reason.value)
-            self._finalize_running_runs_on_close(project_id=request.project_id, reason=request.reason.value)
-            ended = response.status in {"closed", "partial_close"}
-            state = ProjectState.CLOSED.value if ended else ProjectState.ERROR.value
-            self.db.set_project_state(request.project_id, state, ended=ended)
             self.watcher.remove(request.project_id)
-            self._intent_cache.pop(request.project_id, None)
+            self.db.set_project_state(request.project_id, ProjectState.CLOSING.value)
+            lease_change = self.lease_manager.prepare_deactivation(project_id=request.project_id, reason=request.reason.value)
+            response = lease_change.response
+            with self.db.transaction():
+                self.lease_manager.record(lease_change)
+                self._finalize_running_runs_on_close(project_id=request.project_id, reason=request.reason.value)
+                ended = response.status in {"closed", "partial_close"}
+                state = ProjectState.CLOSED.value if ended else ProjectState.ERROR.value
+                self.db.set_project_state(request.project_id, state, ended=ended)
+                self.db.delete_intent_fingerprint(request.project_id)
+                self.db.delete_brief_stat(request.project_id)
             return response
 
     def approve_gate(self, request: ApproveGateRequest) -> ApproveGateResponse:
@@ -404,6 +427,7 @@ class SkillAutopilotEngine:
             "active_project_count": len(items),
             "stale_project_count": stale_count,
             "progressing_project_count": progressing_count,
+            "audit_writer": self.db.audit_writer.metrics() if self.db.audit_writer else None,
             "items": items,
         }
 
@@ -436,6 +460,7 @@ class SkillAutopilotEngine:
                 for item in tasks
             ],
             "recent_audit_events": audits,
+            "audit_rollups": self.db.list_audit_rollups(project_id, limit=30),
             "approvals": approvals,
             "active_leases": leases,
             "active_leases_by_host": self.db.count_active_leases_by_host(project_id),
@@ -476,9 +501,30 @@ class SkillAutopilotEngine:
         expired_project_ids = self.lease_manager.sweep_expired_leases()
         for project_id in expired_project_ids:
             self.watcher.remove(project_id)
-            self._intent_cache.pop(project_id, None)
+            with self.db.transaction():
+                self.db.delete_intent_fingerprint(project_id)
+                self.db.delete_brief_stat(project_id)
         return expired_project_ids
 
+    def compact_audit_events(self) -> Dict[str, object]:
+        """Apply the audit retention policy now (archive, roll up, delete)."""
+        with self._audit_lock:
+            self._last_audit_compaction = time.monotonic()
+            result = compact_audit_events(self.db, self.audit_retention, self.audit_archive_dir)
+        if result["archived"]:
+            self.db.add_audit_event(
+                event_type="audit.compacted",
+                payload={"archived": result["archived"], "segments": len(result["segments"])},
+            )
+        return result
+
+    def maybe_compact_audit_events(self) -> Dict[str, object] | None:
+        """``compact_audit_events`` at most once per ``AUDIT_COMPACTION_INTERVAL_SECONDS``."""
+        last = self._last_audit_compaction
+        if last is not None and time.monotonic() - last < AUDIT_COMPACTION_INTERVAL_SECONDS:
+            return None
+        return self.compact_audit_events()
+
     def _attach_watcher(self, project_id: str, request: StartProjectRequest) -> None:
         if not self.watcher.supports_watch():
             self.db.add_audit_event(
@@ -490,6 +536,13 @@ class SkillAutopilotEngine:
 
         def _callback() -> None:
             try:
+                if self._brief_unchanged(project_id, request.brief_path):
+                    self.db.add_audit_event(
+                        event_type="watcher.trigger",
+                        project_id=project_id,
+                        payload={"rerouted": False, "reason": "unchanged_content"},
+                    )
+                    return
                 rerouted = self.reroute_if_material_change(project_id)
                 self.db.add_audit_event(
                     event_type="watcher.trigger",
@@ -503,7 +556,88 @@ class SkillAutopilotEngine:
                     payload={"error": str(exc)},
                 )
 
-        self.watcher.add(project_id=project_id, brief_path=request.brief_path, callback=_callback)
+        backend = self.watcher.add(project_id=project_id, brief_path=request.brief_path, callback=_callback)
+        if backend is None:
+            self.db.add_audit_event(
+                event_type="watcher.disabled",
+                project_id=project_id,
+                payload={"reason": "watch_unavailable"},
+            )
+
+    def _brief_unchanged(self, project_id: str, brief_path: str) -> bool:
+        """Cheap pre-parse check for watcher events, run outside the engine lock.
+
+        The stat tuple is compared first; if it moved (touch, rewrite, rename
+        over the file) the stripped content is hashed and compared with the
+        digest of the last parsed brief. Anything else goes to a full reroute.
+        """
+        stat = _brief_stat(brief_path)
+        if stat is None:
+            return False
+        if self.db.get_brief_stat(project_id) == stat:
+            return True
+        fingerprint = self.db.get_intent_fingerprint(project_id)
+        if fingerprint is None:
+            return False
+        try:
+            text = _resolve_brief_path(brief_path).read_text(encoding="utf-8").strip()
+        except (OSError, UnicodeDecodeError):
+            return False
+        if sha256_hex(text) != fingerprint["text_digest"]:
+            return False
+        self._store_brief_stat(project_id, stat)
+        return True
+
+    def _store_brief_stat(self, project_id: str, stat: tuple[int, int, int] | None) -> None:
+        if stat is None:
+            self.db.delete_brief_stat(project_id)
+            return
+        self.db.upsert_brief_stat(project_id, *stat)
+
+    def _load_fingerprint(self, project_id: str) -> IntentFingerprint | None:
+        row = self.db.get_intent_fingerprint(project_id)
+        return IntentFingerprint.from_row(row) if row else None
+
+    def _store_fingerprint(self, project_id: str, fingerprint: IntentFingerprint) -> None:
+        self.db.upsert_intent_fingerprint(
+            project_id=project_id,
+            risk_tier=fingerprint.risk_tier,
+            evidence_level=fingerprint.evidence_level,
+            text_digest=fingerprint.text_digest,
+            word_count=fingerprint.word_count,
+            sketch=fingerprint.sketch_bytes(),
+        )
+
+    def _routing_policy(self) -> RoutingPolicy:
+        return RoutingPolicy(
+            max_active_skills=self.config.max_active_skills,
+            lease_ttl_hours=self.config.lease_ttl_hours,
+            min_relevance_score=self.config.min_relevance_score,
+            max_utility_skills=self.config.max_utility_skills,
+            max_skills_per_cluster=self.config.max_skills_per_cluster,
+            utility_penalty=self.config.utility_penalty,
+            preferred_sources=self.config.preferred_sources,
+            preferred_source_bonus=self.config.preferred_source_bonus,
+        )
+
+    def _route(self, intent: BriefIntent, host_targets: List[str], catalog: CatalogSnapshot) -> RouteResult:
+        policy = self._routing_policy()
+        cache_key = route_cache_key(intent, catalog.snapshot_hash, policy, host_targets)
+        route = self.route_cache.get(cache_key)
+        if route is not None:
+            return route
+        route = route_skills(
+            intent=intent,
+            catalog=catalog.skills,
+            host_targets=host_targets,
+            policy=policy,
+            snapshot_hash=catalog.snapshot_hash,
+            index=catalog.routing_index,
+            backend=self.config.routing_backend,
+            graph=catalog.skill_graph,
+        )
+        self.route_cache.put(cache_key, route)
+        return route
 
     def _active_hosts(self, project_id: str) -> List[str]:
         leases = self.db.get_active_leases(project_id=project_id)
@@ -537,6 +671,12 @@ class SkillAutopilotEngine:
         }
 
 
+def _brief_stat(brief_path: str) -> tuple[int, int, int] | None:
+    # Taken before the brief is read, so a write racing the parse leaves a stale
+    # stat behind and the next event is re-checked rather than skipped.
+    return stat_fingerprint(str(_resolve_brief_path(brief_path)))
+
+
 def _parse_dt(value: object) -> datetime | None:
     if not value:
         return None
@@ -6,7 +6,11 @@ Claude Desktop works through tasks via sa_next_task / sa_complete_task MCP calls
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import copy
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from uuid import uuid4
 
 from .db import Database
@@ -16,6 +20,98 @@ from .utils import utc_now
 
 PHASE_ORDER = ["discovery", "build", "verify", "ship"]
 
+# Gate that must be approved before a phase starts.
+_PHASE_GATE_IDS = {
+    "build": "gate-1",     # Discovery must be reviewed before build.
+    "ship": "gate-2",      # Quality must be checked before ship.
+}
+
+# Gate that is auto-approved once every task of a phase is done.
+_GATE_PHASES = {
+    "gate-1": "discovery",
+    "gate-2": "verify",
+}
+
+
+@dataclass(frozen=True)
+class CompiledPlan:
+    """A parsed plan with the lookups the state machine needs precomputed.
+
+    Plans are immutable once inserted, so one of these is built per ``plan_id``
+    and shared; callers must not mutate the task dicts.
+    """
+
+    plan_id: str
+    phases: Tuple[Tuple[str, Tuple[Dict[str, object], ...]], ...]
+    task_index: Dict[str, Tuple[str, int]]
+    phase_task_ids: Dict[str, FrozenSet[str]]
+    phase_gates: Dict[str, Dict[str, object] | None]
+    total_tasks: int
+
+    @classmethod
+    def compile(cls, plan_id: str, plan: Dict[str, object]) -> "CompiledPlan":
+        gates = list(plan.get("gates", []))  # type: ignore[arg-type]
+        phases: List[Tuple[str, Tuple[Dict[str, object], ...]]] = []
+        task_index: Dict[str, Tuple[str, int]] = {}
+        phase_task_ids: Dict[str, set] = {}
+        phase_gates: Dict[str, Dict[str, object] | None] = {}
+        for phase in plan.get("phases", []):  # type: ignore[union-attr]
+            phase_name = str(phase.get("name", "build"))
+            tasks = tuple(phase.get("tasks", []))
+            phases.append((phase_name, tasks))
+            phase_gates.setdefault(phase_name, _phase_gate(phase_name, gates))
+            ids = phase_task_ids.setdefault(phase_name, set())
+            for position, task in enumerate(tasks):
+                task_id = str(task.get("task_id"))
+                ids.add(task_id)
+                task_index.setdefault(task_id, (phase_name, position))
+        return cls(
+            plan_id=plan_id,
+            phases=tuple(phases),
+            task_index=task_index,
+            phase_task_ids={name: frozenset(ids) for name, ids in phase_task_ids.items()},
+            phase_gates=phase_gates,
+            total_tasks=sum(len(tasks) for _, tasks in phases),
+        )
+
+    def first_pending(self, done_ids: FrozenSet[str] | set) -> Tuple[str, Dict[str, object]] | None:
+        for phase_name, tasks in self.phases:
+            for task in tasks:
+                if str(task.get("task_id", "")) not in done_ids:
+                    return phase_name, task
+        return None
+
+
+class PlanCache:
+    """LRU of ``CompiledPlan`` keyed by ``plan_id``."""
+
+    def __init__(self, db: Database, max_entries: int = 64):
+        self.db = db
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CompiledPlan]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, plan_id: str) -> CompiledPlan | None:
+        with self._lock:
+            compiled = self._entries.get(plan_id)
+            if compiled is not None:
+                self._entries.move_to_end(plan_id)
+                return compiled
+        plan_row = self.db.get_plan(plan_id)
+        if not plan_row:
+            return None
+        compiled = CompiledPlan.compile(plan_id, plan_row["plan_json"])
+        with self._lock:
+            self._entries[plan_id] = compiled
+            self._entries.move_to_end(plan_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def latest(self, project_id: str) -> CompiledPlan | None:
+        plan_id = self.db.get_latest_plan_id(project_id)
+        return self.get(plan_id) if plan_id else None
+
 
 class TaskStateMachine:
     """Manages task lifecycle for a project run.
@@ -23,39 +119,38 @@ class TaskStateMachine:
     Tasks flow: pending → active → completed/skipped/failed.
     """
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, plan_cache_size: int = 64):
         self.db = db
+        self.plans = PlanCache(db, max_entries=plan_cache_size)
 
     def start_run(self, project_id: str, plan_id: str, route_id: str | None = None) -> str:
         """Create a new project run and initialize task records from the plan."""
-        run_id = str(uuid4())
-        plan_row = self.db.get_plan(plan_id)
-        if not plan_row:
-            raise KeyError(f"plan_id not found: {plan_id}")
-
-        plan = plan_row["plan_json"]
-        phases = plan.get("phases", [])
-        total_tasks = sum(len(phase.get("tasks", [])) for phase in phases)
-
-        self.db.create_project_run(
-            run_id=run_id,
-            project_id=project_id,
-            route_id=route_id,
-            plan_id=plan_id,
-        )
-        self.db.update_project_run(
-            run_id,
-            "running",
-            {
-                "planned_tasks": total_tasks,
-                "executed_tasks": 0,
-                "failed_tasks": 0,
-                "current_phase": "pending",
-                "pending_gates": [],
-            },
-            ended=False,
-        )
-        return run_id
+        with self.db.transaction():
+            run_id = str(uuid4())
+            compiled = self.plans.get(plan_id)
+            if compiled is None:
+                raise KeyError(f"plan_id not found: {plan_id}")
+            total_tasks = compiled.total_tasks
+
+            self.db.create_project_run(
+                run_id=run_id,
+                project_id=project_id,
+                route_id=route_id,
+                plan_id=plan_id,
+            )
+            self.db.update_project_run(
+                run_id,
+                "running",
+                {
+                    "planned_tasks": total_tasks,
+                    "executed_tasks": 0,
+                    "failed_tasks": 0,
+                    "current_phase": "pending",
+                    "pending_gates": [],
+                },
+                ended=False,
+            )
+            return run_id
 
     def task_checklist(self, project_id: str, current_task_id: str | None = None) -> Dict[str, object]:
         """Return all tasks across all phases with completion status.
@@ -65,30 +160,27 @@ class TaskStateMachine:
           - marker: "[x]", "[~]", "[→]", "[ ]", "[!]"
         Also returns a formatted text block for easy display.
         """
-        plan_row = self.db.get_latest_plan(project_id)
-        if not plan_row:
+        compiled = self.plans.latest(project_id)
+        if compiled is None:
             return {"phases": [], "text": "No plan found."}
 
-        plan = plan_row["plan_json"]
         run = self.db.get_latest_project_run(project_id)
 
-        # Build status map from task runs.
+        # Latest status per task, from the materialized run state.
         status_map: Dict[str, str] = {}
         if run:
-            task_runs = self.db.list_task_runs(run["run_id"], limit=500)
-            for tr in task_runs:
-                status_map[tr["task_id"]] = tr.get("status", "completed")
+            for task_id, state in self.db.get_run_task_states(run["run_id"]).items():
+                status_map[task_id] = str(state.get("status") or "completed")
 
         phases_out: List[Dict[str, object]] = []
         lines: List[str] = []
         found_current = False
 
-        for phase in plan.get("phases", []):
-            phase_name = str(phase.get("name", "build"))
+        for phase_name, tasks in compiled.phases:
             phase_tasks: List[Dict[str, object]] = []
 
             # Check if phase is gated.
-            gate = self._phase_gate(phase_name, plan.get("gates", []))
+            gate = compiled.phase_gates.get(phase_name)
             phase_blocked = False
             if gate:
                 gate_id = str(gate.get("gate_id"))
@@ -97,7 +189,7 @@ class TaskStateMachine:
 
             lines.append(f"\n## {phase_name.title()}")
 
-            for task in phase.get("tasks", []):
+            for task in tasks:
                 task_id = str(task.get("task_id", ""))
                 title = str(task.get("title", task_id))
                 db_status = status_map.get(task_id)
@@ -130,7 +222,7 @@ class TaskStateMachine:
             phases_out.append({"phase": phase_name, "tasks": phase_tasks})
 
         # Summary line.
-        total = sum(len(p["tasks"]) for p in phases_out)
+        total = compiled.total_tasks
         done = sum(1 for p in phases_out for t in p["tasks"] if t["status"] in ("completed", "skipped"))
         lines.insert(0, f"# Task Progress: {done}/{total} complete")
 
@@ -146,60 +238,50 @@ class TaskStateMachine:
 
         Returns None if all tasks are completed or the project has no plan.
         """
-        plan_row = self.db.get_latest_plan(project_id)
-        if not plan_row:
+        compiled = self.plans.latest(project_id)
+        if compiled is None:
             return None
 
-        plan = plan_row["plan_json"]
         run = self.db.get_latest_project_run(project_id)
-        completed_ids = set()
-        if run:
-            task_runs = self.db.list_task_runs(run["run_id"], limit=500)
-            completed_ids = {
-                tr["task_id"]
-                for tr in task_runs
-                if tr.get("status") in ("completed", "skipped")
-            }
+        completed_ids = self.db.get_run_done_task_ids(run["run_id"]) if run else set()
 
-        # Walk phases in order, find first pending task.
-        for phase in plan.get("phases", []):
-            phase_name = phase.get("name", "build")
-            for task in phase.get("tasks", []):
-                task_id = str(task.get("task_id", ""))
-                if task_id in completed_ids:
-                    continue
-
-                # Check gate: is the previous phase's gate approved?
-                gate = self._phase_gate(phase_name, plan.get("gates", []))
-                if gate:
-                    gate_id = str(gate.get("gate_id"))
-                    if not self.db.is_gate_approved(project_id, gate_id):
-                        return {
-                            "status": "blocked",
-                            "blocked_by_gate": gate_id,
-                            "gate_criteria": gate.get("criteria", []),
-                            "message": f"Phase '{phase_name}' is blocked by gate '{gate_id}'. Approve it to continue.",
-                            "checklist": self.task_checklist(project_id, task_id),
-                        }
-
-                return {
-                    "status": "ready",
-                    "task": task,
-                    "phase": phase_name,
-                    "progress": {
-                        "completed": len(completed_ids),
-                        "total": sum(len(p.get("tasks", [])) for p in plan.get("phases", [])),
-                        "current_phase": phase_name,
-                    },
-                    "checklist": self.task_checklist(project_id, task_id),
-                }
+        # First pending task in phase order.
+        pending = compiled.first_pending(completed_ids)
+        if pending is not None:
+            phase_name, task = pending
+            task_id = str(task.get("task_id", ""))
+
+            # Check gate: is the previous phase's gate approved?
+            gate = compiled.phase_gates.get(phase_name)
+            if gate:
+                gate_id = str(gate.get("gate_id"))
+                if not self.db.is_gate_approved(project_id, gate_id):
+                    return {
+                        "status": "blocked",
+                        "blocked_by_gate": gate_id,
+                        "gate_criteria": gate.get("criteria", []),
+                        "message": f"Phase '{phase_name}' is blocked by gate '{gate_id}'. Approve it to continue.",
+                        "checklist": self.task_checklist(project_id, task_id),
+                    }
+
+            return {
+                "status": "ready",
+                "task": copy.deepcopy(task),
+                "phase": phase_name,
+                "progress": {
+                    "completed": len(completed_ids),
+                    "total": compiled.total_tasks,
+                    "current_phase": phase_name,
+                },
+                "checklist": self.task_checklist(project_id, task_id),
+            }
 
         # All tasks done.
         return {
             "status": "all_complete",
             "progress": {
                 "completed": len(completed_ids),
-                "total": sum(len(p.get("tasks", [])) for p in plan.get("phases", [])),
+                "total": compiled.total_tasks,
             },
             "checklist": self.task_checklist(project_id),
         }
@@ -213,47 +295,47 @@ class TaskStateMachine:
         evidence: Dict[str, object] | None = None,
     ) -> Dict[str, object]:
         """Mark a task as completed and return the next task."""
-        run = self.db.get_latest_project_run(project_id)
-        if not run:
-            raise KeyError(f"No active run for project {project_id}")
-
-        self.db.insert_task_run(
-            task_run_id=str(uuid4()),
-            run_id=run["run_id"],
-            project_id=project_id,
-            phase=self._task_phase(project_id, task_id),
-            task_id=task_id,
-            title=summary or task_id,
-            agent_role="claude_desktop",
-            status="completed",
-            output={
-                "summary": summary,
-                "artifacts": artifacts or [],
-                "evidence": evidence or {},
-            },
-            order_index=self._next_order_index(run["run_id"]),
-        )
-
-        # Update run summary.
-        self._update_run_summary(run["run_id"], project_id)
-
-        # Auto-approve gates if we finished a phase.
-        self._auto_approve_phase_gates(project_id, task_id)
-
-        # Get next task.
-        next_task = self.next_task(project_id)
-
-        # If all complete, mark run as completed.
-        if next_task and next_task.get("status") == "all_complete":
-            summary_data = run.get("summary_json") or {}
-            summary_data = dict(summary_data)
-            summary_data["finished_at"] = utc_now().isoformat()
-            self.db.update_project_run(run["run_id"], "completed", summary_data, ended=True)
-
-        return {
-            "completed_task_id": task_id,
-            "next": next_task,
-        }
+        with self.db.transaction():
+            run = self.db.get_latest_project_run(project_id)
+            if not run:
+                raise KeyError(f"No active run for project {project_id}")
+
+            counters = self.db.record_task_run(
+                task_run_id=str(uuid4()),
+                run_id=run["run_id"],
+                project_id=project_id,
+                phase=self._task_phase(project_id, task_id),
+                task_id=task_id,
+                title=summary or task_id,
+                agent_role="claude_desktop",
+                status="completed",
+                output={
+                    "summary": summary,
+                    "artifacts": artifacts or [],
+                    "evidence": evidence or {},
+                },
+            )
+
+            # Update run summary.
+            self._update_run_summary(run["run_id"], project_id, counters)
+
+            # Auto-approve gates if we finished a phase.
+            self._auto_approve_phase_gates(project_id, task_id)
+
+            # Get next task.
+            next_task = self.next_task(project_id)
+
+            # If all complete, mark run as completed.
+            if next_task and next_task.get("status") == "all_complete":
+                summary_data = run.get("summary_json") or {}
+                summary_data = dict(summary_data)
+                summary_data["finished_at"] = utc_now().isoformat()
+                self.db.update_project_run(run["run_id"], "completed", summary_data, ended=True)
+
+            return {
+                "completed_task_id": task_id,
+                "next": next_task,
+            }
 
     def skip_task(
         self,
@@ -262,65 +344,131 @@ class TaskStateMachine:
         reason: str = "",
     ) -> Dict[str, object]:
         """Mark a task as skipped and return the next task."""
+        with self.db.transaction():
+            run = self.db.get_latest_project_run(project_id)
+            if not run:
+                raise KeyError(f"No active run for project {project_id}")
+
+            counters = self.db.record_task_run(
+                task_run_id=str(uuid4()),
+                run_id=run["run_id"],
+                project_id=project_id,
+                phase=self._task_phase(project_id, task_id),
+                task_id=task_id,
+                title=f"Skipped: {reason}" if reason else f"Skipped: {task_id}",
+                agent_role="claude_desktop",
+                status="skipped",
+                output={"reason": reason},
+            )
+            self._update_run_summary(run["run_id"], project_id, counters)
+            return {
+                "skipped_task_id": task_id,
+                "reason": reason,
+                "next": self.next_task(project_id),
+            }
+
+    def complete_tasks(self, project_id: str, items: List[Dict[str, object]]) -> Dict[str, object]:
+        """Mark several tasks completed in one transaction and return the next task once.
+
+        Each item takes ``task_id`` plus optional ``summary``, ``artifacts`` and
+        ``evidence``. Items naming a task that is not in the plan fail on their
+        own; the rest are applied. Gates and the next task are evaluated once.
+        """
+        with self.db.transaction():
+            run, results, rows = self._prepare_batch(project_id, items, status="completed")
+            if rows:
+                counters = self.db.record_task_runs(run["run_id"], project_id, rows)
+                self._update_run_summary(run["run_id"], project_id, counters)
+                self._auto_approve_phase_gates(project_id, str(rows[-1]["task_id"]))
+
+            next_task = self.next_task(project_id)
+            if rows and next_task and next_task.get("status") == "all_complete":
+                summary_data = dict(run.get("summary_json") or {})
+                summary_data["finished_at"] = utc_now().isoformat()
+                self.db.update_project_run(run["run_id"], "completed", summary_data, ended=True)
+
+            return {
+                "completed_task_ids": [row["task_id"] for row in rows],
+                "results": results,
+                "next": next_task,
+            }
+
+    def skip_tasks(self, project_id: str, items: List[Dict[str, object]]) -> Dict[str, object]:
+        """Skip several tasks in one transaction; items take ``task_id`` and optional ``reason``."""
+        with self.db.transaction():
+            run, results, rows = self._prepare_batch(project_id, items, status="skipped")
+            if rows:
+                counters = self.db.record_task_runs(run["run_id"], project_id, rows)
+                self._update_run_summary(run["run_id"], project_id, counters)
+            return {
+                "skipped_task_ids": [row["task_id"] for row in rows],
+                "results": results,
+                "next": self.next_task(project_id),
+            }
+
+    def _prepare_batch(
+        self, project_id: str, items: List[Dict[str, object]], status: str
+    ) -> Tuple[Dict[str, object], List[Dict[str, object]], List[Dict[str, object]]]:
         run = self.db.get_latest_project_run(project_id)
         if not run:
             raise KeyError(f"No active run for project {project_id}")
-
-        self.db.insert_task_run(
-            task_run_id=str(uuid4()),
-            run_id=run["run_id"],
-            project_id=project_id,
-            phase=self._task_phase(project_id, task_id),
-            task_id=task_id,
-            title=f"Skipped: {reason}" if reason else f"Skipped: {task_id}",
-            agent_role="claude_desktop",
-            status="skipped",
-            output={"reason": reason},
-            order_index=self._next_order_index(run["run_id"]),
-        )
-        self._update_run_summary(run["run_id"], project_id)
-        return {
-            "skipped_task_id": task_id,
-            "reason": reason,
-            "next": self.next_task(project_id),
-        }
+        compiled = self.plans.latest(project_id)
+
+        results: List[Dict[str, object]] = []
+        rows: List[Dict[str, object]] = []
+        for item in items:
+            task_id = str(item.get("task_id") or "")
+            if compiled is None or task_id not in compiled.task_index:
+                results.append({"task_id": task_id, "status": "error", "error": "unknown task_id"})
+                continue
+            if status == "completed":
+                summary = str(item.get("summary") or "")
+                title = summary or task_id
+                output: Dict[str, object] = {
+                    "summary": summary,
+                    "artifacts": list(item.get("artifacts") or []),  # type: ignore[call-overload]
+                    "evidence": dict(item.get("evidence") or {}),  # type: ignore[call-overload]
+                }
+            else:
+                reason = str(item.get("reason") or "")
+                title = f"Skipped: {reason}" if reason else f"Skipped: {task_id}"
+                output = {"reason": reason}
+            rows.append(
+                {
+                    "task_run_id": str(uuid4()),
+                    "phase": compiled.task_index[task_id][0],
+                    "task_id": task_id,
+                    "title": title,
+                    "agent_role": "claude_desktop",
+                    "status": status,
+                    "output": output,
+                }
+            )
+            results.append({"task_id": task_id, "status": status})
+        return run, results, rows
 
     def _task_phase(self, project_id: str, task_id: str) -> str:
         """Look up which phase a task belongs to."""
-        plan_row = self.db.get_latest_plan(project_id)
-        if plan_row:
-            for phase in plan_row["plan_json"].get("phases", []):
-                for task in phase.get("tasks", []):
-                    if str(task.get("task_id")) == task_id:
-                        return str(phase.get("name", "build"))
+        compiled = self.plans.latest(project_id)
+        if compiled is not None and task_id in compiled.task_index:
+            return compiled.task_index[task_id][0]
         return "build"
 
-    def _next_order_index(self, run_id: str) -> int:
-        task_runs = self.db.list_task_runs(run_id, limit=500)
-        return len(task_runs) + 1
+    def _update_run_summary(self, run_id: str, project_id: str, counters: Dict[str, int] | None = None) -> None:
+        counters = counters if counters is not None else self.db.get_run_counters(run_id)
+        completed = counters["completed_count"]
+        skipped = counters["skipped_count"]
+        failed = counters["failed_count"]
 
-    def _update_run_summary(self, run_id: str, project_id: str) -> None:
-        task_runs = self.db.list_task_runs(run_id, limit=500)
-        completed = sum(1 for tr in task_runs if tr.get("status") == "completed")
-        skipped = sum(1 for tr in task_runs if tr.get("status") == "skipped")
-        failed = sum(1 for tr in task_runs if tr.get("status") == "failed")
-
-        plan_row = self.db.get_latest_plan(project_id)
+        compiled = self.plans.latest(project_id)
         total = 0
         current_phase = "build"
-        if plan_row:
-            phases = plan_row["plan_json"].get("phases", [])
-            total = sum(len(p.get("tasks", [])) for p in phases)
+        if compiled is not None:
+            total = compiled.total_tasks
             # Determine current phase from progress.
-            done_ids = {tr["task_id"] for tr in task_runs if tr.get("status") in ("completed", "skipped")}
-            for phase in phases:
-                for task in phase.get("tasks", []):
-                    if str(task.get("task_id")) not in done_ids:
-                        current_phase = str(phase.get("name", "build"))
-                        break
-                else:
-                    continue
-                break
+            pending = compiled.first_pending(self.db.get_run_done_task_ids(run_id))
+            if pending is not None:
+                current_phase = pending[0]
 
         self.db.update_project_run(
             run_id,
@@ -337,49 +485,40 @@ class TaskStateMachine:
         )
 
     def _phase_gate(self, phase_name: str, gates: List[Dict[str, object]]) -> Dict[str, object] | None:
-        phase_gate_map = {
-            "build": "gate-1",     # Discovery must be reviewed before build.
-            "ship": "gate-2",      # Quality must be checked before ship.
-        }
-        expected = phase_gate_map.get(phase_name)
-        if not expected:
-            return None
-        for gate in gates:
-            if str(gate.get("gate_id")) == expected:
-                return gate
-        return None
+        return _phase_gate(phase_name, gates)
 
     def _auto_approve_phase_gates(self, project_id: str, completed_task_id: str) -> None:
         """Auto-approve phase gates when all tasks in the gated phase are done."""
-        plan_row = self.db.get_latest_plan(project_id)
-        if not plan_row:
+        compiled = self.plans.latest(project_id)
+        if compiled is None:
             return
 
         run = self.db.get_latest_project_run(project_id)
         if not run:
             return
 
-        task_runs = self.db.list_task_runs(run["run_id"], limit=500)
-        done_ids = {tr["task_id"] for tr in task_runs if tr.get("status") in ("completed", "skipped")}
-        plan = plan_row["plan_json"]
+        done_ids = self.db.get_run_done_task_ids(run["run_id"])
 
-        # Check if the discovery phase is complete → auto-approve gate-1.
-        # Check if the verify phase is complete → auto-approve gate-2.
-        gate_phase_map = {
-            "gate-1": "discovery",
-            "gate-2": "verify",
-        }
-        for gate_id, phase_name in gate_phase_map.items():
+        # Discovery complete → auto-approve gate-1; verify complete → gate-2.
+        for gate_id, phase_name in _GATE_PHASES.items():
+            phase_task_ids = compiled.phase_task_ids.get(phase_name)
+            if not phase_task_ids or not phase_task_ids.issubset(done_ids):
+                continue
             if self.db.is_gate_approved(project_id, gate_id):
                 continue
-            for phase in plan.get("phases", []):
-                if phase.get("name") != phase_name:
-                    continue
-                phase_task_ids = {str(t.get("task_id")) for t in phase.get("tasks", [])}
-                if phase_task_ids and phase_task_ids.issubset(done_ids):
-                    self.db.upsert_gate_approval(
-                        project_id=project_id,
-                        gate_id=gate_id,
-                        approved_by="system-auto",
-                        note=f"All {phase_name} tasks completed",
-                    )
+            self.db.upsert_gate_approval(
+                project_id=project_id,
+                gate_id=gate_id,
+                approved_by="system-auto",
+                note=f"All {phase_name} tasks completed",
+            )
+
+
+def _phase_gate(phase_name: str, gates: List[Dict[str, object]]) -> Dict[str, object] | None:
+    expected = _PHASE_GATE_IDS.get(phase_name)
+    if not expected:
+        return None
+    for gate in gates:
+        if str(gate.get("gate_id")) == expected:
+            return gate
+    return None
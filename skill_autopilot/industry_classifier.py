@@ -0,0 +1,306 @@
+"""Pluggable industry classification tier used ahead of keyword scoring.
+
+``detect_industry`` asks the configured classifier first and falls back to the
+weighted keyword scorer when it has no answer. Classifier calls are:
+
+- cached in memory and on disk, keyed by a hash of the truncated brief text,
+  the industry list and the classifier identity, so watcher-driven re-parses of
+  an unchanged brief never leave the process;
+- run on a small shared executor under a hard latency budget. A call that
+  overruns the budget yields no answer (the keyword tier decides) but is left to
+  finish in the background, and its result goes to the persistent cache. For
+  ``TIMEOUT_PIN_SECONDS`` afterwards the brief keeps getting no answer in this
+  process, so re-parses inside that window agree with the first one.
+
+``AnthropicIndustryClassifier`` reuses one client with an explicit timeout.
+``HttpIndustryClassifier`` posts to a local endpoint, as a stand-in for tests
+and benchmarks. The offline model (``industry_model``) runs inline. Without
+``configure_industry_classifier`` the Anthropic tier is used whenever
+``ANTHROPIC_API_KEY`` is set, as before.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Sequence
+
+DEFAULT_MODEL = "claude-haiku-4-20250414"
+DEFAULT_BUDGET_SECONDS = 2.0
+MAX_BRIEF_CHARS = 3000
+INDUSTRY_CACHE_VERSION = 1
+INDUSTRY_CACHE_MAX_ENTRIES = 2048
+TIMEOUT_PIN_SECONDS = 300.0
+
+
+def build_prompt(text: str, industries: Sequence[str]) -> str:
+    industries_text = "\n".join(f"- {name}" for name in industries)
+    return (
+        "You are an industry classifier. Given a project brief, identify the single "
+        "best-matching industry from the list below. Reply with ONLY the industry name, "
+        "exactly as written. If none match well, reply NONE.\n\n"
+        f"Industries:\n{industries_text}\n\n"
+        f"Project brief:\n{text[:MAX_BRIEF_CHARS]}"
+    )
+
+
+def match_industry(answer: str, industries: Sequence[str]) -> str:
+    """Map a free-form answer onto ``industries``; empty string when nothing fits."""
+    answer = answer.strip()
+    if answer in industries:
+        return answer
+    if not answer or answer == "NONE":
+        return ""
+    # The model may slightly rephrase the name.
+    answer_lower = answer.lower()
+    for name in industries:
+        if answer_lower in name.lower() or name.lower() in answer_lower:
+            return name
+    return ""
+
+
+class IndustryClassifier:
+    """Interface: return one of ``industries`` or ``""``; raise on transport errors.
+
+    ``remote`` classifiers go through the cache and the latency budget; local
+    ones are called inline.
+    """
+
+    name = "base"
+    remote = True
+
+    def classify(self, text: str, industries: Sequence[str]) -> str:
+        raise NotImplementedError
+
+
+class AnthropicIndustryClassifier(IndustryClassifier):
+    def __init__(self, api_key: str, model: str = DEFAULT_MODEL, timeout: float = DEFAULT_BUDGET_SECONDS):
+        self.api_key = api_key
+        self.model = model
+        self.timeout = timeout
+        self.name = f"anthropic:{model}"
+        self._client = None
+        self._lock = Lock()
+
+    def _get_client(self):
+        with self._lock:
+            if self._client is None:
+                import anthropic
+
+                self._client = anthropic.Anthropic(api_key=self.api_key, timeout=self.timeout, max_retries=0)
+            return self._client
+
+    def classify(self, text: str, industries: Sequence[str]) -> str:
+        message = self._get_client().messages.create(
+            model=self.model,
+            max_tokens=80,
+            messages=[{"role": "user", "content": build_prompt(text, industries)}],
+        )
+        return match_industry(message.content[0].text, industries)
+
+
+class HttpIndustryClassifier(IndustryClassifier):
+    """POSTs ``{"text", "industries", "prompt"}`` and reads ``{"industry": ...}``."""
+
+    def __init__(self, url: str, timeout: float = DEFAULT_BUDGET_SECONDS):
+        import requests
+
+        self.url = url
+        self.timeout = timeout
+        self.name = f"http:{url}"
+        self._session = requests.Session()
+
+    def classify(self, text: str, industries: Sequence[str]) -> str:
+        response = self._session.post(
+            self.url,
+            json={
+                "text": text[:MAX_BRIEF_CHARS],
+                "industries": list(industries),
+                "prompt": build_prompt(text, industries),
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return match_industry(str(response.json().get("industry", "")), industries)
+
+
+class IndustryCache:
+    """Bounded classification cache, persisted as JSON when ``path`` is set."""
+
+    def __init__(self, path: str | None = None, max_entries: int = INDUSTRY_CACHE_MAX_ENTRIES):
+        self.path = Path(path).expanduser() if path else None
+        self.max_entries = max_entries
+        self.entries: Dict[str, str] = {}
+        self._lock = Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != INDUSTRY_CACHE_VERSION:
+            return
+        entries = payload.get("entries")
+        if isinstance(entries, dict):
+            self.entries = {str(key): str(value) for key, value in entries.items()}
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            return self.entries.get(key)
+
+    def put(self, key: str, industry: str) -> None:
+        with self._lock:
+            self.entries.pop(key, None)
+            self.entries[key] = industry
+            while len(self.entries) > self.max_entries:
+                self.entries.pop(next(iter(self.entries)))
+            payload = {"version": INDUSTRY_CACHE_VERSION, "entries": dict(self.entries)}
+        self._save(payload)
+
+    def _save(self, payload: Dict[str, object]) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # Only a cache; a failed write just means another classifier call later.
+            return
+
+
+def cache_key(text: str, industries: Sequence[str], classifier_name: str) -> str:
+    digest = hashlib.sha256()
+    for part in (classifier_name, "\n".join(industries), text[:MAX_BRIEF_CHARS]):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+_state_lock = Lock()
+_classifier: IndustryClassifier | None = None
+_configured = False
+_default: tuple[str, IndustryClassifier] | None = None
+_cache = IndustryCache()
+_budget_seconds = DEFAULT_BUDGET_SECONDS
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="industry-classifier")
+_inflight: Dict[str, Future] = {}
+# cache key -> monotonic deadline; in memory only, so a slow call never outlives the process.
+_timed_out: Dict[str, float] = {}
+
+
+def configure_industry_classifier(
+    classifier: IndustryClassifier | None,
+    cache_path: str | None = None,
+    budget_seconds: float = DEFAULT_BUDGET_SECONDS,
+) -> None:
+    """Install ``classifier`` (``None`` disables the tier) with its cache and latency budget."""
+    global _classifier, _configured, _cache, _budget_seconds
+    with _state_lock:
+        _classifier = classifier
+        _configured = True
+        _cache = IndustryCache(cache_path)
+        _budget_seconds = budget_seconds
+        _inflight.clear()
+        _timed_out.clear()
+
+
+def build_industry_classifier(
+    kind: str,
+    url: str = "",
+    model: str = DEFAULT_MODEL,
+    timeout: float = DEFAULT_BUDGET_SECONDS,
+) -> IndustryClassifier | None:
+    """Classifier for a config value: ``anthropic``, ``http``, ``offline`` or ``none``."""
+    if kind == "offline":
+        from .industry_model import OfflineIndustryClassifier
+
+        return OfflineIndustryClassifier()
+    if kind == "http":
+        return HttpIndustryClassifier(url, timeout=timeout) if url else None
+    if kind == "anthropic":
+        return _anthropic_from_env(model, timeout)
+    return None
+
+
+def _anthropic_from_env(model: str, timeout: float) -> IndustryClassifier | None:
+    api_key = os.environ.get("ANTHROPIC_API_KEY", "")
+    if not api_key:
+        return None
+    try:
+        import anthropic  # noqa: F401
+    except ImportError:
+        return None
+    return AnthropicIndustryClassifier(api_key, model=model, timeout=timeout)
+
+
+def _active_classifier() -> IndustryClassifier | None:
+    global _default
+    if _configured:
+        return _classifier
+    api_key = os.environ.get("ANTHROPIC_API_KEY", "")
+    if not api_key:
+        return None
+    if _default is None or _default[0] != api_key:
+        classifier = _anthropic_from_env(DEFAULT_MODEL, DEFAULT_BUDGET_SECONDS)
+        if classifier is None:
+            return None
+        _default = (api_key, classifier)
+    return _default[1]
+
+
+def classify_industry(text: str, industries: Sequence[str]) -> str:
+    """Classifier answer for ``text``, or ``""`` when unavailable, undecided or over budget."""
+    with _state_lock:
+        classifier = _active_classifier()
+    if classifier is None:
+        return ""
+    if not classifier.remote:
+        return classifier.classify(text, industries)
+    with _state_lock:
+        cache, budget = _cache, _budget_seconds
+        key = cache_key(text, industries, classifier.name)
+        pinned_until = _timed_out.get(key)
+        if pinned_until is not None:
+            if time.monotonic() < pinned_until:
+                return ""
+            del _timed_out[key]
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        future = _inflight.get(key)
+        if future is None:
+            future = _executor.submit(_classify_and_store, classifier, text, list(industries), key, cache)
+            _inflight[key] = future
+
+    try:
+        return future.result(timeout=budget)
+    except FutureTimeoutError:
+        with _state_lock:
+            _timed_out[key] = time.monotonic() + TIMEOUT_PIN_SECONDS
+        return ""
+    except Exception:
+        # Transport or API errors: the keyword tier decides, and nothing is cached.
+        return ""
+
+
+def _classify_and_store(
+    classifier: IndustryClassifier, text: str, industries: Sequence[str], key: str, cache: IndustryCache
+) -> str:
+    try:
+        industry = classifier.classify(text, industries)
+        cache.put(key, industry)
+        return industry
+    finally:
+        with _state_lock:
+            _inflight.pop(key, None)
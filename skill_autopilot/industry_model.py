@@ -0,0 +1,164 @@
+"""Offline industry classifier shipped as a precomputed weight matrix.
+
+The model is a TF-IDF linear scorer trained from the weighted signal tables in
+``pods`` (plus each industry's own name). Features are word n-grams of the
+lowercase brief (up to ``NGRAM_MAX`` words, plural ``s`` stripped). Each
+feature's weight per industry is its signal weight times a smoothed IDF over
+industries, so a term shared by many industries counts for less than one unique
+to a single industry. A brief is scored against all industries at once:
+``1 + log(count)`` per feature, times the weight matrix.
+
+The weights live in ``data/industry_model.json`` and are regenerated with
+``scripts/build_industry_model.py``; a test fails if they drift from the signal
+tables. numpy is used for the matrix product when installed, otherwise the
+sparse rows are accumulated in Python instead.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+
+from .brief_analysis import BriefAnalysis, as_analysis
+from .industry_classifier import IndustryClassifier
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+MODEL_PATH = Path(__file__).resolve().parent / "data" / "industry_model.json"
+MODEL_VERSION = 1
+NGRAM_MAX = 3
+DEFAULT_THRESHOLD = 0.5
+
+_WORD_RE = re.compile(r"[a-zA-Z0-9_]+")
+
+
+def _stem(word: str) -> str:
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def _feature(text: str) -> str | None:
+    words = [_stem(word) for word in _WORD_RE.findall(text.lower())]
+    if not words or len(words) > NGRAM_MAX:
+        return None
+    return " ".join(words)
+
+
+def train_industry_model() -> Dict[str, object]:
+    """Build the model payload from the current signal tables (deterministic)."""
+    from .pods import _INDUSTRY_SIGNALS_WEIGHTED, INDUSTRY_KERNEL_MAP
+
+    industries = list(INDUSTRY_KERNEL_MAP)
+    position = {name: i for i, name in enumerate(industries)}
+    raw: Dict[str, Dict[int, float]] = {}
+
+    def add(term: str, industry: int, weight: float) -> None:
+        feature = _feature(term)
+        if feature is None:
+            return
+        row = raw.setdefault(feature, {})
+        row[industry] = max(row.get(industry, 0.0), weight)
+
+    for name in industries:
+        add(name, position[name], 1.0)
+    for name, signals in _INDUSTRY_SIGNALS_WEIGHTED:
+        for term, weight in signals:
+            add(term, position[name], weight)
+
+    # Smoothed IDF over industries, scaled so a feature unique to one industry keeps its weight.
+    def idf(df: int) -> float:
+        return math.log((1 + len(industries)) / (1 + df)) + 1.0
+
+    unique = idf(1)
+    weights: Dict[str, List[List[float]]] = {}
+    for feature in sorted(raw):
+        row = raw[feature]
+        scale = idf(len(row)) / unique
+        weights[feature] = [[index, round(weight * scale, 6)] for index, weight in sorted(row.items())]
+    return {
+        "version": MODEL_VERSION,
+        "ngram_max": NGRAM_MAX,
+        "threshold": DEFAULT_THRESHOLD,
+        "industries": industries,
+        "weights": weights,
+    }
+
+
+class IndustryModel:
+    def __init__(self, payload: Dict[str, object]):
+        self.industries: Tuple[str, ...] = tuple(payload["industries"])  # type: ignore[arg-type]
+        self.ngram_max = int(payload["ngram_max"])  # type: ignore[arg-type]
+        self.threshold = float(payload["threshold"])  # type: ignore[arg-type]
+        rows: Dict[str, List[List[float]]] = payload["weights"]  # type: ignore[assignment]
+        self.vocabulary: Dict[str, int] = {feature: i for i, feature in enumerate(rows)}
+        self.rows: Tuple[Tuple[Tuple[int, float], ...], ...] = tuple(
+            tuple((int(index), float(weight)) for index, weight in row) for row in rows.values()
+        )
+        self.matrix = None
+        if np is not None:
+            matrix = np.zeros((len(self.rows), len(self.industries)), dtype=np.float64)
+            for feature, row in enumerate(self.rows):
+                for index, weight in row:
+                    matrix[feature, index] = weight
+            self.matrix = matrix
+
+    def feature_counts(self, text: Union[str, BriefAnalysis]) -> Dict[int, int]:
+        words = [_stem(word) for word in as_analysis(text).word_list]
+        vocabulary = self.vocabulary
+        counts: Dict[int, int] = {}
+        for start in range(len(words)):
+            for size in range(1, self.ngram_max + 1):
+                if start + size > len(words):
+                    break
+                feature = vocabulary.get(" ".join(words[start : start + size]))
+                if feature is not None:
+                    counts[feature] = counts.get(feature, 0) + 1
+        return counts
+
+    def scores(self, text: Union[str, BriefAnalysis]) -> List[float]:
+        counts = self.feature_counts(text)
+        if self.matrix is not None:
+            query = np.zeros(len(self.rows), dtype=np.float64)
+            for feature, count in counts.items():
+                query[feature] = 1.0 + math.log(count)
+            return (query @ self.matrix).tolist()
+        totals = [0.0] * len(self.industries)
+        for feature in sorted(counts):
+            tf = 1.0 + math.log(counts[feature])
+            for index, weight in self.rows[feature]:
+                totals[index] += tf * weight
+        return totals
+
+    def predict(self, text: Union[str, BriefAnalysis]) -> str:
+        scores = self.scores(text)
+        best = max(range(len(scores)), key=lambda i: (scores[i], -i)) if scores else -1
+        if best < 0 or scores[best] < self.threshold:
+            return ""
+        return self.industries[best]
+
+
+@lru_cache(maxsize=1)
+def load_industry_model(path: str = str(MODEL_PATH)) -> IndustryModel:
+    return IndustryModel(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+class OfflineIndustryClassifier(IndustryClassifier):
+    """In-process classifier over the shipped weights; no network, no executor."""
+
+    remote = False
+
+    def __init__(self, model: IndustryModel | None = None):
+        self.model = model or load_industry_model()
+        self.name = f"offline:v{MODEL_VERSION}"
+
+    def classify(self, text: str, industries: Sequence[str]) -> str:
+        industry = self.model.predict(text)
+        return industry if industry in industries else ""
@@ -0,0 +1,100 @@
+"""Compact, persistable stand-in for a parsed intent in materiality checks.
+
+``is_material_change`` compares risk tier, evidence level and the Jaccard
+similarity of the two briefs' word sets, which needs both full texts. A
+fingerprint keeps only the two labels, a digest of the text and a bottom-k
+MinHash sketch of the word set (the ``SKETCH_SIZE`` smallest 64-bit word
+hashes). It is stored per project in SQLite, so the check survives restarts
+and its size is bounded regardless of brief length.
+
+While both word sets fit in the sketch the comparison is exact; beyond that
+the Jaccard similarity is estimated from the sketches.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, Tuple
+
+from .brief_analysis import analyze_brief
+from .models import BriefIntent
+from .utils import sha256_hex
+
+SKETCH_SIZE = 256
+MATERIAL_JACCARD_THRESHOLD = 0.95
+
+
+def _word_hash(word: str) -> int:
+    return int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _bottom_k(words: Iterable[str], k: int = SKETCH_SIZE) -> Tuple[int, ...]:
+    return tuple(sorted(heapq.nsmallest(k, {_word_hash(word) for word in words})))
+
+
+@dataclass(frozen=True)
+class IntentFingerprint:
+    risk_tier: str
+    evidence_level: str
+    text_digest: str
+    word_count: int
+    sketch: Tuple[int, ...]
+
+    @property
+    def exact(self) -> bool:
+        """True when the sketch holds every word hash, not just the smallest k."""
+        return self.word_count <= len(self.sketch)
+
+    def sketch_bytes(self) -> bytes:
+        return array("Q", self.sketch).tobytes()
+
+    @classmethod
+    def from_row(cls, row: Dict[str, object]) -> "IntentFingerprint":
+        sketch = array("Q")
+        sketch.frombytes(bytes(row["sketch"]))  # type: ignore[arg-type]
+        return cls(
+            risk_tier=str(row["risk_tier"]),
+            evidence_level=str(row["evidence_level"]),
+            text_digest=str(row["text_digest"]),
+            word_count=int(row["word_count"]),  # type: ignore[arg-type]
+            sketch=tuple(sketch),
+        )
+
+
+def fingerprint_intent(intent: BriefIntent) -> IntentFingerprint:
+    words = analyze_brief(intent.raw_text).word_set
+    return IntentFingerprint(
+        risk_tier=intent.risk_tier,
+        evidence_level=intent.evidence_level,
+        text_digest=sha256_hex(intent.raw_text),
+        word_count=len(words),
+        sketch=_bottom_k(words),
+    )
+
+
+def estimate_jaccard(old: IntentFingerprint, new: IntentFingerprint) -> float:
+    old_set, new_set = set(old.sketch), set(new.sketch)
+    if old.exact and new.exact:
+        return len(old_set & new_set) / (len(old_set | new_set) or 1)
+    # Bottom-k estimator: among the k smallest hashes of the union, the share
+    # present in both sketches.
+    k = min(len(old.sketch), len(new.sketch)) or 1
+    union_sketch = heapq.nsmallest(k, old_set | new_set)
+    shared = sum(1 for value in union_sketch if value in old_set and value in new_set)
+    return shared / len(union_sketch)
+
+
+def is_material_fingerprint_change(old: IntentFingerprint, new: IntentFingerprint) -> bool:
+    """Fingerprint counterpart of ``brief_parser.is_material_change``."""
+    if old.risk_tier != new.risk_tier:
+        return True
+    if old.evidence_level != new.evidence_level:
+        return True
+    if old.text_digest == new.text_digest:
+        return False
+    if not old.word_count and not new.word_count:
+        return False
+    return estimate_jaccard(old, new) < MATERIAL_JACCARD_THRESHOLD
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
 from uuid import uuid4
 
 from .adapters import HostAdapter
@@ -10,6 +11,22 @@ from .models import EndProjectResponse, SkillReason
 from .utils import utc_now
 
 
+@dataclass
+class LeaseChange:
+    """Adapter calls already made for a project, and the DB writes that record them.
+
+    Adapters touch host state (files, subprocesses) that a rollback cannot undo,
+    so they run first, outside any transaction; ``LeaseManager.record`` then
+    writes the outcome, typically inside the caller's ``Database.transaction()``.
+    """
+
+    project_id: str
+    audit_events: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    leases: List[Dict[str, Any]] | None = None
+    closed_lease_ids: List[str] = field(default_factory=list)
+    response: EndProjectResponse | None = None
+
+
 class LeaseManager:
     def __init__(self, db: Database, adapters: Dict[str, HostAdapter], ttl_hours: int):
         self.db = db
@@ -17,8 +34,14 @@ class LeaseManager:
         self.ttl_hours = ttl_hours
 
     def activate_project_skills(self, project_id: str, hosts: Sequence[str], selected_skills: Sequence[SkillReason]) -> None:
+        self.record(self.prepare_activation(project_id, hosts, selected_skills))
+
+    def prepare_activation(
+        self, project_id: str, hosts: Sequence[str], selected_skills: Sequence[SkillReason]
+    ) -> LeaseChange:
         expires_at = (utc_now() + timedelta(hours=self.ttl_hours)).isoformat()
         skill_ids = [skill.skill_id for skill in selected_skills]
+        change = LeaseChange(project_id=project_id, leases=[])
 
         # Always clear existing project activations first to avoid stale skills
         # when rerouting to a different active set.
@@ -32,28 +55,29 @@ class LeaseManager:
             if not adapter:
                 continue
             result = adapter.deactivate(project_id=project_id, skill_ids=sorted(set(old_skill_ids)))
-            self.db.add_audit_event(
-                event_type="adapter.deactivate.pre_activate",
-                project_id=project_id,
-                payload={
-                    "host": host,
-                    "success": result.success,
-                    "message": result.message,
-                    "skill_count": len(set(old_skill_ids)),
-                },
+            change.audit_events.append(
+                (
+                    "adapter.deactivate.pre_activate",
+                    {
+                        "host": host,
+                        "success": result.success,
+                        "message": result.message,
+                        "skill_count": len(set(old_skill_ids)),
+                    },
+                )
             )
 
-        leases = []
         for host in hosts:
             adapter = self.adapters[host]
             result = adapter.activate(project_id=project_id, skill_ids=skill_ids)
-            self.db.add_audit_event(
-                event_type="adapter.activate",
-                project_id=project_id,
-                payload={"host": host, "success": result.success, "message": result.message, "skill_count": len(skill_ids)},
+            change.audit_events.append(
+                (
+                    "adapter.activate",
+                    {"host": host, "success": result.success, "message": result.message, "skill_count": len(skill_ids)},
+                )
             )
             for skill_id in skill_ids:
-                leases.append(
+                change.leases.append(  # type: ignore[union-attr]
                     {
                         "lease_id": str(uuid4()),
                         "project_id": project_id,
@@ -63,18 +87,20 @@ class LeaseManager:
                         "status": "active",
                     }
                 )
-
-        self.db.replace_leases(project_id, leases)
+        return change
 
     def deactivate_project(self, project_id: str, reason: str) -> EndProjectResponse:
+        change = self.prepare_deactivation(project_id, reason)
+        self.record(change)
+        return change.response  # type: ignore[return-value]
+
+    def prepare_deactivation(self, project_id: str, reason: str) -> LeaseChange:
+        change = LeaseChange(project_id=project_id)
         active = self.db.get_active_leases(project_id=project_id)
         if not active:
-            self.db.add_audit_event(
-                event_type="project.close",
-                project_id=project_id,
-                payload={"reason": reason, "deactivated": 0, "status": "closed"},
-            )
-            return EndProjectResponse(project_id=project_id, deactivated_skills=0, status="closed")
+            change.audit_events.append(("project.close", {"reason": reason, "deactivated": 0, "status": "closed"}))
+            change.response = EndProjectResponse(project_id=project_id, deactivated_skills=0, status="closed")
+            return change
 
         grouped: Dict[str, List[str]] = {}
         for lease in active:
@@ -89,27 +115,35 @@ class LeaseManager:
             result = adapter.deactivate(project_id=project_id, skill_ids=sorted(set(skill_ids)))
             if not result.success:
                 failed_hosts.append(host)
-            self.db.add_audit_event(
-                event_type="adapter.deactivate",
-                project_id=project_id,
-                payload={"host": host, "success": result.success, "message": result.message, "skill_count": len(set(skill_ids))},
+            change.audit_events.append(
+                (
+                    "adapter.deactivate",
+                    {"host": host, "success": result.success, "message": result.message, "skill_count": len(set(skill_ids))},
+                )
             )
 
         status = "closed" if not failed_hosts else "partial_close"
-        if status == "closed":
-            self.db.set_leases_status([lease["lease_id"] for lease in active], "closed")
-        else:
-            to_close = [lease["lease_id"] for lease in active if lease["host"] not in failed_hosts]
-            self.db.set_leases_status(to_close, "closed")
+        change.closed_lease_ids = [lease["lease_id"] for lease in active if lease["host"] not in failed_hosts]
 
         deactivated_skills = len({(lease["host"], lease["skill_id"]) for lease in active if lease["host"] not in failed_hosts})
-        self.db.add_audit_event(
-            event_type="project.close",
-            project_id=project_id,
-            payload={"reason": reason, "deactivated": deactivated_skills, "status": status, "failed_hosts": failed_hosts},
+        change.audit_events.append(
+            (
+                "project.close",
+                {"reason": reason, "deactivated": deactivated_skills, "status": status, "failed_hosts": failed_hosts},
+            )
         )
-
-        return EndProjectResponse(project_id=project_id, deactivated_skills=deactivated_skills, status=status)
+        change.response = EndProjectResponse(project_id=project_id, deactivated_skills=deactivated_skills, status=status)
+        return change
+
+    def record(self, change: LeaseChange) -> None:
+        """Write the lease and audit rows for ``change``; joins an open transaction."""
+        with self.db.transaction():
+            for event_type, payload in change.audit_events:
+                self.db.add_audit_event(event_type=event_type, project_id=change.project_id, payload=payload)
+            if change.closed_lease_ids:
+                self.db.set_leases_status(change.closed_lease_ids, "closed")
+            if change.leases is not None:
+                self.db.replace_leases(change.project_id, change.leases)
 
     def sweep_expired_leases(self) -> List[str]:
         now_iso = utc_now().isoformat()
@@ -119,7 +153,9 @@ class LeaseManager:
 
         project_ids = sorted({lease["project_id"] for lease in expired})
         for project_id in project_ids:
-            self.deactivate_project(project_id=project_id, reason="ttl_expiry")
-            self.db.set_project_state(project_id, "closed", ended=True)
+            change = self.prepare_deactivation(project_id=project_id, reason="ttl_expiry")
+            with self.db.transaction():
+                self.record(change)
+                self.db.set_project_state(project_id, "closed", ended=True)
 
         return project_ids
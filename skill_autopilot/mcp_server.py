@@ -20,7 +20,8 @@ SERVER_INSTRUCTIONS = (
     "2. Present the task list and deliverables to the user for approval.\n"
     "3. Once the user approves, call sa_approve_plan to start execution and get the first task.\n"
     "4. Work on the task using the instructions provided. Produce real, concrete files — not just documentation about what to build.\n"
-    "5. Call sa_complete_task when done, or sa_skip_task to skip.\n"
+    "5. Call sa_complete_task when done, or sa_skip_task to skip. "
+    "When several tasks finish together, use sa_complete_tasks / sa_skip_tasks to report them in one call.\n"
     "6. Call sa_next_task to get the next task.\n"
     "7. Repeat until all tasks are complete.\n"
     "8. Call sa_end_project to close the project."
@@ -207,17 +208,18 @@ def mcp_complete_task(
     artifacts: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     engine = _get_engine()
-    result = engine.task_machine.complete_task(
-        project_id=project_id,
-        task_id=task_id,
-        summary=summary,
-        artifacts=artifacts or [],
-    )
-    engine.db.add_audit_event(
-        event_type="task.completed",
-        project_id=project_id,
-        payload={"task_id": task_id, "summary": summary},
-    )
+    with engine.db.transaction():
+        result = engine.task_machine.complete_task(
+            project_id=project_id,
+            task_id=task_id,
+            summary=summary,
+            artifacts=artifacts or [],
+        )
+        engine.db.add_audit_event(
+            event_type="task.completed",
+            project_id=project_id,
+            payload={"task_id": task_id, "summary": summary},
+        )
     # Lift checklist text from the nested next-task response.
     next_result = result.get("next") or {}
     checklist = next_result.pop("checklist", {}) or {}
@@ -234,16 +236,63 @@ def mcp_skip_task(
     reason: str = "",
 ) -> Dict[str, Any]:
     engine = _get_engine()
-    result = engine.task_machine.skip_task(
-        project_id=project_id,
-        task_id=task_id,
-        reason=reason,
-    )
-    engine.db.add_audit_event(
-        event_type="task.skipped",
-        project_id=project_id,
-        payload={"task_id": task_id, "reason": reason},
-    )
+    with engine.db.transaction():
+        result = engine.task_machine.skip_task(
+            project_id=project_id,
+            task_id=task_id,
+            reason=reason,
+        )
+        engine.db.add_audit_event(
+            event_type="task.skipped",
+            project_id=project_id,
+            payload={"task_id": task_id, "reason": reason},
+        )
+    next_result = result.get("next") or {}
+    checklist = next_result.pop("checklist", {}) or {}
+    return {"project_id": project_id, "task_list": checklist.get("text", ""), **result}
+
+
+@mcp.tool(
+    name="sa_complete_tasks",
+    description=(
+        "Mark several tasks as completed in one call. Each item takes task_id and optional "
+        "summary and artifacts. Returns per-item results and the next pending task once."
+    ),
+)
+def mcp_complete_tasks(project_id: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    engine = _get_engine()
+    with engine.db.transaction():
+        result = engine.task_machine.complete_tasks(project_id=project_id, items=items)
+        summaries = {str(item.get("task_id") or ""): str(item.get("summary") or "") for item in items}
+        for task_id in result["completed_task_ids"]:
+            engine.db.add_audit_event(
+                event_type="task.completed",
+                project_id=project_id,
+                payload={"task_id": task_id, "summary": summaries.get(task_id, ""), "batch": True},
+            )
+    next_result = result.get("next") or {}
+    checklist = next_result.pop("checklist", {}) or {}
+    return {"project_id": project_id, "task_list": checklist.get("text", ""), **result}
+
+
+@mcp.tool(
+    name="sa_skip_tasks",
+    description=(
+        "Skip several tasks in one call. Each item takes task_id and optional reason. "
+        "Returns per-item results and the next pending task once."
+    ),
+)
+def mcp_skip_tasks(project_id: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    engine = _get_engine()
+    with engine.db.transaction():
+        result = engine.task_machine.skip_tasks(project_id=project_id, items=items)
+        reasons = {str(item.get("task_id") or ""): str(item.get("reason") or "") for item in items}
+        for task_id in result["skipped_task_ids"]:
+            engine.db.add_audit_event(
+                event_type="task.skipped",
+                project_id=project_id,
+                payload={"task_id": task_id, "reason": reasons.get(task_id, ""), "batch": True},
+            )
     next_result = result.get("next") or {}
     checklist = next_result.pop("checklist", {}) or {}
     return {"project_id": project_id, "task_list": checklist.get("text", ""), **result}
@@ -6,7 +6,10 @@ Maps directly to project_brief.md §3–§5.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, FrozenSet, List, Optional, Sequence
+from typing import Dict, FrozenSet, List, Optional, Sequence, Union
+
+from .brief_analysis import BriefAnalysis, as_analysis
+from .industry_classifier import classify_industry
 
 
 @dataclass(frozen=True)
@@ -320,7 +323,7 @@ _POD_SIGNAL_KEYWORDS: Dict[str, List[str]] = {
 
 
 def select_pods(
-    intent_text: str,
+    intent_text: Union[str, BriefAnalysis],
     industry: str = "",
     pod_hints: Sequence[str] = (),
 ) -> Dict[str, PodSpec]:
@@ -340,11 +343,11 @@ def select_pods(
             selected[hint_lower] = ALL_ATTACHABLE_PODS[hint_lower]
 
     # Keyword-based pod attachment.
-    text_lower = intent_text.lower()
+    hits = as_analysis(intent_text).signal_hits
     for pod_id, keywords in _POD_SIGNAL_KEYWORDS.items():
         if pod_id in selected:
             continue
-        if any(kw in text_lower for kw in keywords):
+        if any(kw in hits for kw in keywords):
             selected[pod_id] = ALL_ATTACHABLE_PODS[pod_id]
 
     # Industry-based pod attachment.
@@ -361,7 +364,7 @@ def select_pods(
 
 def select_kernels(
     industry: str = "",
-    intent_text: str = "",
+    intent_text: Union[str, BriefAnalysis] = "",
     explicit_kernels: Sequence[str] = (),
 ) -> List[KernelSpec]:
     """Select B-kernels for a project. Uses industry mapping + text signals.
@@ -385,9 +388,9 @@ def select_kernels(
 
     # Text-signal fallback: look for kernel tags in the brief.
     if not kernel_ids:
-        text_lower = intent_text.lower()
+        hits = as_analysis(intent_text).signal_hits
         for kid, kspec in B_KERNELS.items():
-            if any(tag in text_lower for tag in kspec.tags):
+            if any(tag in hits for tag in kspec.tags):
                 kernel_ids.append(kid)
                 if len(kernel_ids) >= 2:
                     break
@@ -406,64 +409,28 @@ def select_kernels(
     return result
 
 
-def detect_industry(text: str) -> str:
+def detect_industry(text: Union[str, BriefAnalysis]) -> str:
     """Detect industry from brief text.
 
     Two-tier approach:
-      1. LLM classification via Anthropic API (when ANTHROPIC_API_KEY is set).
+      1. Classifier tier (see ``industry_classifier``): Anthropic API when
+         ANTHROPIC_API_KEY is set, or the configured classifier; cached and
+         bounded by a latency budget.
       2. Weighted keyword scoring fallback.
     """
+    analysis = as_analysis(text)
     # Tier 1: LLM classification (fast, precise).
-    llm_result = _detect_industry_llm(text)
+    llm_result = _detect_industry_llm(analysis.text)
     if llm_result:
         return llm_result
 
     # Tier 2: Weighted keyword scoring.
-    return _detect_industry_keywords(text)
+    return _detect_industry_keywords(analysis)
 
 
 def _detect_industry_llm(text: str) -> str:
-    """Classify industry using Claude Haiku. Returns empty string on failure."""
-    import os
-
-    api_key = os.environ.get("ANTHROPIC_API_KEY", "")
-    if not api_key:
-        return ""
-
-    try:
-        import anthropic  # noqa: F811
-    except ImportError:
-        return ""
-
-    industries = list(INDUSTRY_KERNEL_MAP.keys())
-    industries_text = "\n".join(f"- {name}" for name in industries)
-
-    prompt = (
-        "You are an industry classifier. Given a project brief, identify the single "
-        "best-matching industry from the list below. Reply with ONLY the industry name, "
-        "exactly as written. If none match well, reply NONE.\n\n"
-        f"Industries:\n{industries_text}\n\n"
-        f"Project brief:\n{text[:3000]}"
-    )
-
-    try:
-        client = anthropic.Anthropic(api_key=api_key)
-        message = client.messages.create(
-            model="claude-haiku-4-20250414",
-            max_tokens=80,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        answer = message.content[0].text.strip()
-        if answer == "NONE" or answer not in INDUSTRY_KERNEL_MAP:
-            # Try fuzzy match (LLM might slightly rephrase).
-            answer_lower = answer.lower()
-            for name in industries:
-                if answer_lower in name.lower() or name.lower() in answer_lower:
-                    return name
-            return ""
-        return answer
-    except Exception:
-        return ""
+    """Classify industry with the configured classifier. Returns empty string on failure."""
+    return classify_industry(text, list(INDUSTRY_KERNEL_MAP))
 
 
 # Weighted keyword signals: (keyword, weight).
@@ -624,19 +591,19 @@ _INDUSTRY_SIGNALS_WEIGHTED: list[tuple[str, list[tuple[str, float]]]] = [
 ]
 
 
-def _detect_industry_keywords(text: str) -> str:
+def _detect_industry_keywords(text: Union[str, BriefAnalysis]) -> str:
     """Score all industries and return best match.
 
     Multi-signal weighted scoring instead of first-match.
     A keyword like 'platform' (weight 0.2) won't override 'clinic' (weight 0.7).
     """
-    text_lower = text.lower()
+    hits = as_analysis(text).signal_hits
 
     best_industry = ""
     best_score = 0.0
 
     for industry_name, signals in _INDUSTRY_SIGNALS_WEIGHTED:
-        score = sum(weight for term, weight in signals if term in text_lower)
+        score = sum(weight for term, weight in signals if term in hits)
         if score > best_score:
             best_score = score
             best_industry = industry_name
@@ -0,0 +1,95 @@
+"""Content-addressed memoization for ``route_skills``.
+
+Routing is pure in ``(intent, catalog snapshot, policy, host targets)``, so the
+result is stored under a hash of exactly those inputs: first in a small
+in-process LRU, then in the ``route_cache`` SQLite table so identical briefs
+across workspaces and restarts skip scoring entirely. The snapshot hash is part
+of the key, so a catalog change simply misses; rows for older snapshots are
+pruned when a new snapshot is first written. ``ROUTE_CACHE_VERSION`` is part of
+the key too: bump it with any change to scoring in ``router`` or to the plan
+payload, so routes persisted by an older release are not served.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Sequence
+from uuid import uuid4
+
+from .db import Database
+from .models import BriefIntent, RouteResult, RoutingPolicy
+from .utils import canonical_json, sha256_hex
+
+ROUTE_CACHE_VERSION = 1
+
+
+def route_cache_key(
+    intent: BriefIntent,
+    snapshot_hash: str,
+    policy: RoutingPolicy,
+    host_targets: Sequence[str],
+) -> str:
+    # Routing only asks whether a skill supports any target host, so order and
+    # duplicates in host_targets do not change the result.
+    return sha256_hex(
+        canonical_json(
+            {
+                "version": ROUTE_CACHE_VERSION,
+                "intent": intent.model_dump(),
+                "snapshot_hash": snapshot_hash,
+                "policy": policy.model_dump(),
+                "host_targets": sorted(set(host_targets)),
+            }
+        )
+    )
+
+
+class RouteCache:
+    def __init__(self, db: Database | None = None, max_entries: int = 256):
+        self.db = db
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, RouteResult]" = OrderedDict()
+        self._lock = Lock()
+        self._pruned_snapshot: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> RouteResult | None:
+        """Return the cached route under a fresh ``route_id``, or ``None``."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+        if cached is None and self.db is not None:
+            payload = self.db.get_cached_route(key)
+            if payload is not None:
+                cached = RouteResult.model_validate({**payload, "route_id": ""})
+                self._remember(key, cached)
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return cached.model_copy(update={"route_id": str(uuid4())}, deep=True)
+
+    def put(self, key: str, route: RouteResult) -> None:
+        self._remember(key, route.model_copy(deep=True))
+        if self.db is None:
+            return
+        with self.db.transaction():
+            if self._pruned_snapshot != route.snapshot_hash:
+                self.db.prune_route_cache(keep_snapshot_hash=route.snapshot_hash)
+                self._pruned_snapshot = route.snapshot_hash
+            self.db.put_cached_route(key, route.snapshot_hash, route.model_dump(exclude={"route_id"}))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: str, route: RouteResult) -> None:
+        with self._lock:
+            self._entries[key] = route
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import Dict, List, Sequence, Set, Tuple
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple
 from uuid import uuid4
 
+from .brief_analysis import analyze_brief, route_tokens
 from .models import BriefIntent, RouteResult, RoutingPolicy, SkillMetadata, SkillReason
+from .skill_graph import SkillGraph
 from .utils import canonical_json, sha256_hex
 
 
@@ -18,8 +20,7 @@ class SkillScore:
     explicitly_requested: bool = False
 
 
-def _tokens(text: str) -> Set[str]:
-    return {token.lower() for token in text.replace("_", " ").replace("-", " ").replace(".", " ").split() if token}
+_tokens = route_tokens
 
 
 def _is_utility_skill(skill: SkillMetadata, policy: RoutingPolicy) -> bool:
@@ -33,19 +34,69 @@ def _is_excluded_skill(skill: SkillMetadata, policy: RoutingPolicy) -> bool:
 
 
 def _explicitly_requested(intent: BriefIntent, skill: SkillMetadata, policy: RoutingPolicy) -> bool:
-    intent_tokens = _tokens(intent.raw_text)
+    intent_tokens = analyze_brief(intent.raw_text).route_tokens
     allow_terms = {term.lower() for term in policy.utility_allow_terms}
 
     skill_tokens = _tokens(skill.skill_id) | _tokens(skill.name)
     return bool(skill_tokens & allow_terms & intent_tokens)
 
 
+class RoutingIndex:
+    """Inverted token index over one catalog snapshot.
+
+    Built once per snapshot so routing never re-tokenizes skills: ``postings``
+    maps a token to the positions of skills whose name/description/tags contain
+    it, ``token_counts`` holds each skill's token-set size (the coverage
+    denominator), and ``request_tokens`` the id/name tokens used to detect an
+    explicit utility request.
+    """
+
+    def __init__(self, catalog: Sequence[SkillMetadata]):
+        self.skills: Tuple[SkillMetadata, ...] = tuple(catalog)
+        self.token_counts: List[int] = []
+        self.request_tokens: List[FrozenSet[str]] = []
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for position, skill in enumerate(self.skills):
+            skill_tokens = _tokens(" ".join([skill.name, skill.description, *skill.tags]))
+            self.token_counts.append(len(skill_tokens))
+            self.request_tokens.append(frozenset(_tokens(skill.skill_id) | _tokens(skill.name)))
+            for token in skill_tokens:
+                postings[token].append(position)
+        self.postings: Dict[str, List[int]] = dict(postings)
+
+    def overlaps(self, intent_tokens: Set[str]) -> Dict[int, int]:
+        """Return ``{skill position: shared token count}`` for skills with any overlap."""
+        counts: Dict[int, int] = defaultdict(int)
+        for token in intent_tokens:
+            for position in self.postings.get(token, ()):
+                counts[position] += 1
+        return counts
+
+
 def _score_skill(intent: BriefIntent, skill: SkillMetadata, host_targets: Sequence[str], policy: RoutingPolicy) -> SkillScore:
-    intent_tokens = _tokens(intent.raw_text)
+    intent_tokens = analyze_brief(intent.raw_text).route_tokens
     skill_tokens = _tokens(" ".join([skill.name, skill.description, *skill.tags]))
+    return _score_with_overlap(
+        intent,
+        skill,
+        overlap=len(intent_tokens & skill_tokens),
+        token_count=len(skill_tokens),
+        explicit=_explicitly_requested(intent, skill, policy),
+        host_targets=host_targets,
+        policy=policy,
+    )
 
-    overlap = len(intent_tokens & skill_tokens)
-    coverage = overlap / max(len(skill_tokens), 1)
+
+def _score_with_overlap(
+    intent: BriefIntent,
+    skill: SkillMetadata,
+    overlap: int,
+    token_count: int,
+    explicit: bool,
+    host_targets: Sequence[str],
+    policy: RoutingPolicy,
+) -> SkillScore:
+    coverage = overlap / max(token_count, 1)
 
     host_supported = any(host in skill.hosts for host in host_targets)
     host_bonus = 0.15 if host_supported else -1.0
@@ -57,10 +108,22 @@ def _score_skill(intent: BriefIntent, skill: SkillMetadata, host_targets: Sequen
     )
 
     utility = _is_utility_skill(skill, policy)
-    explicit = _explicitly_requested(intent, skill, policy)
     utility_penalty = policy.utility_penalty if (utility and not explicit) else 0.0
 
     score = coverage + host_bonus + evidence_bonus + risk_bonus + preferred_source_bonus - utility_penalty
+    reason = _score_reason(overlap, host_supported, evidence_bonus, risk_bonus, utility, explicit, preferred_source_bonus)
+    return SkillScore(skill=skill, score=score, reason=reason, utility=utility, explicitly_requested=explicit)
+
+
+def _score_reason(
+    overlap: int,
+    host_supported: bool,
+    evidence_bonus: float,
+    risk_bonus: float,
+    utility: bool,
+    explicit: bool,
+    preferred_source_bonus: float,
+) -> str:
     reason_parts = []
     if overlap:
         reason_parts.append(f"matched {overlap} intent terms")
@@ -76,14 +139,47 @@ def _score_skill(intent: BriefIntent, skill: SkillMetadata, host_targets: Sequen
         reason_parts.append("explicitly requested")
     if preferred_source_bonus:
         reason_parts.append("preferred source")
-    reason = ", ".join(reason_parts) if reason_parts else "fallback match"
-    return SkillScore(skill=skill, score=score, reason=reason, utility=utility, explicitly_requested=explicit)
+    return ", ".join(reason_parts) if reason_parts else "fallback match"
+
+
+def _score_catalog(
+    intent: BriefIntent, index: RoutingIndex, host_targets: Sequence[str], policy: RoutingPolicy
+) -> List[SkillScore]:
+    """Score every skill with one brief tokenization and index lookups.
+
+    Only skills sharing a token with the brief touch the postings; the rest get
+    zero coverage and their score is the constant-time sum of bonuses.
+    """
+    intent_tokens = analyze_brief(intent.raw_text).route_tokens
+    overlaps = index.overlaps(intent_tokens)
+    requested_terms = intent_tokens & {term.lower() for term in policy.utility_allow_terms}
+    return [
+        _score_with_overlap(
+            intent,
+            skill,
+            overlap=overlaps.get(position, 0),
+            token_count=index.token_counts[position],
+            explicit=bool(requested_terms and index.request_tokens[position] & requested_terms),
+            host_targets=host_targets,
+            policy=policy,
+        )
+        for position, skill in enumerate(index.skills)
+    ]
 
 
-def _dependency_closure(selected: Dict[str, SkillScore], skills_by_id: Dict[str, SkillMetadata]) -> Dict[str, SkillScore]:
-    queue = list(selected.keys())
+def _dependency_closure(
+    selected: Dict[str, SkillScore],
+    skills_by_id: Dict[str, SkillMetadata],
+    graph: SkillGraph | None = None,
+) -> Dict[str, SkillScore]:
+    # With a graph, a skill whose whole closure is already selected adds nothing
+    # and is skipped; a fully closed selection never touches its dependency lists.
+    selected_mask = graph.mask(selected) if graph is not None else None
+    queue = deque(selected.keys())
     while queue:
-        current_id = queue.pop(0)
+        current_id = queue.popleft()
+        if selected_mask is not None and not graph.closure_bits[graph.index_of[current_id]] & ~selected_mask:
+            continue
         skill = skills_by_id.get(current_id)
         if not skill:
             continue
@@ -94,26 +190,39 @@ def _dependency_closure(selected: Dict[str, SkillScore], skills_by_id: Dict[str,
             if dep_skill:
                 selected[dep_id] = SkillScore(skill=dep_skill, score=0.0, reason=f"dependency of {current_id}")
                 queue.append(dep_id)
+                if selected_mask is not None:
+                    index = graph.index_of.get(dep_id)
+                    selected_mask = None if index is None else selected_mask | 1 << index
     return selected
 
 
-def _resolve_conflicts(selected: Dict[str, SkillScore]) -> Tuple[Dict[str, SkillScore], List[SkillReason]]:
+def _resolve_conflicts(
+    selected: Dict[str, SkillScore], graph: SkillGraph | None = None
+) -> Tuple[Dict[str, SkillScore], List[SkillReason]]:
     rejected: List[SkillReason] = []
-    active_ids = set(selected.keys())
+    # With a graph, only skills whose conflict bitset meets the live selection are visited.
+    selected_mask = graph.mask(selected) if graph is not None else None
 
     for skill_id in list(selected.keys()):
-        skill = selected[skill_id].skill
-        for conflict_id in skill.conflicts:
-            if conflict_id in active_ids and conflict_id in selected:
-                current = selected[skill_id]
-                conflict = selected[conflict_id]
-                # deterministic conflict winner: higher score, then lexicographic ID
-                keep_current = (current.score, skill_id) >= (conflict.score, conflict_id)
-                drop_id = conflict_id if keep_current else skill_id
-                if drop_id in selected:
-                    rejected.append(SkillReason(skill_id=drop_id, reason=f"conflicts with {skill_id if drop_id==conflict_id else conflict_id}"))
-                    del selected[drop_id]
-                    active_ids.discard(drop_id)
+        if skill_id not in selected:
+            # Already dropped by an earlier conflict.
+            continue
+        if selected_mask is not None and not graph.conflict_bits[graph.index_of[skill_id]] & selected_mask:
+            continue
+        for conflict_id in selected[skill_id].skill.conflicts:
+            if conflict_id not in selected:
+                continue
+            current = selected[skill_id]
+            conflict = selected[conflict_id]
+            # deterministic conflict winner: higher score, then lexicographic ID
+            keep_current = (current.score, skill_id) >= (conflict.score, conflict_id)
+            drop_id = conflict_id if keep_current else skill_id
+            rejected.append(SkillReason(skill_id=drop_id, reason=f"conflicts with {skill_id if drop_id==conflict_id else conflict_id}"))
+            del selected[drop_id]
+            if selected_mask is not None:
+                selected_mask &= ~(1 << graph.index_of[drop_id])
+            if drop_id == skill_id:
+                break
 
     return selected, rejected
 
@@ -163,10 +272,22 @@ def route_skills(
     host_targets: Sequence[str],
     policy: RoutingPolicy,
     snapshot_hash: str,
+    index: RoutingIndex | None = None,
+    backend: str = "python",
+    graph: SkillGraph | None = None,
 ) -> RouteResult:
+    if index is None:
+        index = RoutingIndex(catalog)
     skills_by_id = {skill.skill_id: skill for skill in catalog}
-    scored = [_score_skill(intent, skill, host_targets, policy) for skill in catalog]
-    scored.sort(key=lambda item: (-item.score, item.skill.skill_id))
+    scored: List[SkillScore] | None = None
+    if backend == "numpy":
+        from .vector_router import score_catalog_vectorized
+
+        # Returns None when numpy is not installed; fall through to Python.
+        scored = score_catalog_vectorized(intent, index, host_targets, policy)
+    if scored is None:
+        scored = _score_catalog(intent, index, host_targets, policy)
+        scored.sort(key=lambda item: (-item.score, item.skill.skill_id))
 
     selected: Dict[str, SkillScore] = {}
     rejected: List[SkillReason] = []
@@ -206,8 +327,8 @@ def route_skills(
         selected[skill_id] = candidate
         cluster_counts[cluster] += 1
 
-    selected = _dependency_closure(selected, skills_by_id)
-    selected, conflict_rejections = _resolve_conflicts(selected)
+    selected = _dependency_closure(selected, skills_by_id, graph)
+    selected, conflict_rejections = _resolve_conflicts(selected, graph)
     rejected.extend(conflict_rejections)
 
     selected_reasons = [
@@ -44,11 +44,14 @@ class ServiceContainer:
     def stop(self) -> None:
         self._stop.set()
         with suppress(RuntimeError):
-            self.engine.watcher.clear()
+            self.engine.watcher.close()
+        self.engine.catalog.stop()
+        self.engine.db.close()
 
     def _ttl_loop(self) -> None:
         while not self._stop.is_set():
             self.engine.sweep_expired()
+            self.engine.maybe_compact_audit_events()
             self._stop.wait(30)
 
 
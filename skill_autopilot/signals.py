@@ -0,0 +1,105 @@
+"""Every brief signal table compiled into one Aho-Corasick automaton.
+
+Industry detection, pod and kernel selection, project type, pod hints, risk
+and evidence inference each check a list of terms with ``term in lowered``,
+which is one full scan of the brief per term. The automaton is built once at
+import from all of those tables and finds every term present in a single pass
+over the lowercase text; consumers then test ``term in hits`` instead.
+
+Hits are plain substring presence, so results are identical to the ``in``
+checks they replace (terms with trailing spaces such as ``"bi "`` included).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from .brief_parser import (
+    _EVIDENCE_STRICT_TERMS,
+    _POD_HINT_SIGNALS,
+    _RISK_HIGH_TERMS,
+    _RISK_LOW_TERMS,
+    _TYPE_SIGNALS,
+)
+from .pods import _INDUSTRY_SIGNALS_WEIGHTED, _POD_SIGNAL_KEYWORDS, B_KERNELS
+
+
+class SignalAutomaton:
+    """Aho-Corasick matcher over a fixed set of literal patterns.
+
+    Failure links are folded into a full transition table at build time, so the
+    scan is one dict lookup per character.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[set] = [set()]
+        for pattern in sorted(set(patterns)):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append(set())
+                state = nxt
+            outputs[state].add(pattern)
+
+        fail = [0] * len(goto)
+        transitions: List[Dict[str, int]] = [{} for _ in goto]
+        transitions[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            # fail[state] is shallower, so its transitions are already complete.
+            merged = dict(transitions[fail[state]])
+            merged.update(goto[state])
+            transitions[state] = merged
+            outputs[state] |= outputs[fail[state]]
+            for ch, child in goto[state].items():
+                fail[child] = transitions[fail[state]].get(ch, 0)
+                queue.append(child)
+
+        self._transitions: Tuple[Dict[str, int], ...] = tuple(transitions)
+        self._outputs: Tuple[FrozenSet[str], ...] = tuple(frozenset(out) for out in outputs)
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """Return every pattern that occurs anywhere in ``text``."""
+        transitions = self._transitions
+        outputs = self._outputs
+        state = 0
+        hits: set = set()
+        for ch in text:
+            state = transitions[state].get(ch, 0)
+            if outputs[state]:
+                hits |= outputs[state]
+        return frozenset(hits)
+
+
+def _all_signal_terms() -> List[str]:
+    terms: List[str] = []
+    for _, signals in _INDUSTRY_SIGNALS_WEIGHTED:
+        terms.extend(term for term, _ in signals)
+    for keywords in _POD_SIGNAL_KEYWORDS.values():
+        terms.extend(keywords)
+    for kernel in B_KERNELS.values():
+        terms.extend(kernel.tags)
+    for _, signals in _TYPE_SIGNALS:
+        terms.extend(signals)
+    for _, signals in _POD_HINT_SIGNALS:
+        terms.extend(signals)
+    terms.extend(_RISK_HIGH_TERMS)
+    terms.extend(_RISK_LOW_TERMS)
+    terms.extend(_EVIDENCE_STRICT_TERMS)
+    return terms
+
+
+SIGNAL_AUTOMATON = SignalAutomaton(_all_signal_terms())
+
+
+def signal_hits(lowered: str) -> FrozenSet[str]:
+    return SIGNAL_AUTOMATON.find(lowered)
@@ -0,0 +1,133 @@
+"""Dependency/conflict graph compiled once per catalog snapshot.
+
+Skills get dense indices in ``skill_id`` order. Each skill's transitive
+dependency closure and its conflict adjacency are stored as int bitsets over
+those indices, so the router can skip a skill whose closure is already
+selected, or whose conflicts miss the selection, with a single AND. Dependency
+cycles and dependencies on skills missing from the catalog are found at build
+time and kept as diagnostics.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from .models import SkillMetadata
+
+
+class SkillGraph:
+    def __init__(self, skills: Sequence[SkillMetadata]):
+        by_id = {skill.skill_id: skill for skill in skills}
+        self.skill_ids: Tuple[str, ...] = tuple(sorted(by_id))
+        self.index_of: Dict[str, int] = {skill_id: i for i, skill_id in enumerate(self.skill_ids)}
+
+        dependencies: List[Tuple[int, ...]] = []
+        conflict_bits: List[int] = []
+        missing: Dict[str, Tuple[str, ...]] = {}
+        for skill_id in self.skill_ids:
+            skill = by_id[skill_id]
+            known = tuple(self.index_of[dep] for dep in skill.dependencies if dep in self.index_of)
+            absent = tuple(dep for dep in skill.dependencies if dep not in self.index_of)
+            if absent:
+                missing[skill_id] = absent
+            dependencies.append(known)
+            bits = 0
+            for conflict_id in skill.conflicts:
+                index = self.index_of.get(conflict_id)
+                if index is not None:
+                    bits |= 1 << index
+            conflict_bits.append(bits)
+
+        self.dependencies: Tuple[Tuple[int, ...], ...] = tuple(dependencies)
+        self.conflict_bits: Tuple[int, ...] = tuple(conflict_bits)
+        self.missing_dependencies: Dict[str, Tuple[str, ...]] = missing
+        components = _strongly_connected(self.dependencies)
+        self.closure_bits: Tuple[int, ...] = _closures(self.dependencies, components)
+        self.cycles: Tuple[Tuple[str, ...], ...] = tuple(
+            sorted(
+                tuple(sorted(self.skill_ids[i] for i in component))
+                for component in components
+                if len(component) > 1 or component[0] in self.dependencies[component[0]]
+            )
+        )
+
+    def mask(self, skill_ids: Iterable[str]) -> int | None:
+        """Bitset of ``skill_ids``, or ``None`` if any id is not in the graph."""
+        bits = 0
+        for skill_id in skill_ids:
+            index = self.index_of.get(skill_id)
+            if index is None:
+                return None
+            bits |= 1 << index
+        return bits
+
+    def diagnostics(self) -> Dict[str, object]:
+        return {
+            "cycles": [list(cycle) for cycle in self.cycles],
+            "missing_dependencies": {skill_id: list(deps) for skill_id, deps in sorted(self.missing_dependencies.items())},
+        }
+
+
+def _strongly_connected(edges: Sequence[Tuple[int, ...]]) -> List[List[int]]:
+    """Iterative Tarjan; components come out dependencies-first."""
+    index_counter = 0
+    indices: List[int] = [-1] * len(edges)
+    lowlinks: List[int] = [0] * len(edges)
+    on_stack: List[bool] = [False] * len(edges)
+    stack: List[int] = []
+    components: List[List[int]] = []
+
+    for root in range(len(edges)):
+        if indices[root] != -1:
+            continue
+        work: List[Tuple[int, int]] = [(root, 0)]
+        while work:
+            node, edge_pos = work.pop()
+            if edge_pos == 0:
+                indices[node] = lowlinks[node] = index_counter
+                index_counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            recurse = False
+            for pos in range(edge_pos, len(edges[node])):
+                target = edges[node][pos]
+                if indices[target] == -1:
+                    work.append((node, pos + 1))
+                    work.append((target, 0))
+                    recurse = True
+                    break
+                if on_stack[target]:
+                    lowlinks[node] = min(lowlinks[node], indices[target])
+            if recurse:
+                continue
+            if lowlinks[node] == indices[node]:
+                component: List[int] = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+            if work:
+                parent = work[-1][0]
+                lowlinks[parent] = min(lowlinks[parent], lowlinks[node])
+    return components
+
+
+def _closures(edges: Sequence[Tuple[int, ...]], components: List[List[int]]) -> Tuple[int, ...]:
+    component_of = [0] * len(edges)
+    for position, component in enumerate(components):
+        for member in component:
+            component_of[member] = position
+    closures = [0] * len(edges)
+    for position, component in enumerate(components):
+        bits = 0
+        for member in component:
+            for target in edges[member]:
+                bits |= 1 << target
+                if component_of[target] != position:
+                    bits |= closures[target]
+        for member in component:
+            closures[member] = bits
+    return tuple(closures)
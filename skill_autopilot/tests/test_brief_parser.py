@@ -111,3 +111,36 @@ def test_resolve_workspace_path_unresolved(tmp_path: Path) -> None:
     assert diag["exists"] is False
     assert diag["is_dir"] is False
     assert diag["resolution_mode"] == "unresolved"
+
+
+def test_brief_analysis_is_shared_across_consumers(tmp_path: Path) -> None:
+    from skill_autopilot.brief_analysis import analyze_brief
+    from skill_autopilot.router import _tokens
+
+    brief = tmp_path / "project_brief.md"
+    brief.write_text(
+        "\n".join(
+            [
+                "## Objectives",
+                "- Ship the Supply-Chain dashboard for vendor_management.",
+                "# Limits",
+                "- Offline only.",
+                "### Artifacts",
+                "- Release notes and a cost report.",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    intent, _ = parse_brief(str(brief))
+    analysis = analyze_brief(intent.raw_text)
+
+    assert analyze_brief(intent.raw_text) is analysis
+    assert analysis.sections == {
+        "goals": ("- Ship the Supply-Chain dashboard for vendor_management.",),
+        "constraints": ("- Offline only.",),
+        "deliverables": ("- Release notes and a cost report.",),
+    }
+    assert analysis.route_tokens == _tokens(intent.raw_text)
+    assert "supply" in analysis.route_tokens and "management" in analysis.route_tokens
+    assert analysis.words["vendor_management"] == 1
+    assert intent.goals == ["Ship the Supply-Chain dashboard for vendor_management."]
@@ -0,0 +1,426 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from skill_autopilot import catalog
+from skill_autopilot.catalog import load_catalog
+from skill_autopilot.config import CatalogSource
+
+
+def _write_skill(root: Path, rel: str, name: str, tags: str = "planning") -> Path:
+    skill_dir = root / rel
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    path = skill_dir / "SKILL.md"
+    path.write_text(
+        f"""
+---
+name: {name}
+description: {name} skill for catalog tests.
+tags: [{tags}]
+---
+# {name}
+""".strip(),
+        encoding="utf-8",
+    )
+    return path
+
+
+def _count_parses(monkeypatch) -> list:
+    calls: list = []
+    original = catalog._skill_from_file
+
+    def _counting(skill_path, source):
+        calls.append(skill_path)
+        return original(skill_path, source)
+
+    monkeypatch.setattr(catalog, "_skill_from_file", _counting)
+    return calls
+
+
+def test_catalog_index_reparses_only_changed_files(tmp_path: Path, monkeypatch) -> None:
+    library = tmp_path / "skills"
+    _write_skill(library, "core/planner", "Planner")
+    reviewer = _write_skill(library, "core/reviewer", "Reviewer")
+    sources = [CatalogSource(name="local_library", path=str(library), pinned_ref="x")]
+    index_path = str(tmp_path / "state" / "catalog_index.json")
+
+    cold_skills, cold_hash = load_catalog(sources, index_path=index_path)
+    plain_skills, plain_hash = load_catalog(sources)
+    assert cold_hash == plain_hash
+    assert [s.model_dump() for s in cold_skills] == [s.model_dump() for s in plain_skills]
+
+    calls = _count_parses(monkeypatch)
+    warm_skills, warm_hash = load_catalog(sources, index_path=index_path)
+    assert calls == []
+    assert warm_hash == cold_hash
+    assert [s.model_dump() for s in warm_skills] == [s.model_dump() for s in cold_skills]
+
+    _write_skill(library, "core/reviewer", "Reviewer Two", tags="quality, review")
+    _write_skill(library, "core/scribe", "Scribe")
+    changed_skills, changed_hash = load_catalog(sources, index_path=index_path)
+    assert sorted(p.parent.name for p in calls) == ["reviewer", "scribe"]
+    assert changed_hash != cold_hash
+    assert changed_hash == load_catalog(sources)[1]
+    assert "core.scribe" in {s.skill_id for s in changed_skills}
+
+    reviewer.unlink()
+    removed_skills, removed_hash = load_catalog(sources, index_path=index_path)
+    assert "core.reviewer" not in {s.skill_id for s in removed_skills}
+    assert removed_hash == load_catalog(sources)[1]
+
+
+def test_catalog_index_ignored_when_builtin_skills_change(tmp_path: Path, monkeypatch) -> None:
+    from skill_autopilot.utils import canonical_json, sha256_hex
+
+    library = tmp_path / "skills"
+    _write_skill(library, "core/planner", "Planner")
+    sources = [CatalogSource(name="local_library", path=str(library), pinned_ref="x")]
+    index_path = str(tmp_path / "state" / "catalog_index.json")
+    _, old_hash = load_catalog(sources, index_path=index_path)
+
+    # Simulate upgrading to a build whose builtin skills differ; files are untouched.
+    upgraded = [
+        catalog.SkillRecord.from_dict(dict(record.as_dict(), description=record.description + " (v2)"))
+        for record in catalog._BUILTIN_RECORDS  # noqa: SLF001
+    ]
+    monkeypatch.setattr(catalog, "_BUILTIN_RECORDS", upgraded)
+    monkeypatch.setattr(
+        catalog, "_BUILTIN_DIGEST", sha256_hex(canonical_json([record.as_dict() for record in upgraded]))
+    )
+    calls = _count_parses(monkeypatch)
+    _, new_hash = load_catalog(sources, index_path=index_path)
+    assert len(calls) == 1
+    assert new_hash != old_hash
+    assert new_hash == load_catalog(sources)[1]
+
+    calls.clear()
+    assert load_catalog(sources, index_path=index_path)[1] == new_hash
+    assert calls == []
+
+
+def test_compact_records_match_metadata_and_snapshot_hash(tmp_path: Path) -> None:
+    from skill_autopilot.catalog import load_catalog_records
+    from skill_autopilot.models import SkillMetadata
+    from skill_autopilot.utils import canonical_json, sha256_hex
+
+    library = tmp_path / "skills"
+    _write_skill(library, "core/planner", "Planner", tags="planning, quality")
+    _write_skill(library, "core/reviewer", "Reviewer", tags="quality, review")
+    sources = [CatalogSource(name="local_library", path=str(library), pinned_ref="x")]
+
+    records, record_hash = load_catalog_records(sources)
+    skills, skills_hash = load_catalog(sources)
+    assert record_hash == skills_hash
+    validated = [SkillMetadata(**record.as_dict()) for record in records]
+    assert [s.model_dump() for s in skills] == [s.model_dump() for s in validated]
+    assert record_hash == sha256_hex(canonical_json([s.model_dump() for s in validated]))
+
+    by_id = {record.skill_id: record for record in records}
+    planner, reviewer = by_id["core.planner"], by_id["core.reviewer"]
+    assert isinstance(planner.tags, tuple)
+    assert not hasattr(planner, "__dict__")
+    assert planner.tags[planner.tags.index("quality")] is reviewer.tags[reviewer.tags.index("quality")]
+
+
+def test_catalog_service_reuses_snapshot_until_refresh(tmp_path: Path) -> None:
+    from skill_autopilot.catalog_service import CatalogService
+
+    library = tmp_path / "skills"
+    _write_skill(library, "core/planner", "Planner")
+    sources = [CatalogSource(name="local_library", path=str(library), pinned_ref="x")]
+    service = CatalogService(sources, index_path=str(tmp_path / "catalog_index.json"))
+    try:
+        first = service.snapshot()
+        assert first.snapshot_hash == load_catalog(sources)[1]
+        assert "core.planner" in first.skills_by_id
+        if service.watching:
+            assert service.snapshot() is first
+
+        _write_skill(library, "core/scribe", "Scribe")
+        refreshed = service.refresh()
+        assert refreshed.snapshot_hash != first.snapshot_hash
+        assert "core.scribe" in refreshed.skills_by_id
+        assert service.snapshot() is refreshed
+    finally:
+        service.stop()
+
+
+def test_catalog_service_rebuilds_on_skill_change(tmp_path: Path) -> None:
+    import time
+
+    from skill_autopilot.catalog_service import CatalogService
+
+    library = tmp_path / "skills"
+    _write_skill(library, "core/planner", "Planner")
+    service = CatalogService(
+        [CatalogSource(name="local_library", path=str(library), pinned_ref="x")],
+        debounce_seconds=0.05,
+    )
+    if not service.supports_watch():
+        return
+    try:
+        first = service.snapshot()
+        _write_skill(library, "core/scribe", "Scribe")
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and "core.scribe" not in service.snapshot().skills_by_id:
+            time.sleep(0.05)
+        assert "core.scribe" in service.snapshot().skills_by_id
+        assert service.snapshot().snapshot_hash != first.snapshot_hash
+    finally:
+        service.stop()
+
+
+def _wait_for_skill(service, skill_id: str, timeout: float = 5.0) -> bool:
+    import time
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if skill_id in service.snapshot().skills_by_id:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_catalog_service_picks_up_root_created_after_start(tmp_path: Path) -> None:
+    from skill_autopilot.catalog_service import CatalogService
+
+    library = tmp_path / "skills"
+    _write_skill(library, "core/planner", "Planner")
+    late = tmp_path / "late" / "skills"
+    service = CatalogService(
+        [
+            CatalogSource(name="local_library", path=str(library), pinned_ref="x"),
+            CatalogSource(name="late", path=str(late), pinned_ref="y"),
+        ],
+        debounce_seconds=0.05,
+    )
+    try:
+        assert "core.planner" in service.snapshot().skills_by_id
+        _write_skill(late, "extra/y", "Y")
+        assert "extra.y" in service.snapshot().skills_by_id
+        # The new root is watched from then on.
+        _write_skill(late, "extra/z", "Z")
+        assert _wait_for_skill(service, "extra.z")
+    finally:
+        service.stop()
+
+
+def test_catalog_service_rewatches_recreated_root(tmp_path: Path) -> None:
+    import shutil
+    import time
+
+    from skill_autopilot.catalog_service import CatalogService
+
+    library = tmp_path / "skills"
+    _write_skill(library, "core/planner", "Planner")
+    service = CatalogService(
+        [CatalogSource(name="local_library", path=str(library), pinned_ref="x")],
+        debounce_seconds=0.05,
+    )
+    try:
+        assert "core.planner" in service.snapshot().skills_by_id
+        shutil.rmtree(library)
+        _write_skill(library, "core/planner", "Planner")
+        # Let the rebuild triggered by the delete settle, so only a live watch can see "w".
+        time.sleep(0.5)
+        service.snapshot()
+        time.sleep(0.3)
+        _write_skill(library, "core/w", "W")
+        assert _wait_for_skill(service, "core.w")
+    finally:
+        service.stop()
+
+
+def test_catalog_service_logs_once_and_reloads_when_observer_fails(tmp_path: Path, monkeypatch, caplog) -> None:
+    from skill_autopilot import catalog_service
+
+    class _BrokenObserver:
+        starts = 0
+
+        def schedule(self, *args, **kwargs):
+            return None
+
+        def start(self):
+            _BrokenObserver.starts += 1
+            raise OSError("inotify instance limit reached")
+
+    monkeypatch.setattr(catalog_service, "Observer", _BrokenObserver)
+    library = tmp_path / "skills"
+    _write_skill(library, "core/planner", "Planner")
+    service = catalog_service.CatalogService([CatalogSource(name="local_library", path=str(library), pinned_ref="x")])
+    with caplog.at_level("WARNING", logger="skill_autopilot.catalog_service"):
+        assert "core.planner" in service.snapshot().skills_by_id
+        _write_skill(library, "core/scribe", "Scribe")
+        assert "core.scribe" in service.snapshot().skills_by_id
+    assert _BrokenObserver.starts == 1
+    assert len([record for record in caplog.records if "catalog watch unavailable" in record.message]) == 1
+    assert not service.watching
+
+
+def test_catalog_service_logs_failed_rebuild_and_keeps_snapshot(tmp_path: Path, monkeypatch, caplog) -> None:
+    from skill_autopilot import catalog_service
+
+    library = tmp_path / "skills"
+    _write_skill(library, "core/planner", "Planner")
+    service = catalog_service.CatalogService([CatalogSource(name="local_library", path=str(library), pinned_ref="x")])
+    try:
+        first = service.snapshot()
+
+        def _broken(*args, **kwargs):
+            raise PermissionError("catalog index not writable")
+
+        monkeypatch.setattr(catalog_service, "load_catalog_records", _broken)
+        with caplog.at_level("ERROR", logger="skill_autopilot.catalog_service"):
+            service._rebuild_from_timer()  # noqa: SLF001
+        assert [record.message for record in caplog.records] == ["catalog rebuild failed; keeping previous snapshot"]
+        assert caplog.records[0].exc_info is not None
+        assert service._snapshot is first  # noqa: SLF001
+    finally:
+        service.stop()
+
+
+def test_parallel_cold_load_matches_serial(tmp_path: Path) -> None:
+    outer = tmp_path / "workspace"
+    library = outer / "library" / "skills"
+    for i in range(40):
+        _write_skill(library, f"cluster{i % 5}/skill_{i:02d}", f"Skill {i}")
+    # Same relative IDs under a second source so duplicate resolution matters.
+    shadow = tmp_path / "shadow"
+    for i in range(0, 40, 3):
+        _write_skill(shadow, f"cluster{i % 5}/skill_{i:02d}", f"Shadow {i}")
+    sources = [
+        CatalogSource(name="workspace", path=str(outer), pinned_ref="w"),
+        CatalogSource(name="local_library", path=str(library), pinned_ref="l"),
+        CatalogSource(name="shadow", path=str(shadow), pinned_ref="s"),
+    ]
+
+    serial_skills, serial_hash = load_catalog(sources)
+    threaded_skills, threaded_hash = load_catalog(sources, max_workers=4)
+    process_skills, process_hash = load_catalog(sources, max_workers=2, executor="process")
+
+    assert threaded_hash == serial_hash
+    assert process_hash == serial_hash
+    assert [s.model_dump() for s in threaded_skills] == [s.model_dump() for s in serial_skills]
+    assert [s.model_dump() for s in process_skills] == [s.model_dump() for s in serial_skills]
+    by_id = {s.skill_id: s for s in serial_skills}
+    assert by_id["cluster0.skill_00"].source_repo == "shadow"
+    assert by_id["cluster1.skill_01"].source_repo == "local_library"
+
+
+def test_nested_source_roots_are_not_walked_twice(tmp_path: Path, monkeypatch) -> None:
+    workspace = tmp_path / "workspace"
+    library = workspace / "library" / "skills"
+    vendor = library / "vendor"
+    _write_skill(workspace, "tools/linter", "Linter")
+    _write_skill(library, "core/planner", "Planner")
+    _write_skill(vendor, "ops/pager", "Pager")
+    sources = [
+        CatalogSource(name="workspace", path=str(workspace), pinned_ref="w"),
+        CatalogSource(name="local_library", path=str(library), pinned_ref="l"),
+        CatalogSource(name="vendor", path=str(vendor), pinned_ref="v"),
+    ]
+
+    calls = _count_parses(monkeypatch)
+    skills, _ = load_catalog(sources)
+    by_id = {s.skill_id: s for s in skills}
+
+    assert len(calls) == 3
+    assert by_id["tools.linter"].source_repo == "workspace"
+    assert by_id["core.planner"].source_repo == "local_library"
+    assert by_id["ops.pager"].source_repo == "vendor"
+    assert not any(skill_id.startswith(("library.", "vendor.")) for skill_id in by_id)
+
+
+def _graph_skill(skill_id: str, dependencies=(), conflicts=(), tags=("planning",), description=None):
+    from skill_autopilot.models import SkillMetadata
+
+    return SkillMetadata(
+        skill_id=skill_id,
+        name=skill_id.replace(".", " "),
+        description=description or f"{skill_id} planning delivery skill",
+        tags=list(tags),
+        dependencies=list(dependencies),
+        conflicts=list(conflicts),
+        source_repo="test",
+        pinned_ref="x",
+    )
+
+
+def test_skill_graph_closures_and_diagnostics() -> None:
+    from skill_autopilot.skill_graph import SkillGraph
+
+    skills = [
+        _graph_skill("a.root", dependencies=["b.mid"]),
+        _graph_skill("b.mid", dependencies=["c.leaf", "z.missing"]),
+        _graph_skill("c.leaf"),
+        _graph_skill("d.loop", dependencies=["e.loop"]),
+        _graph_skill("e.loop", dependencies=["d.loop"]),
+        _graph_skill("f.self", dependencies=["f.self"], conflicts=["a.root"]),
+    ]
+    graph = SkillGraph(skills)
+
+    def ids(bits: int) -> set:
+        return {skill_id for i, skill_id in enumerate(graph.skill_ids) if bits >> i & 1}
+
+    assert ids(graph.closure_bits[graph.index_of["a.root"]]) == {"b.mid", "c.leaf"}
+    assert ids(graph.closure_bits[graph.index_of["d.loop"]]) == {"d.loop", "e.loop"}
+    assert graph.cycles == (("d.loop", "e.loop"), ("f.self",))
+    assert graph.missing_dependencies == {"b.mid": ("z.missing",)}
+    assert ids(graph.conflict_bits[graph.index_of["f.self"]]) == {"a.root"}
+    assert graph.conflict_bits[graph.index_of["a.root"]] == 0
+    assert graph.mask(["unknown"]) is None
+
+
+def test_routing_with_skill_graph_matches_plain_routing() -> None:
+    from skill_autopilot.models import BriefIntent, RoutingPolicy
+    from skill_autopilot.router import route_skills
+    from skill_autopilot.skill_graph import SkillGraph
+
+    skills = [
+        _graph_skill("core.planner", dependencies=["core.tracker"]),
+        _graph_skill("core.tracker", dependencies=["ops.ledger"], tags=("tracking",)),
+        _graph_skill("ops.ledger", tags=("ledger",), description="Append-only records"),
+        _graph_skill("core.rival", conflicts=["core.planner"]),
+        _graph_skill("ops.reviewer", conflicts=["ops.auditor"]),
+        _graph_skill("ops.auditor", conflicts=["ops.reviewer"]),
+    ]
+    intent = BriefIntent(
+        goals=["planning delivery"],
+        constraints=["local"],
+        deliverables=["plan"],
+        risk_tier="medium",
+        evidence_level="standard",
+        raw_text="core planner rival reviewer auditor planning delivery skill",
+    )
+    policy = RoutingPolicy(max_skills_per_cluster=5, min_relevance_score=0.3)
+
+    plain = route_skills(intent, skills, ["claude_desktop"], policy=policy, snapshot_hash="snap")
+    compiled = route_skills(
+        intent, skills, ["claude_desktop"], policy=policy, snapshot_hash="snap", graph=SkillGraph(skills)
+    )
+    assert compiled.selected_skills == plain.selected_skills
+    assert compiled.rejected_skills == plain.rejected_skills
+    selected = {item.skill_id: item.reason for item in plain.selected_skills}
+    assert selected.get("ops.ledger") == "dependency of core.tracker"
+    assert sum("conflicts with" in item.reason for item in plain.rejected_skills) == 2
+
+
+@pytest.mark.parametrize("with_graph", [False, True])
+def test_chained_conflicts_skip_already_dropped_skills(with_graph: bool) -> None:
+    from skill_autopilot.router import SkillScore, _resolve_conflicts
+    from skill_autopilot.skill_graph import SkillGraph
+
+    # a beats b, then b (already dropped) must not be looked up again, so c survives.
+    skills = [
+        _graph_skill("a.lead", conflicts=["b.middle"]),
+        _graph_skill("b.middle", conflicts=["c.tail"]),
+        _graph_skill("c.tail"),
+    ]
+    selected = {skill.skill_id: SkillScore(skill=skill, score=1.0 - i * 0.1, reason="match") for i, skill in enumerate(skills)}
+    graph = SkillGraph(skills) if with_graph else None
+
+    kept, rejected = _resolve_conflicts(selected, graph)
+    assert sorted(kept) == ["a.lead", "c.tail"]
+    assert [(item.skill_id, item.reason) for item in rejected] == [("b.middle", "conflicts with a.lead")]
@@ -72,6 +72,57 @@ def test_start_project_success(tmp_path: Path) -> None:
     assert status.active_skill_count > 0
 
 
+def test_identical_briefs_reuse_cached_route(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from skill_autopilot import route_cache
+    from skill_autopilot.route_cache import route_cache_key
+    from skill_autopilot.models import RoutingPolicy
+
+    config = _make_config(tmp_path)
+    engine = SkillAutopilotEngine(config)
+    responses = []
+    for name in ("one", "two"):
+        workspace = tmp_path / name
+        workspace.mkdir()
+        brief = workspace / "project_brief.md"
+        _write_brief(brief)
+        responses.append(
+            engine.start_project(
+                StartProjectRequest(workspace_path=str(workspace), brief_path=str(brief), host_targets=["claude_desktop"])
+            )
+        )
+
+    assert engine.route_cache.hits == 1
+    assert responses[0].selected_skills == responses[1].selected_skills
+    first_route = engine.db.get_latest_route(responses[0].project_id)
+    second_route = engine.db.get_latest_route(responses[1].project_id)
+    assert first_route["route_id"] != second_route["route_id"]
+    assert first_route["plan_hash"] == second_route["plan_hash"]
+    assert first_route["rejected_skills_json"] == second_route["rejected_skills_json"]
+
+    # A fresh engine on the same state database is served from the SQLite level.
+    restarted = SkillAutopilotEngine(config)
+    brief = tmp_path / "three" / "project_brief.md"
+    brief.parent.mkdir()
+    _write_brief(brief)
+    restarted.start_project(
+        StartProjectRequest(workspace_path=str(brief.parent), brief_path=str(brief), host_targets=["claude_desktop"])
+    )
+    assert restarted.route_cache.hits == 1
+
+    # A routing-algorithm version bump misses the rows persisted by the old version.
+    monkeypatch.setattr(route_cache, "ROUTE_CACHE_VERSION", route_cache.ROUTE_CACHE_VERSION + 1)
+    upgraded = SkillAutopilotEngine(config)
+    upgraded.start_project(
+        StartProjectRequest(workspace_path=str(brief.parent), brief_path=str(brief), host_targets=["claude_desktop"])
+    )
+    assert (upgraded.route_cache.hits, upgraded.route_cache.misses) == (0, 1)
+
+    intent, _ = parse_brief(str(brief))
+    policy = RoutingPolicy()
+    assert route_cache_key(intent, "snap", policy, ["b", "a", "a"]) == route_cache_key(intent, "snap", policy, ["a", "b"])
+    assert route_cache_key(intent, "snap", policy, ["a"]) != route_cache_key(intent, "snap-2", policy, ["a"])
+
+
 def test_invalid_brief_rejected(tmp_path: Path) -> None:
     brief = tmp_path / "project_brief.md"
     brief.write_text("too short", encoding="utf-8")
@@ -99,6 +150,10 @@ def test_reroute_material_change(tmp_path: Path) -> None:
             host_targets=["claude_desktop"],
         )
     )
+    # start_project attached a brief watcher that reroutes on edits by itself.
+    # If it applied this edit first, the explicit reroute below would see no
+    # material change, so this test drives rerouting through the API only.
+    engine.watcher.remove(response.project_id)
 
     _write_brief(brief, extra="\n# Constraints\n- New strict compliance policy and audit needs.")
     result = engine.reroute_project(response.project_id)
@@ -127,6 +182,176 @@ def test_reroute_non_material_with_force(tmp_path: Path) -> None:
     assert forced["reason"] == "forced"
 
 
+def test_reroute_materiality_survives_restart(tmp_path: Path) -> None:
+    brief = tmp_path / "project_brief.md"
+    _write_brief(brief)
+    config = _make_config(tmp_path)
+    engine = SkillAutopilotEngine(config)
+    response = engine.start_project(
+        StartProjectRequest(workspace_path=str(tmp_path), brief_path=str(brief), host_targets=["claude_desktop"])
+    )
+    engine.watcher.remove(response.project_id)
+
+    restarted = SkillAutopilotEngine(config)
+    skipped = restarted.reroute_project(response.project_id)
+    assert skipped["rerouted"] is False
+    assert skipped["reason"] == "non_material_change"
+
+    _write_brief(brief, extra="\n# Constraints\n- New strict compliance policy and audit needs.")
+    assert restarted.reroute_project(response.project_id)["rerouted"] is True
+
+
+def test_watcher_skips_unchanged_brief_content(tmp_path: Path) -> None:
+    import os
+
+    brief = tmp_path / "project_brief.md"
+    _write_brief(brief)
+    engine = SkillAutopilotEngine(_make_config(tmp_path))
+    response = engine.start_project(
+        StartProjectRequest(workspace_path=str(tmp_path), brief_path=str(brief), host_targets=["claude_desktop"])
+    )
+    engine.watcher.remove(response.project_id)
+    project_id = response.project_id
+
+    assert engine._brief_unchanged(project_id, str(brief)) is True
+
+    # Same bytes, new mtime: the digest check catches it and refreshes the stat.
+    stat = brief.stat()
+    os.utime(brief, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert engine.db.get_brief_stat(project_id) != (brief.stat().st_mtime_ns, stat.st_size, stat.st_ino)
+    assert engine._brief_unchanged(project_id, str(brief)) is True
+    assert engine.db.get_brief_stat(project_id) == (brief.stat().st_mtime_ns, stat.st_size, stat.st_ino)
+
+    _write_brief(brief, extra="\n# Constraints\n- New strict compliance policy and audit needs.")
+    assert engine._brief_unchanged(project_id, str(brief)) is False
+    assert engine.reroute_project(project_id)["rerouted"] is True
+    assert engine._brief_unchanged(project_id, str(brief)) is True
+
+
+def test_watcher_registry_shares_observer_and_debounces(tmp_path: Path) -> None:
+    import threading
+    from types import SimpleNamespace
+
+    from skill_autopilot.watcher import BriefWatcherRegistry
+
+    brief = tmp_path / "project_brief.md"
+    _write_brief(brief)
+    registry = BriefWatcherRegistry(debounce_seconds=0.05, max_workers=1)
+    if not registry.supports_watch():
+        pytest.skip("watchdog not installed")
+
+    calls: dict[str, int] = {"a": 0, "b": 0}
+    fired = threading.Event()
+
+    def _callback(name: str):
+        def _run() -> None:
+            calls[name] += 1
+            if all(calls.values()):
+                fired.set()
+
+        return _run
+
+    registry.add("a", str(brief), _callback("a"))
+    registry.add("b", str(brief), _callback("b"))
+    registry.add("c", str(tmp_path / "other.md"), _callback("a"))
+    assert len(registry._directories) == 1
+    assert registry._directories[str(tmp_path.resolve())][1] == 3
+
+    # A burst of events, including a rename over the brief, is one callback per project.
+    registry._on_event(str(tmp_path / "unrelated.md"))
+    registry._on_event(str(brief))
+    registry._on_event(str(brief))
+    registry._handler.on_moved(SimpleNamespace(src_path=str(tmp_path / ".brief.swp"), dest_path=str(brief)))
+    assert fired.wait(timeout=2)
+    threading.Event().wait(0.2)
+    assert calls == {"a": 1, "b": 1}
+
+    registry.clear()
+    assert registry._directories == {}
+    assert registry._observer is None
+
+
+def test_watcher_registry_close_stops_background_threads(tmp_path: Path) -> None:
+    import threading
+
+    from skill_autopilot.watcher import BriefWatcherRegistry
+
+    brief = tmp_path / "project_brief.md"
+    _write_brief(brief)
+    before = set(threading.enumerate())
+    registry = BriefWatcherRegistry(debounce_seconds=0.01, backend="auto", poll_interval_seconds=0.05)
+    ran = threading.Event()
+    registry.add("watched", str(brief), ran.set)
+    registry._poller.add(str(tmp_path / "other.md"))  # noqa: SLF001
+    registry._on_due(str(brief.resolve()))  # noqa: SLF001
+    registry._scheduler.touch("idle")  # noqa: SLF001
+    assert ran.wait(timeout=2)
+
+    registry.close()
+    leftover = [thread for thread in set(threading.enumerate()) - before if thread.is_alive()]
+    assert leftover == []
+    assert registry._observer is None  # noqa: SLF001
+    assert registry.add("late", str(brief), ran.set) is None
+
+
+def test_watcher_poll_backend_detects_brief_edits(tmp_path: Path) -> None:
+    import threading
+
+    from skill_autopilot.watcher import BriefWatcherRegistry
+
+    briefs = [tmp_path / f"brief_{i}.md" for i in range(5)]
+    for brief in briefs:
+        _write_brief(brief)
+    registry = BriefWatcherRegistry(
+        debounce_seconds=0.05, backend="poll", poll_interval_seconds=0.05, poll_batch_size=2
+    )
+    fired = threading.Event()
+    calls: list[str] = []
+
+    def _callback(name: str):
+        def _run() -> None:
+            calls.append(name)
+            fired.set()
+
+        return _run
+
+    for i, brief in enumerate(briefs):
+        assert registry.add(f"p{i}", str(brief), _callback(f"p{i}")) == "poll"
+    assert registry._directories == {}
+    threading.Event().wait(0.2)
+    assert calls == []
+
+    _write_brief(briefs[3], extra="\n# Constraints\n- New strict compliance policy and audit needs.")
+    assert fired.wait(timeout=2)
+    threading.Event().wait(0.2)
+    assert calls == ["p3"]
+
+    registry.clear()
+    assert len(registry._poller) == 0
+
+
+def test_intent_fingerprint_matches_exact_materiality(tmp_path: Path) -> None:
+    from skill_autopilot.brief_parser import is_material_change
+    from skill_autopilot.intent_fingerprint import fingerprint_intent, is_material_fingerprint_change
+
+    brief = tmp_path / "project_brief.md"
+    _write_brief(brief)
+    base, _ = parse_brief(str(brief))
+    edits = [
+        "",
+        "\n",
+        "\n- Keep setup simple.",
+        "\nAdd a reporting dashboard with weekly metrics and owner sign off.",
+        "\n# Constraints\n- New strict compliance policy and audit needs.",
+    ]
+    for extra in edits:
+        _write_brief(brief, extra=extra)
+        edited, _ = parse_brief(str(brief))
+        assert is_material_fingerprint_change(fingerprint_intent(base), fingerprint_intent(edited)) == is_material_change(
+            base, edited
+        )
+
+
 def test_end_project_deactivates_leases(tmp_path: Path) -> None:
     brief = tmp_path / "project_brief.md"
     _write_brief(brief)
@@ -192,6 +417,64 @@ def test_route_determinism(tmp_path: Path) -> None:
     assert [s.skill_id for s in route_a.selected_skills] == [s.skill_id for s in route_b.selected_skills]
 
 
+def test_routing_index_matches_per_skill_scoring(tmp_path: Path) -> None:
+    from skill_autopilot import router
+    from skill_autopilot.router import RoutingIndex
+
+    brief = tmp_path / "project_brief.md"
+    _write_brief(brief, extra="\nNeed screenshot evidence and a security review for the web release.")
+    intent, _ = parse_brief(str(brief))
+    packaged_root = Path(__file__).resolve().parents[1] / "skills"
+    skills, snapshot = load_catalog([CatalogSource(name="local_library", path=str(packaged_root), pinned_ref="test")])
+    policy = config_to_policy(_make_config(tmp_path))
+    index = RoutingIndex(skills)
+
+    indexed = router._score_catalog(intent, index, ["claude_desktop"], policy)
+    reference = [router._score_skill(intent, skill, ["claude_desktop"], policy) for skill in skills]
+    assert [(s.skill.skill_id, s.score, s.reason, s.explicitly_requested) for s in indexed] == [
+        (s.skill.skill_id, s.score, s.reason, s.explicitly_requested) for s in reference
+    ]
+
+    with_index = route_skills(intent, skills, ["claude_desktop"], policy=policy, snapshot_hash=snapshot, index=index)
+    without_index = route_skills(intent, skills, ["claude_desktop"], policy=policy, snapshot_hash=snapshot)
+    assert with_index.plan_hash == without_index.plan_hash
+    assert with_index.selected_skills == without_index.selected_skills
+    assert with_index.rejected_skills == without_index.rejected_skills
+
+
+def test_numpy_backend_matches_python_scoring(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    from skill_autopilot import router
+    from skill_autopilot.router import RoutingIndex
+    from skill_autopilot.vector_router import score_catalog_vectorized
+
+    brief = tmp_path / "project_brief.md"
+    _write_brief(brief, extra="\nNeed screenshot evidence and a security review for the web release.")
+    intent, _ = parse_brief(str(brief))
+    intent = intent.model_copy(update={"risk_tier": "high", "evidence_level": "strict"})
+    packaged_root = Path(__file__).resolve().parents[1] / "skills"
+    skills, snapshot = load_catalog([CatalogSource(name="local_library", path=str(packaged_root), pinned_ref="test")])
+    index = RoutingIndex(skills)
+    policy = config_to_policy(_make_config(tmp_path)).model_copy(
+        update={"preferred_sources": ["local_library"], "preferred_source_bonus": 0.07}
+    )
+
+    for hosts in (["claude_desktop"], ["claude_desktop", "codex"], ["unknown_host"]):
+        python_scored = router._score_catalog(intent, index, hosts, policy)
+        python_scored.sort(key=lambda item: (-item.score, item.skill.skill_id))
+        vector_scored = score_catalog_vectorized(intent, index, hosts, policy)
+        assert [(s.skill.skill_id, s.score, s.reason, s.utility, s.explicitly_requested) for s in vector_scored] == [
+            (s.skill.skill_id, s.score, s.reason, s.utility, s.explicitly_requested) for s in python_scored
+        ]
+
+    python_route = route_skills(intent, skills, ["claude_desktop"], policy=policy, snapshot_hash=snapshot, index=index)
+    numpy_route = route_skills(
+        intent, skills, ["claude_desktop"], policy=policy, snapshot_hash=snapshot, index=index, backend="numpy"
+    )
+    assert numpy_route.plan_hash == python_route.plan_hash
+    assert numpy_route.rejected_skills == python_route.rejected_skills
+
+
 def config_to_policy(config: AppConfig):
     from skill_autopilot.models import RoutingPolicy
 
@@ -504,3 +787,280 @@ def test_task_machine_skip(tmp_path: Path) -> None:
     # The next task should be different from the skipped one.
     if result["next"]["status"] == "ready":
         assert str(result["next"]["task"]["task_id"]) != task_id
+
+
+def test_task_machine_compiles_each_plan_once(tmp_path: Path) -> None:
+    brief = tmp_path / "project_brief.md"
+    _write_brief(brief)
+    engine = SkillAutopilotEngine(_make_config(tmp_path))
+    response = engine.start_project(
+        StartProjectRequest(workspace_path=str(tmp_path), brief_path=str(brief), host_targets=["claude_desktop"])
+    )
+    plan = engine.db.get_latest_plan(response.project_id)
+    assert engine.db.get_latest_plan_id(response.project_id) == plan["plan_id"]
+
+    loads: list[str] = []
+    get_plan = engine.db.get_plan
+
+    def _counting_get_plan(plan_id: str):
+        loads.append(plan_id)
+        return get_plan(plan_id)
+
+    engine.db.get_plan = _counting_get_plan  # type: ignore[method-assign]
+    engine.task_machine.start_run(project_id=response.project_id, plan_id=plan["plan_id"])
+    first = engine.task_machine.next_task(response.project_id)
+    first["task"]["title"] = "mutated by caller"
+    engine.task_machine.complete_task(response.project_id, str(first["task"]["task_id"]), summary="done")
+    engine.task_machine.task_checklist(response.project_id)
+    assert loads == [plan["plan_id"]]
+
+    compiled = engine.task_machine.plans.get(plan["plan_id"])
+    phases = plan["plan_json"]["phases"]
+    assert compiled.total_tasks == sum(len(phase["tasks"]) for phase in phases)
+    for phase in phases:
+        for position, task in enumerate(phase["tasks"]):
+            assert compiled.task_index[str(task["task_id"])] == (phase["name"], position)
+            assert task["title"] != "mutated by caller"
+    assert compiled.phases[0][1][0]["title"] != "mutated by caller"
+
+
+def test_run_task_state_counters_and_backfill(tmp_path: Path) -> None:
+    import sqlite3
+
+    from skill_autopilot.db import Database
+
+    db = Database(str(tmp_path / "state.db"))
+    db.upsert_project("p1", str(tmp_path), str(tmp_path / "project_brief.md"), "active")
+    db.create_project_run("r1", "p1", None, "plan-1")
+
+    def _record(task_id: str, status: str) -> dict:
+        return db.record_task_run(
+            task_run_id=str(uuid4()),
+            run_id="r1",
+            project_id="p1",
+            phase="build",
+            task_id=task_id,
+            title=task_id,
+            agent_role="claude_desktop",
+            status=status,
+            output={},
+        )
+
+    # Well past the old 500-row window.
+    for _ in range(520):
+        _record("t-retry", "failed")
+    _record("t-retry", "completed")
+    _record("t-done", "skipped")
+    counters = _record("t-done", "failed")
+    assert counters == {
+        "order_index": 523,
+        "task_run_count": 523,
+        "completed_count": 1,
+        "skipped_count": 1,
+        "failed_count": 521,
+        "done_count": 2,
+    }
+    states = db.get_run_task_states("r1")
+    assert states["t-retry"]["status"] == "completed"
+    assert (states["t-retry"]["first_order_index"], states["t-retry"]["last_order_index"]) == (1, 521)
+    assert states["t-done"]["status"] == "failed" and states["t-done"]["done"] == 1
+    assert db.get_run_done_task_ids("r1") == {"t-retry", "t-done"}
+
+    # A database from before the counter columns (and schema_version) is backfilled from task_runs on open.
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute("DROP TABLE schema_version")
+        conn.execute("DELETE FROM run_task_state")
+        for column in ("task_run_count", "completed_count", "skipped_count", "failed_count", "done_count"):
+            conn.execute(f"ALTER TABLE project_runs DROP COLUMN {column}")
+    reopened = Database(db.db_path)
+    assert reopened.get_run_counters("r1") == {key: value for key, value in counters.items() if key != "order_index"}
+    assert reopened.get_run_task_states("r1") == states
+
+
+def test_task_machine_batch_complete_and_skip(tmp_path: Path) -> None:
+    brief = tmp_path / "project_brief.md"
+    _write_brief(brief)
+    engine = SkillAutopilotEngine(_make_config(tmp_path))
+    response = engine.start_project(
+        StartProjectRequest(workspace_path=str(tmp_path), brief_path=str(brief), host_targets=["claude_desktop"])
+    )
+    project_id = response.project_id
+    plan = engine.db.get_latest_plan(project_id)
+    run_id = engine.task_machine.start_run(project_id=project_id, plan_id=plan["plan_id"])
+    discovery = next(phase for phase in plan["plan_json"]["phases"] if phase["name"] == "discovery")
+    discovery_ids = [str(task["task_id"]) for task in discovery["tasks"]]
+    assert len(discovery_ids) >= 2
+
+    result = engine.task_machine.complete_tasks(
+        project_id,
+        [{"task_id": discovery_ids[0], "summary": "first"}, {"task_id": "no-such-task"}]
+        + [{"task_id": task_id} for task_id in discovery_ids[1:]],
+    )
+    assert result["completed_task_ids"] == discovery_ids
+    assert result["results"][1] == {"task_id": "no-such-task", "status": "error", "error": "unknown task_id"}
+    assert engine.db.is_gate_approved(project_id, "gate-1")
+    assert result["next"]["status"] == "ready"
+    assert result["next"]["phase"] != "discovery"
+    assert [tr["order_index"] for tr in engine.db.list_task_runs(run_id)] == list(range(1, len(discovery_ids) + 1))
+
+    remaining = [
+        str(task["task_id"])
+        for phase in plan["plan_json"]["phases"]
+        for task in phase["tasks"]
+        if str(task["task_id"]) not in discovery_ids
+    ]
+    skipped = engine.task_machine.skip_tasks(project_id, [{"task_id": task_id, "reason": "n/a"} for task_id in remaining])
+    assert skipped["skipped_task_ids"] == remaining
+    assert skipped["next"]["status"] in {"blocked", "all_complete"}
+    counters = engine.db.get_run_counters(run_id)
+    assert counters["completed_count"] == len(discovery_ids)
+    assert counters["skipped_count"] == len(remaining)
+    assert counters["done_count"] == len(discovery_ids) + len(remaining)
+
+
+def test_database_reuses_thread_local_connections(tmp_path: Path) -> None:
+    import sqlite3
+    import threading
+
+    from skill_autopilot.db import Database
+
+    db = Database(str(tmp_path / "state.db"), max_connections=2)
+    with db._connect() as first:  # noqa: SLF001
+        pass
+    with db._connect() as second:  # noqa: SLF001
+        # Nested uses share the connection and the outer transaction.
+        with db._connect() as nested:  # noqa: SLF001
+            assert nested is second
+    assert first is second
+    assert db.pool_size() == 1
+
+    # A failed call rolls back and leaves the connection usable.
+    with pytest.raises(sqlite3.OperationalError):
+        with db._connect() as conn:  # noqa: SLF001
+            conn.execute("INSERT INTO projects VALUES ('p1', 'w', 'b', 'active', 'now', 'now', NULL)")
+            conn.execute("SELECT * FROM no_such_table")
+    assert db.get_project("p1") is None
+    db.upsert_project("p1", str(tmp_path), str(tmp_path / "project_brief.md"), "active")
+    assert db.get_project("p1")["state"] == "active"
+
+    # Threads past the cap still work, on a connection for the one call.
+    seen: list = []
+    gate = threading.Barrier(3)
+
+    def worker() -> None:
+        gate.wait()
+        seen.append(db.get_project("p1")["project_id"])
+        gate.wait()
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen == ["p1", "p1", "p1"]
+    assert db.pool_size() == 2
+
+    db.close()
+    assert db.pool_size() == 0
+    assert db.get_project("p1")["state"] == "active"
+    with db._connect() as reopened:  # noqa: SLF001
+        assert reopened is not first
+
+
+def test_schema_migrations_add_indexes_to_existing_databases(tmp_path: Path) -> None:
+    import sqlite3
+
+    from skill_autopilot.db import _MIGRATIONS, Database
+
+    db = Database(str(tmp_path / "state.db"))
+    latest = _MIGRATIONS[-1][0]
+    assert db.get_schema_version() == latest
+
+    with db._connect() as conn:  # noqa: SLF001
+        plan = conn.execute(
+            """
+            EXPLAIN QUERY PLAN SELECT * FROM task_runs
+            WHERE project_id=? ORDER BY COALESCE(ended_at, started_at) DESC LIMIT 1
+            """,
+            ("p1",),
+        ).fetchall()
+    assert "idx_task_runs_project_recent" in plan[0]["detail"]
+    assert not any("TEMP B-TREE" in row["detail"] for row in plan)
+    db.close()
+
+    # A pre-versioning state.db: no schema_version table and no secondary indexes.
+    with sqlite3.connect(db.db_path) as conn:
+        names = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE name LIKE 'idx_%'")]
+        for name in names:
+            conn.execute(f"DROP INDEX {name}")
+        conn.execute("DROP TABLE schema_version")
+    reopened = Database(db.db_path)
+    assert reopened.get_schema_version() == latest
+    with reopened._connect() as conn:  # noqa: SLF001
+        restored = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE name LIKE 'idx_%'")}
+        applied = [row["version"] for row in conn.execute("SELECT version FROM schema_version ORDER BY version")]
+    assert restored == set(names)
+    assert applied == [version for version, _, _ in _MIGRATIONS]
+
+
+def test_start_project_writes_are_atomic(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    brief = tmp_path / "project_brief.md"
+    _write_brief(brief)
+    engine = SkillAutopilotEngine(_make_config(tmp_path))
+    request = StartProjectRequest(workspace_path=str(tmp_path), brief_path=str(brief), host_targets=["claude_desktop"])
+
+    commits: list = []
+    with engine.db._connect() as conn:  # noqa: SLF001
+        conn.set_trace_callback(lambda sql: commits.append(sql) if sql.strip().upper() == "COMMIT" else None)
+    started = engine.start_project(request)
+    assert engine.db.get_project(started.project_id)["state"] == "active"
+    # One for the new route cache entry, one for everything the start wrote.
+    assert len(commits) == 2
+
+    def _fail(*args, **kwargs):
+        raise RuntimeError("fingerprint store failed")
+
+    monkeypatch.setattr(engine, "_store_fingerprint", _fail)
+    with pytest.raises(RuntimeError):
+        engine.start_project(request)
+    # Project, route, plan and leases of the failed start were all rolled back.
+    assert [row["project_id"] for row in engine.db.list_projects()] == [started.project_id]
+    assert {lease["project_id"] for lease in engine.db.get_active_leases()} == {started.project_id}
+
+    with pytest.raises(RuntimeError):
+        with engine.db.transaction():
+            engine.db.set_project_state(started.project_id, "closing")
+            with engine.db.transaction():
+                engine.db.add_audit_event(event_type="test.nested", project_id=started.project_id, payload={})
+            raise RuntimeError("abort")
+    assert engine.db.get_project(started.project_id)["state"] == "active"
+    assert not [e for e in engine.db.list_recent_audit_events(started.project_id, limit=50) if e["event_type"] == "test.nested"]
+
+
+def test_host_adapters_run_outside_transactions(tmp_path: Path) -> None:
+    brief = tmp_path / "project_brief.md"
+    _write_brief(brief)
+    engine = SkillAutopilotEngine(_make_config(tmp_path))
+    adapter = engine.lease_manager.adapters["claude_desktop"]
+    in_transaction: list = []
+
+    def _tracking(method):
+        def call(*args, **kwargs):
+            in_transaction.append(getattr(engine.db._local, "active", None) is not None)  # noqa: SLF001
+            return method(*args, **kwargs)
+
+        return call
+
+    adapter.activate = _tracking(adapter.activate)
+    adapter.deactivate = _tracking(adapter.deactivate)
+
+    started = engine.start_project(
+        StartProjectRequest(workspace_path=str(tmp_path), brief_path=str(brief), host_targets=["claude_desktop"])
+    )
+    engine.reroute_project(started.project_id, force=True)
+    closed = engine.end_project(EndProjectRequest(project_id=started.project_id, reason="completed"))
+
+    # activate on start; deactivate + activate on reroute; deactivate on end.
+    assert in_transaction == [False, False, False, False]
+    assert closed.status == "closed"
+    assert engine.get_project_status(started.project_id).active_skill_count == 0
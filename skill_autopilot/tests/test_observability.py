@@ -117,3 +117,111 @@ def test_project_observability_contains_task_and_audit_context(tmp_path: Path) -
     assert isinstance(out["recent_tasks"], list)
     assert isinstance(out["recent_audit_events"], list)
     assert isinstance(out["active_leases_by_host"], dict)
+
+
+def test_audit_writer_batches_flushes_and_counts_drops() -> None:
+    import threading
+
+    from skill_autopilot.audit import AuditWriter
+
+    written: list = []
+    gate = threading.Event()
+    gate.set()
+
+    def _write(rows) -> None:
+        gate.wait()
+        written.append(list(rows))
+
+    writer = AuditWriter(_write, max_queue_size=4, batch_size=3, flush_interval_seconds=60, enqueue_timeout_seconds=0.01)
+    rows = [(None, None, "test.event", "{}", str(i)) for i in range(3)]
+    assert writer.submit(rows) == 3
+    assert writer.flush(timeout=5)
+    assert [len(batch) for batch in written] == [3]
+
+    # A stalled writer: the queue fills, callers wait briefly, then events are dropped.
+    gate.clear()
+    writer.submit([(None, None, "test.event", "{}", "stall")])
+    assert not writer.flush(timeout=0.2)
+    assert writer.metrics()["queue_depth"] == 0
+    accepted = writer.submit([(None, None, "test.event", "{}", str(i)) for i in range(6)])
+    metrics = writer.metrics()
+    assert accepted == 4
+    assert metrics["dropped"] == 2
+    assert metrics["backpressure_waits"] >= 2
+    gate.set()
+    writer.close(timeout=5)
+    assert sum(len(batch) for batch in written) == 3 + 1 + 4
+    assert writer.metrics()["written"] == 8
+
+
+def test_audit_events_are_written_behind_and_only_after_commit(tmp_path: Path) -> None:
+    brief = tmp_path / "project_brief.md"
+    _write_brief(brief)
+    engine = SkillAutopilotEngine(_make_config(tmp_path))
+    assert engine.db.audit_writer is not None
+    started = engine.start_project(
+        StartProjectRequest(workspace_path=str(tmp_path), brief_path=str(brief), host_targets=["claude_desktop"])
+    )
+
+    try:
+        with engine.db.transaction():
+            engine.db.add_audit_event(event_type="test.rolled_back", project_id=started.project_id, payload={})
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    engine.db.add_audit_event(event_type="test.kept", project_id=started.project_id, payload={"n": 1})
+
+    # Reads flush the writer first.
+    events = [item["event_type"] for item in engine.db.list_recent_audit_events(started.project_id, limit=50)]
+    assert events[0] == "test.kept"
+    assert "project.start" in events and "adapter.activate" in events
+    assert "test.rolled_back" not in events
+    metrics = engine.observability_overview(stale_minutes=10, limit=5)["audit_writer"]
+    assert metrics["queue_depth"] == 0 and metrics["dropped"] == 0
+    assert metrics["written"] == metrics["enqueued"] >= len(events)
+
+
+def test_audit_retention_archives_rolls_up_and_keeps_hot_window(tmp_path: Path) -> None:
+    import gzip
+    import json
+
+    from skill_autopilot.config import _parse_retention_overrides
+
+    config = _make_config(tmp_path)
+    config.audit_retention_days = 30
+    config.audit_retention_overrides = _parse_retention_overrides("watcher.*:1, task.completed:0, bad")
+    assert config.audit_retention_overrides == {"watcher.*": 1, "task.completed": 0}
+    engine = SkillAutopilotEngine(config)
+    db = engine.db
+
+    def _add(event_type: str, age_days: float) -> None:
+        db.add_audit_event(event_type=event_type, project_id="p1", payload={"type": event_type})
+        db.flush_audit()
+        created = (datetime.now(timezone.utc) - timedelta(days=age_days)).isoformat()
+        with db._connect() as conn:  # noqa: SLF001 - test helper only
+            conn.execute("UPDATE audit_events SET created_at=? WHERE event_id=(SELECT MAX(event_id) FROM audit_events)", (created,))
+
+    _add("watcher.trigger", 2)  # past its 1-day override
+    _add("watcher_trigger", 2)  # "_" is not a wildcard: default 30 days, kept
+    _add("task.completed", 400)  # kept forever
+    _add("adapter.activate", 45)  # past the default
+    _add("adapter.activate", 45)
+    _add("project.start", 3)
+
+    result = engine.compact_audit_events()
+    assert result["archived"] == 3
+    [segment] = result["segments"]
+    assert Path(segment).parent == tmp_path / "audit_archive"
+    with gzip.open(segment, "rt", encoding="utf-8") as handle:
+        archived = [json.loads(line) for line in handle]
+    assert [item["event_type"] for item in archived] == ["watcher.trigger", "adapter.activate", "adapter.activate"]
+    assert archived[0]["payload"] == {"type": "watcher.trigger"}
+
+    rollups = {(row["event_type"], row["event_count"]) for row in db.list_audit_rollups("p1")}
+    assert rollups == {("watcher.trigger", 1), ("adapter.activate", 2)}
+    hot = [item["event_type"] for item in db.list_recent_audit_events("p1", limit=10)]
+    assert hot == ["project.start", "task.completed", "watcher_trigger"]
+
+    # Nothing left to expire; the service loop only re-runs after the interval.
+    assert engine.compact_audit_events()["archived"] == 0
+    assert engine.maybe_compact_audit_events() is None
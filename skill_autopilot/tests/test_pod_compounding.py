@@ -161,3 +161,166 @@ class TestIndustryPodMapCoverage:
                 assert pid in ALL_ATTACHABLE_PODS, (
                     f"Industry '{industry}' references unknown pod '{pid}'"
                 )
+
+
+class TestSignalAutomaton:
+    """The single-pass matcher must agree with plain substring checks."""
+
+    def test_overlapping_and_nested_patterns(self) -> None:
+        from skill_autopilot.signals import SignalAutomaton
+
+        automaton = SignalAutomaton(["audit", "audit trail", "trail", "bi ", "data pipeline", "pipe"])
+        assert automaton.find("an audit trail for the bi data pipeline") == {
+            "audit",
+            "audit trail",
+            "trail",
+            "bi ",
+            "data pipeline",
+            "pipe",
+        }
+        assert automaton.find("bi") == frozenset()
+
+    def test_matches_substring_search_for_all_signal_terms(self) -> None:
+        import random
+
+        from skill_autopilot.signals import SIGNAL_AUTOMATON, _all_signal_terms
+
+        terms = sorted(set(_all_signal_terms()))
+        rng = random.Random(7)
+        for _ in range(50):
+            words = rng.sample(terms, 12) + ["x", "re", "-", " ", "da", "ta"]
+            rng.shuffle(words)
+            text = "".join(word + rng.choice(["", " ", "\n"]) for word in words)
+            assert SIGNAL_AUTOMATON.find(text) == {term for term in terms if term in text}
+
+
+class TestIndustryClassifierTier:
+    """Classifier answers are cached on disk and bounded by the latency budget."""
+
+    @pytest.fixture
+    def stand_in(self):
+        import json
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+
+        state = {"calls": 0, "delay": 0.0, "industry": "Biotech"}
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                self.rfile.read(int(self.headers.get("Content-Length", "0")))
+                state["calls"] += 1
+                threading.Event().wait(state["delay"])
+                body = json.dumps({"industry": state["industry"]}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                return
+
+        server = HTTPServer(("127.0.0.1", 0), _Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        state["url"] = f"http://127.0.0.1:{server.server_address[1]}/classify"
+        yield state
+        server.shutdown()
+
+    @pytest.fixture(autouse=True)
+    def _restore_classifier(self, monkeypatch) -> None:
+        from skill_autopilot import industry_classifier
+
+        for name in ("_classifier", "_configured", "_cache", "_budget_seconds"):
+            monkeypatch.setattr(industry_classifier, name, getattr(industry_classifier, name))
+
+    def test_cached_on_disk_across_configurations(self, stand_in, tmp_path) -> None:
+        from skill_autopilot.industry_classifier import HttpIndustryClassifier, configure_industry_classifier
+        from skill_autopilot.pods import detect_industry
+
+        cache_path = str(tmp_path / "industry_cache.json")
+        brief = "We are building a platform for hospital scheduling."
+        configure_industry_classifier(HttpIndustryClassifier(stand_in["url"]), cache_path=cache_path)
+        assert detect_industry(brief) == "Biotech"
+        assert detect_industry(brief) == "Biotech"
+        assert stand_in["calls"] == 1
+
+        configure_industry_classifier(HttpIndustryClassifier(stand_in["url"]), cache_path=cache_path)
+        assert detect_industry(brief) == "Biotech"
+        assert stand_in["calls"] == 1
+
+    def test_budget_overrun_falls_back_to_keywords(self, stand_in) -> None:
+        from skill_autopilot.industry_classifier import HttpIndustryClassifier, configure_industry_classifier
+        from skill_autopilot.pods import _detect_industry_keywords, detect_industry
+
+        stand_in["delay"] = 0.5
+        configure_industry_classifier(HttpIndustryClassifier(stand_in["url"]), budget_seconds=0.05)
+        brief = "Drug development program for a new pharmaceutical drug candidate."
+        assert detect_industry(brief) == _detect_industry_keywords(brief) == "Pharmaceuticals"
+
+    def test_late_answer_is_cached_but_not_served_inside_pin_window(self, stand_in, tmp_path, monkeypatch) -> None:
+        import time
+
+        from skill_autopilot import industry_classifier
+        from skill_autopilot.industry_classifier import HttpIndustryClassifier, configure_industry_classifier
+        from skill_autopilot.pods import detect_industry
+
+        cache_path = str(tmp_path / "industry_cache.json")
+        stand_in["delay"] = 0.2
+        configure_industry_classifier(
+            HttpIndustryClassifier(stand_in["url"]), cache_path=cache_path, budget_seconds=0.01
+        )
+        brief = "Drug development program for a new pharmaceutical drug candidate."
+        assert detect_industry(brief) == "Pharmaceuticals"
+        deadline = time.monotonic() + 5.0
+        while industry_classifier._inflight and time.monotonic() < deadline:  # noqa: SLF001
+            time.sleep(0.01)
+        assert not industry_classifier._inflight  # noqa: SLF001
+
+        # Inside the pin window the late "Biotech" answer does not flip the parse.
+        assert detect_industry(brief) == "Pharmaceuticals"
+        assert stand_in["calls"] == 1
+
+        # Once the pin lapses, or in a new process, the persisted late answer is used.
+        lapsed = {key: 0.0 for key in industry_classifier._timed_out}  # noqa: SLF001
+        monkeypatch.setattr(industry_classifier, "_timed_out", lapsed)
+        assert detect_industry(brief) == "Biotech"
+        configure_industry_classifier(
+            HttpIndustryClassifier(stand_in["url"]), cache_path=cache_path, budget_seconds=0.01
+        )
+        assert detect_industry(brief) == "Biotech"
+        assert stand_in["calls"] == 1
+
+
+class TestOfflineIndustryModel:
+    """The shipped weights must match the signal tables they were trained from."""
+
+    def test_shipped_model_matches_signal_tables(self) -> None:
+        import json
+
+        from skill_autopilot.industry_model import MODEL_PATH, train_industry_model
+
+        shipped = json.loads(MODEL_PATH.read_text(encoding="utf-8"))
+        assert shipped == train_industry_model(), "run scripts/build_industry_model.py"
+        assert shipped["industries"] == list(INDUSTRY_KERNEL_MAP)
+
+    def test_predicts_clear_briefs_and_abstains_otherwise(self) -> None:
+        from skill_autopilot.industry_model import load_industry_model
+
+        model = load_industry_model()
+        assert model.predict("Drug development program for a new pharmaceutical drug candidate.") == "Pharmaceuticals"
+        assert model.predict("We run a chain of restaurants and want a menu planner.") == (
+            "Food & Beverage Manufacturing"
+        )
+        assert model.predict("Improve candidate selection for our hiring loop.") == ""
+
+    def test_python_and_numpy_scoring_agree(self) -> None:
+        from skill_autopilot.industry_model import IndustryModel, train_industry_model
+
+        model = IndustryModel(train_industry_model())
+        if model.matrix is None:
+            pytest.skip("numpy not installed")
+        brief = "Clinical trial management for a biotech running a gene therapy clinical trial."
+        vectorized = model.scores(brief)
+        model.matrix = None
+        assert model.scores(brief) == pytest.approx(vectorized)
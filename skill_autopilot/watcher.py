@@ -1,8 +1,34 @@
+"""Brief file watching shared by every active project.
+
+One watchdog ``Observer`` serves all projects. Each brief's parent directory is
+scheduled once and reference-counted, and events are routed through a dispatch
+map from resolved brief path to the project callbacks registered for it.
+
+Editors that save through a temp file and rename, or autosave, emit several
+events per save, so a single scheduler thread debounces per brief on the
+trailing edge: only the final state of a burst is processed. Callbacks then run
+on a small bounded executor rather than on the observer thread, and a project
+whose callback is still queued or running is coalesced into one follow-up run.
+
+When watchdog is not installed, or the OS refuses another watch (inotify
+limits), briefs fall back to a stat poller: one thread stats every polled brief
+in batches spread over a jittered interval and feeds changes into the same
+debounced path. ``backend`` selects ``"auto"`` (watchdog, then polling),
+``"watchdog"`` or ``"poll"``.
+"""
+
 from __future__ import annotations
 
+import heapq
+import math
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Dict
+from threading import Condition, Lock, Thread
+from typing import Callable, Dict, List, Set, Tuple
+
+from .utils import stat_fingerprint
 
 try:
     from watchdog.events import FileSystemEvent, FileSystemEventHandler
@@ -13,60 +39,321 @@ except Exception:  # pragma: no cover
     Observer = None  # type: ignore
 
 
-class _BriefEventHandler(FileSystemEventHandler):
-    def __init__(self, brief_path: Path, callback: Callable[[], None], debounce_seconds: float = 1.5):
+class _DirectoryEventHandler(FileSystemEventHandler):
+    """Forwards every path an event touches; the registry decides what is watched."""
+
+    def __init__(self, dispatch: Callable[[str], None]):
         super().__init__()
-        self.brief_path = brief_path.resolve()
-        self.callback = callback
-        self.debounce_seconds = debounce_seconds
-        self._last_trigger = 0.0
+        self._dispatch = dispatch
 
     def on_modified(self, event: FileSystemEvent) -> None:  # type: ignore[override]
-        self._maybe_trigger(event)
+        self._dispatch(getattr(event, "src_path", ""))
 
     def on_created(self, event: FileSystemEvent) -> None:  # type: ignore[override]
-        self._maybe_trigger(event)
+        self._dispatch(getattr(event, "src_path", ""))
 
-    def _maybe_trigger(self, event: FileSystemEvent) -> None:
-        event_path = Path(getattr(event, "src_path", "")).resolve()
-        if event_path != self.brief_path:
-            return
-        now = time.monotonic()
-        if now - self._last_trigger < self.debounce_seconds:
-            return
-        self._last_trigger = now
-        self.callback()
+    def on_moved(self, event: FileSystemEvent) -> None:  # type: ignore[override]
+        self._dispatch(getattr(event, "dest_path", ""))
+
+
+class _DebounceScheduler:
+    """Single thread that fires ``on_due(key)`` once ``key`` has been quiet for ``delay`` seconds."""
+
+    def __init__(self, delay: float, on_due: Callable[[str], None]):
+        self._delay = delay
+        self._on_due = on_due
+        self._due: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._cond = Condition()
+        self._thread: Thread | None = None
+        self._stopped = False
+
+    def touch(self, key: str) -> None:
+        with self._cond:
+            if self._stopped:
+                return
+            due = time.monotonic() + self._delay
+            self._due[key] = due
+            heapq.heappush(self._heap, (due, key))
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="brief-watch-debounce", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def discard(self, key: str) -> None:
+        with self._cond:
+            self._due.pop(key, None)
+
+    def stop(self, timeout: float | None = 2.0) -> None:
+        with self._cond:
+            self._stopped = True
+            self._due.clear()
+            self._heap.clear()
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        with self._cond:
+            while not self._stopped:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                due, key = self._heap[0]
+                if self._due.get(key) != due:
+                    # Superseded by a later touch, or discarded.
+                    heapq.heappop(self._heap)
+                    continue
+                remaining = due - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                heapq.heappop(self._heap)
+                del self._due[key]
+                self._cond.release()
+                try:
+                    self._on_due(key)
+                finally:
+                    self._cond.acquire()
+
+
+class _StatPoller:
+    """Single thread that reports paths whose ``(mtime_ns, size, inode)`` changed.
+
+    Each cycle stats every watched path ``batch_size`` at a time, with the
+    pauses between batches spreading one cycle over roughly ``interval``
+    seconds (+/-10% jitter, so many processes do not poll in lockstep).
+    """
+
+    def __init__(self, interval: float, batch_size: int, on_change: Callable[[str], None]):
+        self._interval = max(0.01, interval)
+        self._batch_size = max(1, batch_size)
+        self._on_change = on_change
+        self._watched: Dict[str, List[object]] = {}
+        self._cond = Condition()
+        self._thread: Thread | None = None
+        self._stopped = False
+
+    def add(self, path: str) -> None:
+        with self._cond:
+            if self._stopped:
+                return
+            entry = self._watched.get(path)
+            if entry is not None:
+                entry[0] += 1  # type: ignore[operator]
+                return
+            self._watched[path] = [1, stat_fingerprint(path)]
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="brief-watch-poll", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def discard(self, path: str) -> None:
+        with self._cond:
+            entry = self._watched.get(path)
+            if entry is None:
+                return
+            entry[0] -= 1  # type: ignore[operator]
+            if entry[0] <= 0:
+                del self._watched[path]
+
+    def __len__(self) -> int:
+        return len(self._watched)
+
+    def stop(self, timeout: float | None = 2.0) -> None:
+        with self._cond:
+            self._stopped = True
+            self._watched.clear()
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        with self._cond:
+            while not self._stopped:
+                if not self._watched:
+                    self._cond.wait()
+                    continue
+                paths = list(self._watched)
+                batches = math.ceil(len(paths) / self._batch_size)
+                pause = self._interval / batches
+                for start in range(0, len(paths), self._batch_size):
+                    self._cond.wait(pause * random.uniform(0.9, 1.1))
+                    if self._stopped:
+                        return
+                    changed: List[str] = []
+                    for path in paths[start : start + self._batch_size]:
+                        entry = self._watched.get(path)
+                        if entry is None:
+                            continue
+                        current = stat_fingerprint(path)
+                        if current != entry[1]:
+                            entry[1] = current
+                            if current is not None:
+                                changed.append(path)
+                    if changed:
+                        self._cond.release()
+                        try:
+                            for path in changed:
+                                self._on_change(path)
+                        finally:
+                            self._cond.acquire()
 
 
 class BriefWatcherRegistry:
-    def __init__(self):
-        self._items: Dict[str, tuple[object, object]] = {}
+    def __init__(
+        self,
+        debounce_seconds: float = 1.5,
+        max_workers: int = 2,
+        backend: str = "auto",
+        poll_interval_seconds: float = 2.0,
+        poll_batch_size: int = 256,
+    ):
+        self._backend = backend if backend in {"auto", "watchdog", "poll"} else "auto"
+        self._lock = Lock()
+        self._items: Dict[str, Tuple[str, Callable[[], None], str]] = {}
+        self._targets: Dict[str, Dict[str, Callable[[], None]]] = {}
+        self._directories: Dict[str, Tuple[object, int]] = {}
+        self._observer = None
+        self._handler = _DirectoryEventHandler(self._on_event)
+        self._scheduler = _DebounceScheduler(debounce_seconds, self._on_due)
+        self._poller = _StatPoller(poll_interval_seconds, poll_batch_size, self._scheduler.touch)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="brief-watch")
+        self._running: Set[str] = set()
+        self._pending: Set[str] = set()
+        self._closed = False
 
     def supports_watch(self) -> bool:
-        return Observer is not None
-
-    def add(self, project_id: str, brief_path: str, callback: Callable[[], None]) -> None:
-        if not self.supports_watch() or project_id in self._items:
-            return
+        return self._backend != "watchdog" or Observer is not None
 
+    def add(self, project_id: str, brief_path: str, callback: Callable[[], None]) -> str | None:
+        """Watch ``brief_path`` for ``project_id``; returns the backend used, or None."""
         brief = Path(brief_path).resolve()
-        observer = Observer()
-        handler = _BriefEventHandler(brief_path=brief, callback=callback)
-        try:
-            observer.schedule(handler, str(brief.parent), recursive=False)
-            observer.start()
-        except RuntimeError:
-            return
-        self._items[project_id] = (observer, handler)
+        target, directory = str(brief), str(brief.parent)
+        with self._lock:
+            if self._closed:
+                return None
+            if project_id in self._items:
+                return self._items[project_id][2]
+            backend = None
+            if self._backend != "poll" and self._watch_directory(directory):
+                backend = "watchdog"
+            elif self._backend != "watchdog":
+                self._poller.add(target)
+                backend = "poll"
+            if backend is None:
+                return None
+            self._targets.setdefault(target, {})[project_id] = callback
+            self._items[project_id] = (target, callback, backend)
+            return backend
 
     def remove(self, project_id: str) -> None:
-        item = self._items.pop(project_id, None)
-        if not item:
-            return
-        observer, _ = item
-        observer.stop()
-        observer.join(timeout=2)
+        with self._lock:
+            item = self._items.pop(project_id, None)
+            if not item:
+                return
+            target, _, backend = item
+            self._pending.discard(project_id)
+            callbacks = self._targets.get(target, {})
+            callbacks.pop(project_id, None)
+            if not callbacks:
+                self._targets.pop(target, None)
+                self._scheduler.discard(target)
+            if backend == "poll":
+                self._poller.discard(target)
+                return
+            directory = str(Path(target).parent)
+            watch, refs = self._directories[directory]
+            if refs > 1:
+                self._directories[directory] = (watch, refs - 1)
+                return
+            del self._directories[directory]
+            try:
+                self._observer.unschedule(watch)
+            except (KeyError, OSError, RuntimeError):
+                pass
+            self._stop_observer_if_idle()
 
     def clear(self) -> None:
         for project_id in list(self._items):
             self.remove(project_id)
+
+    def close(self) -> None:
+        """Drop every watch and stop the observer, scheduler, poller and callback workers."""
+        with self._lock:
+            self._closed = True
+        self.clear()
+        with self._lock:
+            observer, self._observer = self._observer, None
+            self._directories.clear()
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=2)
+        self._scheduler.stop()
+        self._poller.stop()
+        # Queued callbacks are dropped; one already running is waited for.
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _watch_directory(self, directory: str) -> bool:
+        """Take a reference on the observer watch for ``directory``, scheduling it if new."""
+        if Observer is None:
+            return False
+        if directory not in self._directories:
+            try:
+                if self._observer is None:
+                    observer = Observer()
+                    observer.start()
+                    self._observer = observer
+                watch = self._observer.schedule(self._handler, directory, recursive=False)
+            except (OSError, RuntimeError):
+                # Typically inotify watch/instance limits; the caller falls back to polling.
+                self._stop_observer_if_idle()
+                return False
+            self._directories[directory] = (watch, 0)
+        watch, refs = self._directories[directory]
+        self._directories[directory] = (watch, refs + 1)
+        return True
+
+    def _stop_observer_if_idle(self) -> None:
+        if self._directories or self._observer is None:
+            return
+        observer, self._observer = self._observer, None
+        observer.stop()
+        observer.join(timeout=2)
+
+    def _on_event(self, raw_path: object) -> None:
+        if not raw_path:
+            return
+        target = str(Path(str(raw_path)).resolve())
+        if target in self._targets:
+            self._scheduler.touch(target)
+
+    def _on_due(self, target: str) -> None:
+        with self._lock:
+            callbacks = list(self._targets.get(target, {}).items())
+        for project_id, callback in callbacks:
+            self._submit(project_id, callback)
+
+    def _submit(self, project_id: str, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            if project_id in self._running:
+                self._pending.add(project_id)
+                return
+            self._running.add(project_id)
+        self._executor.submit(self._run_callback, project_id, callback)
+
+    def _run_callback(self, project_id: str, callback: Callable[[], None]) -> None:
+        try:
+            callback()
+        finally:
+            with self._lock:
+                rerun = project_id in self._pending and project_id in self._items
+                self._pending.discard(project_id)
+                if not rerun:
+                    self._running.discard(project_id)
+            if rerun:
+                self._executor.submit(self._run_callback, project_id, callback)